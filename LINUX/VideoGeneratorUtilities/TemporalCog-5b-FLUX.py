@@ -1,5 +1,6 @@
 import argparse
 import os
+import sys
 import random
 import time
 import gc
@@ -25,6 +26,27 @@ from tkinter import filedialog, messagebox, simpledialog
 
 from transformers import AutoTokenizer, pipeline
 
+# Shared engine modules (stage profiler) live one directory up, next to TemporalPromptEngine.py
+ENGINE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
+
+from prompt_summary import KeywordExtractor, LazySummarizer
+from stage_profiler import (
+    STAGE_DENOISE,
+    STAGE_EXPORT,
+    STAGE_LLM_CALL,
+    STAGE_PIPELINE_LOAD,
+    STAGE_SUMMARIZATION,
+    STAGE_TOKENIZATION,
+    consume_profile_flag,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+    profiled,
+)
+from video_encoder import EncoderSettings, clip_to_uint8, write_video
+
 # --------------------- Configuration ---------------------
 
 # Summarization settings
@@ -33,6 +55,7 @@ POSITIVE_MAX_TOKENS = 210  # Max tokens for positive prompts
 NEGATIVE_MAX_TOKENS = 60   # Max tokens for negative prompts
 POSITIVE_MIN_TOKENS = 80   # Min tokens for positive prompts
 NEGATIVE_MIN_TOKENS = 30   # Min tokens for negative prompts
+FILENAME_SUMMARY = "keywords"  # Output file names from "keywords" (fast, local) or "bart" (SUMMARIZATION_MODEL)
 
 # Video generation settings
 MODEL_PATH_5B = "THUDM/CogVideoX-5b"  # Pre-trained 5b model path
@@ -53,26 +76,27 @@ IMAGE_GENERATOR_MODEL_ID = "black-forest-labs/FLUX.1-dev"
 IMAGE_GENERATOR_CACHE_DIR = None
 IMAGE_GENERATOR_NUM_INFERENCE_STEPS = 50
 
+# Video encoding: frames are streamed into ffmpeg as raw RGB (export_to_video is used when ffmpeg is missing)
+VIDEO_ENCODER = EncoderSettings(codec="libx264", crf=18, preset="medium", pix_fmt="yuv420p")
+
 OUTPUT_DIR = "outputs"
 
 torch.set_float32_matmul_precision("high")
 logger = get_logger(__name__)
 
+# `--profile` records cProfile and tracemalloc data per stage and writes a report next to the videos
+if consume_profile_flag():
+    enable_profiling("TemporalCog-5b-FLUX")
+
 # --------------------- Initialization ---------------------
 
-# Initialize the summarization pipeline globally to avoid reloading for each prompt
-try:
-    summarizer = pipeline(
-        "summarization",
-        model=SUMMARIZATION_MODEL,
-        device=0 if torch.cuda.is_available() else -1
-    )
-except Exception as e:
-    print(f"Error loading summarization model '{SUMMARIZATION_MODEL}': {e}")
-    summarizer = None
+# The summarization model is only loaded the first time a prompt needs it; file names use keywords
+summarizer = LazySummarizer(SUMMARIZATION_MODEL, device=0 if torch.cuda.is_available() else -1)
+keyword_extractor = KeywordExtractor(max_words=5)
 
 # --------------------- Helper Functions ---------------------
 
+@profiled(STAGE_SUMMARIZATION)
 def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> str:
     """
     Summarizes the input text to fit within the specified token limit.
@@ -84,23 +108,13 @@ def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> st
     Returns:
     - str: The summarized text within the token limit.
     """
-    if not summarizer:
-        print("Summarizer not initialized. Returning original text.")
-        return text
-
-    try:
-        summary = summarizer(
-            text,
-            max_length=max_tokens,
-            min_length=min_tokens,
-            do_sample=False,
-            truncation=True,
-        )[0]['summary_text']
-        return summary
-    except Exception as e:
-        print(f"Error during summarization: {e}")
+    summary = summarizer.summarize(text, max_length=max_tokens, min_length=min_tokens)
+    if summary is None:
+        print("Summarizer not available. Returning original text.")
         return text
+    return summary
 
+@profiled(STAGE_TOKENIZATION)
 def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     """
     Truncates the input text to the specified token limit.
@@ -129,6 +143,7 @@ def truncate_to_token_limit(text: str, max_tokens: int) -> str:
 
     return truncated_text
 
+@profiled(STAGE_SUMMARIZATION)
 def create_five_word_summary(text: str) -> str:
     """
     Creates a 5-word summary of the given text.
@@ -139,25 +154,14 @@ def create_five_word_summary(text: str) -> str:
     Returns:
     - str: A 5-word summary.
     """
-    if not summarizer:
-        print("Summarizer not initialized. Returning first 5 words.")
-        return ' '.join(text.split()[:5])
-
-    try:
+    if FILENAME_SUMMARY == "bart":
         # Summarize the text with a low max_length to aim for a short summary
-        summary = summarizer(
-            text,
-            max_length=10,  # Adjust as needed
-            min_length=5,
-            do_sample=False,
-            truncation=True,
-        )[0]['summary_text']
-        # Extract first 5 words
-        five_word_summary = ' '.join(summary.split()[:5])
-        return five_word_summary
-    except Exception as e:
-        print(f"Error during 5-word summarization: {e}")
-        return ' '.join(text.split()[:5])
+        summary = summarizer.summarize(text, max_length=10, min_length=5)
+        if summary:
+            return ' '.join(summary.split()[:5])
+        print("Summarizer not available. Using keywords instead.")
+
+    return keyword_extractor.summary(text)
 
 def create_srt_file(video_path: str, subtitle_text: str, duration: float):
     """
@@ -317,6 +321,7 @@ def main():
     # Create output directory
     output_dir = pathlib.Path(OUTPUT_DIR)
     os.makedirs(output_dir.as_posix(), exist_ok=True)
+    get_profiler().output_directory = output_dir.as_posix()
 
     # Get parameters from the user
     guidance_scales, inference_steps, SEED = get_parameters()
@@ -340,19 +345,20 @@ def main():
     # Initialize caption generator
     print("Initializing caption generator...")
     try:
-        caption_tokenizer = AutoTokenizer.from_pretrained(
-            CAPTION_GENERATOR_MODEL_ID
-        )
-        caption_generator = pipeline(
-            "text-generation",
-            model=CAPTION_GENERATOR_MODEL_ID,
-            device_map="auto",
-            model_kwargs={
-                "cache_dir": CAPTION_GENERATOR_CACHE_DIR,
-                "torch_dtype": torch.float16,
-            },
-            tokenizer=caption_tokenizer
-        )
+        with profile_stage(STAGE_PIPELINE_LOAD):
+            caption_tokenizer = AutoTokenizer.from_pretrained(
+                CAPTION_GENERATOR_MODEL_ID
+            )
+            caption_generator = pipeline(
+                "text-generation",
+                model=CAPTION_GENERATOR_MODEL_ID,
+                device_map="auto",
+                model_kwargs={
+                    "cache_dir": CAPTION_GENERATOR_CACHE_DIR,
+                    "torch_dtype": torch.float16,
+                },
+                tokenizer=caption_tokenizer
+            )
     except Exception as e:
         print(f"Error initializing caption generator: {e}")
         messagebox.showerror("Initialization Error", f"Error initializing caption generator:\n{e}")
@@ -370,12 +376,13 @@ def main():
         user_prompt = f"Could you generate a prompt for a video generation model?\nPlease limit the prompt to [{num_words}] words."
 
         # Generate caption
-        output = caption_generator(
-            user_prompt,
-            max_new_tokens=226,
-            do_sample=True,
-            temperature=0.7,
-        )
+        with profile_stage(STAGE_LLM_CALL):
+            output = caption_generator(
+                user_prompt,
+                max_new_tokens=226,
+                do_sample=True,
+                temperature=0.7,
+            )
         caption = output[0]["generated_text"]
 
         # Optionally process the output to remove the prompt text if needed
@@ -396,16 +403,17 @@ def main():
     # Initialize image generator
     print("Initializing image generator...")
     try:
-        image_generator = DiffusionPipeline.from_pretrained(
-            IMAGE_GENERATOR_MODEL_ID,
-            cache_dir=IMAGE_GENERATOR_CACHE_DIR,
-            torch_dtype=torch.float16  # Updated DTYPE
-        )
-        image_generator.to("cuda")
-
-        # Optional: Enable compilation and VAE tiling if supported
-        if hasattr(image_generator.vae, 'enable_tiling'):
-            image_generator.vae.enable_tiling()
+        with profile_stage(STAGE_PIPELINE_LOAD):
+            image_generator = DiffusionPipeline.from_pretrained(
+                IMAGE_GENERATOR_MODEL_ID,
+                cache_dir=IMAGE_GENERATOR_CACHE_DIR,
+                torch_dtype=torch.float16  # Updated DTYPE
+            )
+            image_generator.to("cuda")
+
+            # Optional: Enable compilation and VAE tiling if supported
+            if hasattr(image_generator.vae, 'enable_tiling'):
+                image_generator.vae.enable_tiling()
     except Exception as e:
         print(f"Error initializing image generator: {e}")
         messagebox.showerror("Initialization Error", f"Error initializing image generator:\n{e}")
@@ -415,13 +423,14 @@ def main():
     images = []
     for index, caption in enumerate(captions):
         try:
-            image = image_generator(
-                prompt=caption,
-                height=480,
-                width=720,
-                num_inference_steps=IMAGE_GENERATOR_NUM_INFERENCE_STEPS,
-                guidance_scale=3.5,
-            ).images[0]
+            with profile_stage(STAGE_DENOISE):
+                image = image_generator(
+                    prompt=caption,
+                    height=480,
+                    width=720,
+                    num_inference_steps=IMAGE_GENERATOR_NUM_INFERENCE_STEPS,
+                    guidance_scale=3.5,
+                ).images[0]
             filename = sanitize_filename(caption[:25])
             image.save(output_dir / f"{index}_{filename}.png")
             images.append(image)
@@ -436,41 +445,43 @@ def main():
     # Initialize video generator
     print(f"\nLoading model pipeline '{MODEL_PATH_5B}'...")
     try:
-        video_generator = CogVideoXImageToVideoPipeline.from_pretrained(
-            MODEL_PATH_5B, torch_dtype=DTYPE).to("cuda")
-        video_generator.scheduler = CogVideoXDPMScheduler.from_config(
-            video_generator.scheduler.config,
-            timestep_spacing="trailing")
-
-        # Optional: Enable VAE tiling if supported
-        if hasattr(video_generator.vae, 'enable_tiling'):
-            video_generator.vae.enable_tiling()
-
-        # Device Handling
-        if torch.cuda.is_available():
-            video_generator.to("cuda")
-        else:
-            video_generator.to("cpu")
-
-        # Enable memory optimizations
-        video_generator.enable_sequential_cpu_offload()
-        video_generator.vae.enable_slicing()
-        if hasattr(video_generator.vae, 'enable_tiling'):
-            video_generator.vae.enable_tiling()
-        video_generator.enable_attention_slicing("max")  # Enable attention slicing for lower memory usage
-
-        # Optional: Enable xformers for memory-efficient attention (if available)
-        try:
-            video_generator.enable_xformers_memory_efficient_attention()
-        except Exception as e:
-            print(f"Could not enable xformers memory efficient attention: {e}")
+        with profile_stage(STAGE_PIPELINE_LOAD):
+            video_generator = CogVideoXImageToVideoPipeline.from_pretrained(
+                MODEL_PATH_5B, torch_dtype=DTYPE).to("cuda")
+            video_generator.scheduler = CogVideoXDPMScheduler.from_config(
+                video_generator.scheduler.config,
+                timestep_spacing="trailing")
+
+            # Optional: Enable VAE tiling if supported
+            if hasattr(video_generator.vae, 'enable_tiling'):
+                video_generator.vae.enable_tiling()
+
+            # Device Handling
+            if torch.cuda.is_available():
+                video_generator.to("cuda")
+            else:
+                video_generator.to("cpu")
+
+            # Enable memory optimizations
+            video_generator.enable_sequential_cpu_offload()
+            video_generator.vae.enable_slicing()
+            if hasattr(video_generator.vae, 'enable_tiling'):
+                video_generator.vae.enable_tiling()
+            video_generator.enable_attention_slicing("max")  # Enable attention slicing for lower memory usage
+
+            # Optional: Enable xformers for memory-efficient attention (if available)
+            try:
+                video_generator.enable_xformers_memory_efficient_attention()
+            except Exception as e:
+                print(f"Could not enable xformers memory efficient attention: {e}")
 
     except Exception as e:
         print(f"Error loading the pipeline: {e}")
         messagebox.showerror("Pipeline Load Error", f"Error loading the pipeline:\n{e}")
         return
 
-    # Generate videos
+    # Generate videos, naming files after the words that set each caption apart from the others
+    keyword_extractor.fit(captions)
     for index, (caption, image) in enumerate(zip(captions, images)):
         summarized_caption = summarize_text(caption, max_tokens=POSITIVE_MAX_TOKENS, min_tokens=POSITIVE_MIN_TOKENS)
         negative_prompt = ""  # You can define a negative prompt if needed
@@ -501,28 +512,34 @@ def main():
                 try:
                     generator = torch.Generator().manual_seed(SEED)
 
-                    video = video_generator(
-                        image=image,
-                        prompt=summarized_caption,
-                        height=480,
-                        width=720,
-                        num_frames=49,
-                        num_inference_steps=steps,
-                        guidance_scale=gs,
-                        use_dynamic_cfg=True,
-                        generator=generator,
-                    ).frames[0]
+                    with profile_stage(STAGE_DENOISE):
+                        video = video_generator(
+                            image=image,
+                            prompt=summarized_caption,
+                            height=480,
+                            width=720,
+                            num_frames=49,
+                            num_inference_steps=steps,
+                            guidance_scale=gs,
+                            use_dynamic_cfg=True,
+                            output_type="np",  # NumPy frames for the streaming encoder, skipping the PIL conversion
+                            generator=generator,
+                        ).frames[0]
+
+                    # The pipeline returns float32 frames; keep only their uint8 copy, a quarter of the size
+                    video = clip_to_uint8(video)
 
                     # Export to video
-                    export_to_video(video, output_path, fps=8)
+                    with profile_stage(STAGE_EXPORT):
+                        write_video(video, output_path, fps=8, settings=VIDEO_ENCODER, fallback=export_to_video)
 
-                    # Calculate video duration
-                    num_frames = 49
-                    fps = 8
-                    duration_seconds = num_frames / fps
+                        # Calculate video duration
+                        num_frames = 49
+                        fps = 8
+                        duration_seconds = num_frames / fps
 
-                    # Create corresponding .srt file
-                    create_srt_file(output_path, summarized_caption, duration_seconds)
+                        # Create corresponding .srt file
+                        create_srt_file(output_path, summarized_caption, duration_seconds)
                 except Exception as e:
                     print(f"Error generating video for caption '{caption}': {e}")
                     messagebox.showerror("Video Generation Error", f"Error generating video for caption:\n{e}")
@@ -538,4 +555,7 @@ def main():
     messagebox.showinfo("Generation Complete", "All videos have been generated successfully.")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        get_profiler().write_report()
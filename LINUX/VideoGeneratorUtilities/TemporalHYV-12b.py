@@ -15,6 +15,25 @@ from tkinter import filedialog, messagebox, ttk
 
 from PIL import ExifTags, Image
 import subprocess
+import sys
+
+# Shared engine modules (options catalog, stage profiler) live one directory up, next to TemporalPromptEngine.py
+ENGINE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
+
+from options_catalog import get_catalog
+from stage_profiler import (
+    STAGE_AUDIO,
+    STAGE_DENOISE,
+    STAGE_EXPORT,
+    STAGE_PARSING,
+    consume_profile_flag,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+    profiled,
+)
 
 # --------------------- Configuration ---------------------
 TOKENIZER_NAME = "gpt2"
@@ -26,6 +45,11 @@ logging.basicConfig(
     format="%(levelname)s | %(message)s"
 )
 
+# `--profile` records cProfile and tracemalloc data per stage and writes a report next to the videos.
+# sample_video.py and MMAudio run as subprocesses, so their stages are timed but not profiled inside.
+if consume_profile_flag():
+    enable_profiling("TemporalHYV-12b")
+
 # Default values for all parameters
 DEFAULTS = {
     "model": "HYVideo-T/2-cfgdistill",
@@ -101,270 +125,12 @@ VIDEO_RESOLUTIONS = [
     "84x48 (Early Nokia)"
 ]
 
-# Minimal sets of RESOLUTIONS, GUIDING_PHRASES, CAMERA_TERMS
-RESOLUTIONS = {
-    "1960s": [
-        "Standard Definition (SD) - Mature film era, color or B&W",
-        "Television 480i - Common household TV format",
-        "CinemaScope and Panavision - Widescreen with moderate sharpness",
-        "Early 720p Equivalent (Film) - Some experimental sharper formats"
-    ],
-    "1980s": [
-        "Standard Definition (SD) - VHS era softness",
-        "VHS Resolution - Visible scan lines and tracking noise",
-        "LaserDisc 480p - Slightly sharper than VHS",
-        "IMAX Film - Specialty theaters",
-        "Betacam SP - Professional broadcast video"
-    ],
-    "2020s": [
-        "4K UHD - Mainstream high clarity",
-        "8K UHD - Cutting-edge sharpness",
-        "12K Cinema - Experimental ultra-resolution",
-        "1440p QHD - Popular in gaming monitors",
-        "5.3K - Specialized action camera use"
-    ],
-    "Future": [
-        "8K UHD - Possibly mainstream soon",
-        "12K+ Cinema - Ultra-futuristic clarity",
-        "16K - Hypothetical extreme resolution",
-        "32K - Theoretical next-gen"
-    ],
-    "Experimental and Proto (Pre-1900s)": [
-        "Very Low Definition - Experimental resolution...",
-        "Glass Plate Quality - Gelatin dry plate..."
-    ],
-    "1900s": [
-        "Glass Plate Standard...",
-        "Low Definition Film...",
-        "Low-Res Panoramic..."
-    ],
-    "1910s": [
-        "Standard Definition (SD)...",
-        "Silent Film Standard...",
-        "Plate Film Quality..."
-    ],
-    "1920s": [
-        "Standard Definition (SD)...",
-        "Silent Film Standard...",
-        "Panoramic Film Quality..."
-    ],
-    "1930s": [
-        "Standard Definition (SD)...",
-        "Film Resolution...",
-        "Enhanced Silent Film Quality..."
-    ],
-    "1940s": [
-        "Standard Definition (SD)...",
-        "Film Quality...",
-        "Early Widescreen..."
-    ],
-    "1950s": [
-        "Standard Definition (SD)...",
-        "CinemaScope Widescreen...",
-        "Technicolor Quality...",
-        "TV Standard Definition (480i)"
-    ],
-    "1970s": [
-        "Standard Definition (SD)...",
-        "Television 480i...",
-        "Panavision Quality Film...",
-        "IMAX Film (Limited)"
-    ],
-    "1990s": [
-        "480p DVD Quality...",
-        "720p HD (Early)...",
-        "1080i HD (Broadcast)...",
-        "IMAX Film...",
-        "MiniDV 480p..."
-    ],
-    "2000s": [
-        "720p HD...",
-        "1080p Full HD...",
-        "2K Digital Cinema...",
-        "4K (Cinema)...",
-        "IMAX Digital..."
-    ],
-    "2010s": [
-        "1080p Full HD...",
-        "2K Digital...",
-        "4K UHD...",
-        "5K...",
-        "8K UHD (Experimental)"
-    ]
-}
-
-DECADES = sorted(RESOLUTIONS.keys())
-
-GUIDING_PHRASES = {
-    "1960s": {
-        "start": "(Enter an era of steady, familiar definition...)",
-        "end": "(...dissolves, leaving a warm retro subtlety.)"
-    },
-    "1980s": {
-        "start": "(Step into the soft haze of analog signals...)",
-        "end": "(...tape runs out, leaving faint static memories.)"
-    },
-    "2020s": {
-        "start": "(Enter a realm of ultra-high clarity...)",
-        "end": "(...concludes, crystal-clear in immense fidelity.)"
-    },
-    "Future": {
-        "start": "(Glimpse a speculative horizon...)",
-        "end": "(...leaving only the concept of boundless clarity.)"
-    },
-    "Experimental and Proto (Pre-1900s)": {
-        "start": "(You enter a world of faint silhouettes...)",
-        "end": "(...the scene dissolves into a memory...)"
-    },
-    "1900s": {
-        "start": "(Step into a realm of flickering frames...)",
-        "end": "(...grainy and spectral, an afterimage of a distant past.)"
-    },
-    "1910s": {
-        "start": "(Behold the fragile clarity of early black-and-white...)",
-        "end": "(...fading with subtle dust and scratches.)"
-    },
-    "1920s": {
-        "start": "(Step into the silent frames of a monochrome hush...)",
-        "end": "(...flicker lingering like a gentle whisper.)"
-    },
-    "1930s": {
-        "start": "(Enter a cinematic world of early sound...)",
-        "end": "(...the curtain falls softly into memory.)"
-    },
-    "1940s": {
-        "start": "(Immerse yourself in a classic tableau...)",
-        "end": "(...the vision recedes with a gentle hum.)"
-    },
-    "1950s": {
-        "start": "(Step into a time of early, vibrant color...)",
-        "end": "(...fading like old postcards in an attic.)"
-    },
-    "1970s": {
-        "start": "(Immerse in richly hued frames, grain and color...)",
-        "end": "(...dims slowly, resting quietly in storage.)"
-    },
-    "1990s": {
-        "start": "(Enter an era of cleaner home video...)",
-        "end": "(...ends with a gentle fade, like a DVD menu.)"
-    },
-    "2000s": {
-        "start": "(Immerse in the crisp rise of HD...)",
-        "end": "(...fades, leaving an impression of newfound clarity.)"
-    },
-    "2010s": {
-        "start": "(Step into a sharper world of digital cinema...)",
-        "end": "(...recedes with polished definition, carefully archived.)"
-    }
-}
-
-CAMERA_TERMS = {
-    "1960s": [
-        "steady, reliable film definition with mild grain",
-        "broadcast television softness in 480i signals",
-        "colors more stable but not ultra-crisp",
-        "occasional lens vignetting at corners",
-        "moderately sharp, still subdued details"
-    ],
-    "1980s": [
-        "VHS-era softness with visible scan lines",
-        "muted colors and occasional tracking noise",
-        "tape-based playback artifacts and flicker",
-        "low-resolution outlines and gentle blur",
-        "a familiar, home-video warmth"
-    ],
-    "2020s": [
-        "4K and beyond hyper-detail rendering",
-        "extremely refined textures and depth",
-        "perfectly balanced colors and lighting",
-        "no noticeable grain, crystal clarity",
-        "immersive, almost tactile visual presence"
-    ],
-    "Future": [
-        "beyond 8K resolution, hyper-real fidelity",
-        "virtually no visible artifacts",
-        "limitless detail at extreme magnification",
-        "colors and contrasts beyond current tech",
-        "a vision exceeding present imagination"
-    ],
-    "Experimental and Proto (Pre-1900s)": [
-        "extremely long exposures and blurred subjects",
-        "soft-focus forms barely etched onto glass",
-        "grainy textures and nearly monochrome tints",
-        "hand-prepared emulsions with uneven chemistry",
-        "ghostly silhouettes and very low contrast"
-    ],
-    "1900s": [
-        "hand-cranked frames with visible flicker",
-        "high contrast black and white film stock",
-        "uneven focus and vignetting at the edges",
-        "soft edges and subtle lens distortion",
-        "no synchronized sound, purely silent motion"
-    ],
-    "1910s": [
-        "slightly steadier hand-cranked sequences",
-        "dust speckles and faint scratches on film",
-        "limited tonal range in grayscale imagery",
-        "soft edges and subtle lens distortion",
-        "no synchronized sound, purely silent motion"
-    ],
-    "1920s": [
-        "improved silent frames with mild flicker",
-        "hand-tinted scenes adding gentle color hints",
-        "soft grain and simple lighting contrasts",
-        "simple title cards bridging narrative gaps",
-        "no deep focus, foreground and background blur"
-    ],
-    "1930s": [
-        "slightly steadier film with early sound integration",
-        "enhanced lighting contrasts and shadow details",
-        "subtle lens flares from early lighting tech",
-        "balanced exposure with better dynamic range",
-        "clearer focus with minimal motion blur"
-    ],
-    "1940s": [
-        "refined black and white or early muted color",
-        "better exposure balancing highlights and shadows",
-        "mild grain and smoother camera panning",
-        "slight lens halation around bright points",
-        "a stable, classic cinema aesthetic"
-    ],
-    "1950s": [
-        "early vibrant color stock with moderate saturation",
-        "CinemaScope-like wide frames yet soft detail",
-        "gentle film grain and slight lens flares",
-        "limited dynamic range in bright sunlight",
-        "tones that evoke a pastel postcard feel"
-    ],
-    "1970s": [
-        "rich color with noticeable natural grain",
-        "warmer hues and slightly soft edges",
-        "steady tripod shots with occasional zoom",
-        "subtle lens flare under strong lights",
-        "overall earthy, nostalgic palette"
-    ],
-    "1990s": [
-        "cleaner 480p DVD-like definition",
-        "slightly sharper colors than VHS",
-        "still some softness but improved stability",
-        "rudimentary digital attempts, less grain",
-        "sound more consistent but not fully HD"
-    ],
-    "2000s": [
-        "1080p HD clarity with crisp edges",
-        "vibrant colors and balanced contrasts",
-        "minimal grain, more lifelike tones",
-        "smoother motion and stable frame rates",
-        "a clear leap beyond earlier decades"
-    ],
-    "2010s": [
-        "ultra-clear digital cinema visuals",
-        "high dynamic range and vivid hues",
-        "sharp focus revealing subtle textures",
-        "steady, stabilized camera motions",
-        "polished, film-like grading with digital ease"
-    ]
-}
+# RESOLUTIONS, GUIDING_PHRASES and CAMERA_TERMS come from the shared options catalog next to TemporalPromptEngine.py
+OPTIONS_CATALOG = get_catalog()
+RESOLUTIONS = OPTIONS_CATALOG.table("HYV_RESOLUTIONS")
+DECADES = OPTIONS_CATALOG.decades("HYV_RESOLUTIONS")
+GUIDING_PHRASES = OPTIONS_CATALOG.table("HYV_GUIDING_PHRASES")
+CAMERA_TERMS = OPTIONS_CATALOG.table("HYV_CAMERA_TERMS")
 
 def sanitize_filename(filename: str) -> str:
     keepcharacters = (" ", ".", "_", "-")
@@ -372,6 +138,7 @@ def sanitize_filename(filename: str) -> str:
     sanitized = sanitized.replace(" ", "_")
     return sanitized
 
+@profiled(STAGE_PARSING)
 def parse_prompt_file(lines: list) -> list:
     prompts = []
     current_prompt = {}
@@ -423,6 +190,7 @@ def select_prompt_file() -> Optional[str]:
         return None
     return file_path
 
+@profiled(STAGE_EXPORT)
 def create_srt_file(video_path: str, subtitle_text: str, duration: float):
     try:
         base, _ = os.path.splitext(video_path)
@@ -892,7 +660,8 @@ def generate_video(args: dict, prompt: str, negative_prompt: str) -> str:
         cmd.append("--reproduce")
 
     logging.info(f"Executing command: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True, text=True)
+    with profile_stage(STAGE_DENOISE):
+        subprocess.run(cmd, check=True, text=True)
 
     # After generation, identify the newly created video
     generated_files_after = set(os.listdir(args["save_path"]))
@@ -1314,7 +1083,8 @@ def generate_video(args: dict, prompt: str, negative_prompt: str) -> str:
         cmd.append("--reproduce")
 
     logging.info(f"Executing command: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True, text=True)
+    with profile_stage(STAGE_DENOISE):
+        subprocess.run(cmd, check=True, text=True)
 
     # After generation, identify the newly created video
     generated_files_after = set(os.listdir(args["save_path"]))
@@ -1348,6 +1118,7 @@ def main():
     prompt_dir = os.path.dirname(prompt_file)
     # Set save_path to the prompt directory automatically
     DEFAULTS["save_path"] = prompt_dir
+    get_profiler().output_directory = prompt_dir
 
     args = get_selected_args()
     args["save_path"] = prompt_dir
@@ -1491,7 +1262,8 @@ def main():
                         "--num_steps", str(current_args["mmaudio_steps"])
                     ]
                     logging.info(f"Executing MMAudio command: {' '.join(cmd)}")
-                    subprocess.run(cmd, check=True, text=True)
+                    with profile_stage(STAGE_AUDIO):
+                        subprocess.run(cmd, check=True, text=True)
                 except subprocess.CalledProcessError as e:
                     logging.error(f"MMAudio command failed: {e}")
                     messagebox.showerror("MMAudio Error", f"Error during MMAudio processing:\n{e}")
@@ -1577,4 +1349,7 @@ def main():
     root.destroy()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        get_profiler().write_report()
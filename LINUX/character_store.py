@@ -0,0 +1,225 @@
+"""
+Character profile store used by the Temporal Prompt Engine while it generates a story.
+
+Profiles live in an in-memory registry for the duration of a run. Every change is recorded
+as one line in an append-only journal (Characters/characters.jsonl) instead of rewriting a
+whole <name>.json file per scene, and journal lines are written in batches. Profiles written
+by older versions of the engine (one <name>.json per character) are still picked up on load.
+
+Once the journal holds more than compact_after records, and more than twice the records needed to
+rebuild the registry, it is rewritten from the registry (one create record per character plus its
+kept history), atomically through a temporary file, so a long story does not grow it without bound.
+
+All public methods are guarded by a single lock so several generation workers can share one store.
+"""
+
+import json
+import os
+import re
+import threading
+
+JOURNAL_FILENAME = "characters.jsonl"
+DEFAULT_FLUSH_EVERY = 16
+DEFAULT_COMPACT_AFTER = 4096  # Journal records before the journal may be rewritten from the registry
+
+
+def character_key(name):
+    """
+    Returns the registry key for a character name (the same sanitization the engine uses for filenames).
+    """
+    return re.sub(r'[^a-zA-Z0-9_-]', '_', name)
+
+
+class CharacterStore:
+    """
+    Thread-safe in-memory registry of character profiles with batched, append-only persistence.
+
+    Args:
+        characters_dir (str): Directory holding the journal and any legacy <name>.json profiles.
+        flush_every (int): Number of pending journal records that triggers a write.
+        max_history (int): Keep only the most recent N history entries per character (None keeps all).
+        compact_after (int): Journal records that allow a compaction (None never compacts).
+    """
+
+    def __init__(self, characters_dir, flush_every=DEFAULT_FLUSH_EVERY, max_history=None,
+                 compact_after=DEFAULT_COMPACT_AFTER):
+        self.characters_dir = characters_dir
+        self.journal_path = os.path.join(characters_dir, JOURNAL_FILENAME)
+        self.flush_every = max(1, int(flush_every))
+        self.max_history = max_history if max_history and max_history > 0 else None
+        self.compact_after = compact_after if compact_after and compact_after > 0 else None
+        self._profiles = {}
+        self._pending = []
+        self._journal_records = 0  # Records currently in the journal file
+        self._unterminated = False  # The journal ends without a newline (a torn line from a crash)
+        self._lock = threading.RLock()
+        os.makedirs(characters_dir, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """
+        Fills the registry from legacy per-character JSON files, then replays the journal on top.
+        """
+        for filename in sorted(os.listdir(self.characters_dir)):
+            if not filename.endswith(".json"):
+                continue
+            filepath = os.path.join(self.characters_dir, filename)
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    profile = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping unreadable character profile '{filepath}': {e}")
+                continue
+            if not isinstance(profile, dict) or 'name' not in profile:
+                continue
+            profile.setdefault('description', '')
+            profile.setdefault('history', [])
+            self._truncate(profile)
+            self._profiles[character_key(profile['name'])] = profile
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            return
+        self._unterminated = bool(text) and not text.endswith("\n")
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            self._journal_records += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line torn by a crash; the next flush starts on a fresh line, so only this record is lost
+                print(f"Skipping malformed line {line_number} in '{self.journal_path}'.")
+                continue
+            self._apply(record)
+
+    def _apply(self, record):
+        key = character_key(record.get('name', ''))
+        if record.get('op') == 'create':
+            self._profiles[key] = {
+                'name': record['name'],
+                'description': record.get('description', ''),
+                'history': []
+            }
+        elif record.get('op') == 'history' and key in self._profiles:
+            profile = self._profiles[key]
+            profile['history'].append(record.get('entry', ''))
+            self._truncate(profile)
+
+    def _truncate(self, profile):
+        if self.max_history is not None and len(profile['history']) > self.max_history:
+            del profile['history'][:-self.max_history]
+
+    def _record(self, record):
+        self._pending.append(record)
+        if len(self._pending) >= self.flush_every:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        if self._should_compact(len(self._pending)):
+            self._compact_locked()
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self._pending)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            if self._unterminated:
+                # Start on a fresh line so the first record is not glued onto the torn one
+                f.write("\n")
+                self._unterminated = False
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(self._pending)
+        self._pending = []
+
+    def _snapshot_records(self):
+        """
+        Returns the journal records that rebuild the current registry.
+        """
+        records = []
+        for profile in self._profiles.values():
+            records.append({'op': 'create', 'name': profile['name'], 'description': profile['description']})
+            records.extend({'op': 'history', 'name': profile['name'], 'entry': entry} for entry in profile['history'])
+        return records
+
+    def _should_compact(self, incoming):
+        if self.compact_after is None:
+            return False
+        total = self._journal_records + incoming
+        live = sum(1 + len(profile['history']) for profile in self._profiles.values())
+        return total > self.compact_after and total > 2 * live
+
+    def _compact_locked(self):
+        """
+        Rewrites the journal from the registry, replacing it atomically. Pending records are
+        already part of the registry, so they are dropped.
+        """
+        records = self._snapshot_records()
+        temp_path = f"{self.journal_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.journal_path)
+        self._journal_records = len(records)
+        self._unterminated = False
+        self._pending = []
+
+    def get(self, character_name):
+        """
+        Returns the profile for a character, or None if it has not been seen yet.
+        """
+        with self._lock:
+            return self._profiles.get(character_key(character_name))
+
+    def create(self, character_name, description=''):
+        """
+        Registers a new character and returns its profile. An existing profile is returned unchanged.
+        """
+        with self._lock:
+            key = character_key(character_name)
+            if key in self._profiles:
+                return self._profiles[key]
+            profile = {
+                'name': character_name,
+                'description': description,
+                'history': []
+            }
+            self._profiles[key] = profile
+            self._record({'op': 'create', 'name': character_name, 'description': description})
+            return profile
+
+    def append_history(self, character_name, entry):
+        """
+        Appends an entry to a character's history, creating the character if needed.
+        """
+        with self._lock:
+            profile = self.create(character_name)
+            profile['history'].append(entry)
+            self._truncate(profile)
+            self._record({'op': 'history', 'name': profile['name'], 'entry': entry})
+            return profile
+
+    def names(self):
+        """
+        Returns the names of all known characters.
+        """
+        with self._lock:
+            return [profile['name'] for profile in self._profiles.values()]
+
+    def flush(self):
+        """
+        Writes all pending journal records to disk.
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """
+        Flushes pending records. The registry stays readable afterwards.
+        """
+        self.flush()
@@ -0,0 +1,232 @@
+"""
+Denoising checkpoints for the CogVideoX generator scripts.
+
+A 5B render at 80-100 steps takes long enough that a crash or a preempted machine costs real time,
+and until now every rerun started again at step 0. DenoiseCheckpoints saves the state of a render
+every `every` steps from the pipeline's callback_on_step_end hook: the latents, the scheduler's
+multistep state (the previous prediction and timestep DPM-Solver builds on), its counters and the
+state of the torch.Generator. Checkpoints live in <output dir>/.denoise_checkpoints/<key>.pt, keyed
+by the same video key as the generation manifest.
+
+A rerun with the same key starts the pipeline from the saved latents and hands it only the timesteps
+that were still to come, restoring the scheduler and generator state at the first step, so the
+resumed render continues exactly where the saved one stopped. Checkpoints are deleted once their
+video has been saved.
+"""
+
+import functools
+import inspect
+import os
+
+import torch
+
+CHECKPOINT_DIR_NAME = ".denoise_checkpoints"
+DEFAULT_EVERY = 10  # Steps between checkpoints
+CHECKPOINT_VERSION = 1
+
+
+def _scheduler_counters(scheduler):
+    """
+    Returns the plain-number attributes of a scheduler (e.g. DPM-Solver's lower_order_nums).
+    """
+    return {name: value for name, value in vars(scheduler).items()
+            if isinstance(value, (bool, int, float)) and not name.startswith("__")}
+
+
+class DenoiseCheckpoints:
+    """
+    Directory of denoising checkpoints, one file per video key.
+
+    Args:
+        directory (str): The output directory; checkpoints go to its `name` subdirectory.
+        every (int): Steps between checkpoints.
+        name (str): Name of the checkpoint subdirectory.
+    """
+
+    def __init__(self, directory, every=DEFAULT_EVERY, name=CHECKPOINT_DIR_NAME):
+        self.directory = os.path.join(directory or ".", name)
+        self.every = max(1, int(every))
+        self.saved = 0
+        self.resumed = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pt")
+
+    def load(self, key):
+        """
+        Returns the checkpoint saved for key, or None if there is none (or it cannot be read).
+        """
+        path = self.path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            state = torch.load(path, map_location="cpu", weights_only=True)
+        except Exception as e:
+            print(f"Ignoring unreadable denoising checkpoint {path}: {e}")
+            return None
+        if state.get("version") != CHECKPOINT_VERSION or state.get("key") != key:
+            return None
+        return state
+
+    def save(self, key, state):
+        """
+        Writes a checkpoint for key, replacing the previous one atomically.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            torch.save(dict(state, version=CHECKPOINT_VERSION, key=key), temp_path)
+            os.replace(temp_path, path)
+            self.saved += 1
+        except Exception as e:
+            print(f"Could not write denoising checkpoint {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def discard(self, key):
+        """
+        Deletes the checkpoint of key, if any.
+        """
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def _discard_after(self, key, on_saved):
+        if on_saved is not None:
+            on_saved()
+        self.discard(key)
+
+    def discard_after(self, key, on_saved=None):
+        """
+        Returns a callback that runs on_saved and then deletes the checkpoint of key. Pass it as the
+        on_saved callback of the video's export.
+        """
+        return functools.partial(self._discard_after, key, on_saved)
+
+    def session(self, pipe, keys, generators, num_inference_steps):
+        """
+        Returns a CheckpointSession for one pipeline call producing the videos of keys.
+        """
+        return CheckpointSession(self, pipe, keys, generators, num_inference_steps)
+
+
+class CheckpointSession:
+    """
+    Checkpointing for one pipeline call. Use it as a context manager around the call and pass
+    pipe_kwargs() to the pipeline.
+
+    The call resumes only if every video in it has a checkpoint at the same step; otherwise it starts
+    at step 0 and its checkpoints are overwritten.
+
+    Args:
+        store (DenoiseCheckpoints): Where checkpoints are read and written.
+        pipe: The pipeline; its scheduler is hooked while the session is active.
+        keys (list): Video keys, in the order of the batch.
+        generators (list): The torch.Generator of each video, in the same order.
+        num_inference_steps (int): Steps of the full schedule.
+    """
+
+    def __init__(self, store, pipe, keys, generators, num_inference_steps):
+        self.store = store
+        self.pipe = pipe
+        self.keys = list(keys)
+        self.generators = list(generators)
+        self.num_inference_steps = num_inference_steps
+        self.start_step = 0
+        self.latents = None
+        self._resume = None
+        self._previous_sample = None
+        self._previous_timestep = None
+        self._first_step = True
+        self._scheduler = None
+
+        states = [store.load(key) for key in self.keys]
+        if (states and all(state is not None and state["num_inference_steps"] == num_inference_steps for state in states)
+                and len({state["step"] for state in states}) == 1):
+            self._resume = states
+            self.start_step = states[0]["step"]
+            self.latents = torch.cat([state["latents"] for state in states])
+            if all(state["previous_sample"] is not None for state in states):
+                self._previous_sample = torch.cat([state["previous_sample"] for state in states])
+            self._previous_timestep = states[0]["previous_timestep"]
+            store.resumed += len(states)
+            print(f"Resuming {len(states)} video(s) from denoising step {self.start_step}/{num_inference_steps}.")
+
+    def pipe_kwargs(self):
+        """
+        Returns the pipeline arguments that save checkpoints and, when resuming, start from the saved latents.
+        """
+        kwargs = {"callback_on_step_end": self.on_step_end, "callback_on_step_end_tensor_inputs": ["latents"]}
+        if self.latents is not None:
+            kwargs["latents"] = self.latents
+        return kwargs
+
+    def __enter__(self):
+        scheduler = self.pipe.scheduler
+        set_timesteps, step = scheduler.set_timesteps, scheduler.step
+        step_signature = inspect.signature(step)
+        multistep = "old_pred_original_sample" in step_signature.parameters
+        self._first_step = True
+
+        # functools.wraps keeps the signatures visible, so the pipeline still passes eta and generator to step()
+        @functools.wraps(set_timesteps)
+        def resumable_set_timesteps(*args, **kwargs):
+            result = set_timesteps(*args, **kwargs)
+            if self._resume is not None:
+                scheduler.timesteps = scheduler.timesteps[self.start_step * scheduler.order:]
+                for name, value in self._resume[0]["scheduler_counters"].items():
+                    setattr(scheduler, name, value)
+            return result
+
+        @functools.wraps(step)
+        def tracked_step(*args, **kwargs):
+            bound = step_signature.bind(*args, **kwargs)
+            if self._first_step and self._resume is not None:
+                # Any generator draws before the loop (e.g. encoding the i2v image) are replaced by the saved states
+                for generator, state in zip(self.generators, self._resume):
+                    if generator is not None and state["generator_state"] is not None:
+                        generator.set_state(state["generator_state"])
+                if multistep and bound.arguments.get("old_pred_original_sample") is None and self._previous_sample is not None:
+                    sample = bound.arguments["sample"]
+                    bound.arguments["old_pred_original_sample"] = self._previous_sample.to(sample.device, sample.dtype)
+                    bound.arguments["timestep_back"] = self._previous_timestep
+            self._first_step = False
+            result = step(*bound.args, **bound.kwargs)
+            self._previous_timestep = int(bound.arguments["timestep"])
+            if multistep and isinstance(result, tuple) and len(result) > 1:
+                self._previous_sample = result[1]
+            return result
+
+        self._scheduler = scheduler
+        scheduler.set_timesteps = resumable_set_timesteps
+        scheduler.step = tracked_step
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Drops the instance attributes, uncovering the scheduler's own methods again
+        scheduler, self._scheduler = self._scheduler, None
+        del scheduler.set_timesteps
+        del scheduler.step
+
+    def on_step_end(self, pipe, i, t, callback_kwargs):
+        """
+        callback_on_step_end hook: saves a checkpoint every `every` steps, except after the last one.
+        """
+        step = self.start_step + i + 1
+        if step % self.store.every == 0 and step < self.num_inference_steps:
+            latents = callback_kwargs["latents"].detach().to("cpu")
+            previous = self._previous_sample.detach().to("cpu") if self._previous_sample is not None else None
+            counters = _scheduler_counters(pipe.scheduler)
+            for index, (key, generator) in enumerate(zip(self.keys, self.generators)):
+                self.store.save(key, {
+                    "num_inference_steps": self.num_inference_steps,
+                    "step": step,
+                    "latents": latents[index:index + 1].clone(),
+                    "previous_sample": previous[index:index + 1].clone() if previous is not None else None,
+                    "previous_timestep": self._previous_timestep,
+                    "scheduler_counters": counters,
+                    "generator_state": generator.get_state() if generator is not None else None,
+                })
+        return callback_kwargs
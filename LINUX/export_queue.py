@@ -0,0 +1,120 @@
+"""
+Background export queue for the video generator scripts.
+
+Encoding a finished clip to mp4 and writing its .srt runs on the CPU, and the GPU used to sit idle
+until it was done. ExportQueue runs those exports on a worker thread while the main loop starts
+denoising the next video. A thread rather than a process keeps the frames in shared memory (no
+pickling of ~50 MB per clip), and the encoder itself runs in an ffmpeg subprocess, so the GIL is not
+the bottleneck.
+
+At most max_pending finished videos wait for the worker. When the queue is full, submit() blocks
+until an export finishes, so frames never pile up in memory faster than they can be encoded.
+
+Exports that fail are collected on the worker and handed back to the main loop by take_failures(),
+which the scripts report like any other failed video. Closing the queue waits for every pending
+export, also when the run stops with an error.
+"""
+
+import collections
+import queue
+import threading
+import time
+
+DEFAULT_MAX_PENDING = 2  # Videos that may wait for export while the next one denoises
+
+ExportFailure = collections.namedtuple("ExportFailure", ("description", "error"))
+
+
+class ExportQueue:
+    """
+    Bounded queue of export tasks run by one worker thread.
+
+    Args:
+        max_pending (int): Tasks that may wait for the worker before submit() blocks. 0 runs every
+            task synchronously inside submit(), with the same failure handling.
+        name (str): Name of the worker thread.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING, name="export-worker"):
+        self.max_pending = max(0, int(max_pending))
+        self.completed = 0
+        self.wait_seconds = 0.0  # Time submit() spent blocked on a full queue
+        self._failures = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._tasks = None
+        self._thread = None
+        if self.max_pending:
+            self._tasks = queue.Queue(maxsize=self.max_pending)
+            self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, func, *args, description="", **kwargs):
+        """
+        Queues func(*args, **kwargs), blocking while max_pending tasks are already waiting.
+
+        Args:
+            description (str): Names the task in its ExportFailure, e.g. the output path.
+        """
+        if self._closed:
+            raise RuntimeError("Export queue is closed.")
+        task = (func, args, kwargs, description)
+        if self._tasks is None:
+            self._execute(task)
+            return
+        started = time.perf_counter()
+        self._tasks.put(task)
+        self.wait_seconds += time.perf_counter() - started
+
+    def _execute(self, task):
+        func, args, kwargs, description = task
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                self._failures.append(ExportFailure(description, e))
+        else:
+            with self._lock:
+                self.completed += 1
+
+    def _run(self):
+        while True:
+            task = self._tasks.get()
+            try:
+                if task is None:
+                    return
+                self._execute(task)
+            finally:
+                self._tasks.task_done()
+
+    def take_failures(self):
+        """
+        Returns the exports that failed since the last call, as ExportFailure tuples.
+        """
+        with self._lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def join(self):
+        """
+        Waits until every submitted task has finished.
+        """
+        if self._tasks is not None:
+            self._tasks.join()
+
+    def close(self):
+        """
+        Waits for the pending tasks and stops the worker. Failures stay available to take_failures().
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._tasks.put(None)
+            self._thread.join()
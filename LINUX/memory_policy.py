@@ -0,0 +1,295 @@
+"""
+Memory policy selection for diffusers video pipelines.
+
+The Cog scripts used to switch on sequential CPU offload, maximal attention slicing and VAE slicing
+and tiling on every machine. That fits a 5B model into a few GB of VRAM, but it is also the slowest
+configuration there is, and a card that holds the whole pipeline pays for it on every step.
+
+choose_policy() looks at the size of each pipeline component and the memory available and picks the
+fastest policy that fits:
+
+    full                 every component stays on the GPU
+    model_offload        components move to the GPU one at a time (enable_model_cpu_offload)
+    sequential_offload   weights stream to the GPU layer by layer (enable_sequential_cpu_offload)
+    cpu                  no CUDA device; everything runs on the CPU
+
+together with attention slicing and VAE slicing/tiling settings that suit it. The budget comes from
+measure_memory(), or from MemoryBudget.simulated() to plan for another machine. A simulated budget
+never moves anything to the GPU: apply_policy() keeps the pipeline on the CPU and applies only the
+chosen VAE and attention settings, so the selection can be exercised on any machine without
+running out of memory on a real card. PeakMemory follows the device and host peaks over a run, and
+record_policy() appends the chosen policy and those peaks to memory_policy.jsonl.
+"""
+
+import ctypes
+import datetime
+import json
+import os
+import sys
+
+POLICY_FULL = "full"
+POLICY_MODEL_OFFLOAD = "model_offload"
+POLICY_SEQUENTIAL_OFFLOAD = "sequential_offload"
+POLICY_CPU = "cpu"
+POLICIES = (POLICY_FULL, POLICY_MODEL_OFFLOAD, POLICY_SEQUENTIAL_OFFLOAD, POLICY_CPU)
+
+GIB = 1024 ** 3
+DEFAULT_WORKING_BYTES = 6 * GIB  # Activations and latents of one 49-frame 720x480 CogVideoX clip
+DEFAULT_VAE_DECODE_BYTES = 12 * GIB  # Extra memory an untiled VAE decode of such a clip needs
+DEVICE_HEADROOM = 0.9  # Fraction of free device memory a policy may plan to use
+RECORD_NAME = "memory_policy.jsonl"
+
+
+class MemoryBudget:
+    """
+    Memory a policy may use.
+
+    Args:
+        device_bytes (int): Free memory on the CUDA device, or None without one.
+        host_bytes (int): Available host RAM, or None if unknown.
+        simulated (bool): True for a budget that does not describe this machine.
+    """
+
+    def __init__(self, device_bytes, host_bytes, simulated=False):
+        self.device_bytes = device_bytes
+        self.host_bytes = host_bytes
+        self.is_simulated = simulated
+
+    @classmethod
+    def simulated(cls, device_gb, host_gb=None):
+        """
+        Returns a budget for a machine with device_gb of free VRAM (None for no GPU) and host_gb of RAM.
+        """
+        device = None if device_gb is None else int(device_gb * GIB)
+        host = None if host_gb is None else int(host_gb * GIB)
+        return cls(device, host, simulated=True)
+
+    def to_dict(self):
+        return {"device_bytes": self.device_bytes, "host_bytes": self.host_bytes, "simulated": self.is_simulated}
+
+
+def available_host_bytes():
+    """
+    Returns the host RAM available to new allocations, or None if it cannot be determined.
+    """
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if sys.platform == "win32":
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+    return None
+
+
+def peak_rss_bytes():
+    """
+    Returns the peak resident set size of this process, or None if it cannot be determined.
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux KB
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    except ImportError:
+        return None
+
+
+def measure_memory(device=0):
+    """
+    Returns the MemoryBudget of this machine: free memory on the CUDA device and available host RAM.
+    """
+    device_bytes = None
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        device_bytes, _ = torch.cuda.mem_get_info(device)
+    return MemoryBudget(device_bytes, available_host_bytes())
+
+
+def component_sizes(pipe):
+    """
+    Returns {component name: bytes of parameters and buffers} for the model components of a pipeline.
+    """
+    sizes = {}
+    for name, component in getattr(pipe, "components", {}).items():
+        if hasattr(component, "parameters") and hasattr(component, "buffers"):
+            tensors = list(component.parameters()) + list(component.buffers())
+            sizes[name] = sum(t.numel() * t.element_size() for t in tensors)
+    return sizes
+
+
+class MemoryPolicy:
+    """
+    The offload mode and memory savers chosen for one pipeline.
+
+    Args:
+        name (str): One of POLICIES.
+        attention_slicing: None to leave attention unsliced, or the slice size ("auto", "max", int).
+        vae_slicing (bool): Decode batched videos one at a time.
+        vae_tiling (bool): Decode each video in overlapping tiles.
+        reason (str): Why the policy was chosen.
+    """
+
+    def __init__(self, name, attention_slicing=None, vae_slicing=False, vae_tiling=False, reason="",
+                 sizes=None, budget=None):
+        self.name = name
+        self.attention_slicing = attention_slicing
+        self.vae_slicing = vae_slicing
+        self.vae_tiling = vae_tiling
+        self.reason = reason
+        self.sizes = sizes or {}
+        self.budget = budget
+
+    def describe(self):
+        savers = [label for label, on in (
+            (f"attention slicing {self.attention_slicing}", self.attention_slicing is not None),
+            ("VAE slicing", self.vae_slicing),
+            ("VAE tiling", self.vae_tiling),
+        ) if on]
+        return f"{self.name} ({', '.join(savers) or 'no memory savers'}): {self.reason}"
+
+    def to_dict(self):
+        return {
+            "policy": self.name,
+            "attention_slicing": self.attention_slicing,
+            "vae_slicing": self.vae_slicing,
+            "vae_tiling": self.vae_tiling,
+            "reason": self.reason,
+            "component_bytes": self.sizes,
+            "budget": self.budget.to_dict() if self.budget is not None else None,
+        }
+
+
+def choose_policy(sizes, budget, working_bytes=DEFAULT_WORKING_BYTES, vae_decode_bytes=DEFAULT_VAE_DECODE_BYTES,
+                  batch_size=1):
+    """
+    Picks the fastest policy whose resident weights plus working memory fit the budget.
+
+    Args:
+        sizes (dict): Component name -> bytes, as returned by component_sizes().
+        budget (MemoryBudget): Memory available.
+        working_bytes (int): Activation memory one video needs while denoising.
+        vae_decode_bytes (int): Extra memory an untiled VAE decode of one video needs.
+        batch_size (int): Videos denoised together.
+
+    Returns:
+        MemoryPolicy
+    """
+    total = sum(sizes.values())
+    largest = max(sizes.values(), default=0)
+    working = working_bytes * max(1, batch_size)
+    gib = lambda size: f"{size / GIB:.1f} GB"
+
+    if budget.device_bytes is None:
+        return MemoryPolicy(POLICY_CPU, vae_slicing=True, vae_tiling=True, sizes=sizes, budget=budget,
+                            reason="no CUDA device")
+
+    usable = budget.device_bytes * DEVICE_HEADROOM
+    host_ok = budget.host_bytes is None or budget.host_bytes >= total
+    if total + working <= usable:
+        # Room left after the weights decides whether the VAE can decode the clip in one piece
+        tiling = usable - total - working < vae_decode_bytes
+        return MemoryPolicy(POLICY_FULL, vae_slicing=batch_size > 1 and tiling, vae_tiling=tiling,
+                            sizes=sizes, budget=budget,
+                            reason=f"{gib(total)} of weights + {gib(working)} working memory fit in {gib(usable)}")
+    if largest + working <= usable and host_ok:
+        tiling = usable - largest - working < vae_decode_bytes
+        return MemoryPolicy(POLICY_MODEL_OFFLOAD, vae_slicing=batch_size > 1 and tiling, vae_tiling=tiling,
+                            sizes=sizes, budget=budget,
+                            reason=f"largest component ({gib(largest)}) + {gib(working)} working memory fit in "
+                                   f"{gib(usable)}, the whole pipeline ({gib(total)}) does not")
+    reason = f"largest component ({gib(largest)}) + {gib(working)} working memory exceed {gib(usable)}"
+    if not host_ok:
+        reason = f"host RAM ({gib(budget.host_bytes)}) cannot hold the offloaded pipeline ({gib(total)})"
+    return MemoryPolicy(POLICY_SEQUENTIAL_OFFLOAD, attention_slicing="max", vae_slicing=True, vae_tiling=True,
+                        sizes=sizes, budget=budget, reason=reason)
+
+
+def apply_policy(pipe, policy, device="cuda"):
+    """
+    Places the pipeline and switches on the memory savers of policy. Without CUDA, or when the
+    policy was chosen for a simulated budget, the pipeline stays on the CPU and only the attention
+    and VAE settings are applied.
+    """
+    torch = sys.modules.get("torch")
+    has_cuda = torch is not None and torch.cuda.is_available()
+    simulated = policy.budget is not None and policy.budget.is_simulated
+    if not has_cuda or simulated or policy.name == POLICY_CPU:
+        pipe.to("cpu")
+    elif policy.name == POLICY_FULL:
+        pipe.to(device)
+    elif policy.name == POLICY_MODEL_OFFLOAD:
+        pipe.enable_model_cpu_offload()
+    else:
+        pipe.enable_sequential_cpu_offload()
+
+    if policy.vae_slicing:
+        pipe.vae.enable_slicing()
+    if policy.vae_tiling:
+        pipe.vae.enable_tiling()
+    if policy.attention_slicing is not None:
+        pipe.enable_attention_slicing(policy.attention_slicing)
+
+
+class PeakMemory:
+    """
+    Highest device and host memory seen over a run. Call observe() before anything resets the CUDA
+    peak statistics.
+    """
+
+    def __init__(self):
+        self.device_bytes = None
+        self.host_bytes = None
+
+    def observe(self):
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            self.device_bytes = max(self.device_bytes or 0, torch.cuda.max_memory_allocated())
+        rss = peak_rss_bytes()
+        if rss is not None:
+            self.host_bytes = max(self.host_bytes or 0, rss)
+
+    def to_dict(self):
+        return {"peak_device_bytes": self.device_bytes, "peak_host_bytes": self.host_bytes}
+
+
+def record_policy(directory, policy, peak=None, **details):
+    """
+    Appends the chosen policy, the observed peaks and any details (model, batch size, ...) to
+    <directory>/memory_policy.jsonl.
+
+    Returns:
+        str: Path of the record file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, RECORD_NAME)
+    record = {
+        "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        **details,
+        **policy.to_dict(),
+        **(peak.to_dict() if peak is not None else {}),
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return path
@@ -0,0 +1,234 @@
+"""
+In-memory search index over every option string in the options catalog.
+
+Each option (every camera of every decade, animals, lighting, framing, holidays, ...) is split into
+lower-case words. Queries are matched word by word: first as a prefix of an indexed word (binary
+search over the sorted vocabulary), and failing that as a substring via a trigram index. Words of
+per-decade tables also carry their decade, so "Arri 1970s" finds the 1970s Arriflex cameras and
+"hedgehog" finds the small-mammal entries. Lookups take well under a millisecond.
+
+Used by the GUI (FilterCombobox) and from the command line:
+
+    python option_index.py "Arri 1970s" --table CAMERAS --limit 5
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import re
+import threading
+
+from options_catalog import get_catalog
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+DEFAULT_LIMIT = 10
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def tokenize(text):
+    """
+    Splits text into lower-case alphanumeric words.
+    """
+    return WORD_PATTERN.findall(text.lower())
+
+
+def trigrams(word):
+    """
+    Returns the set of three-character substrings of a word.
+    """
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class OptionMatch:
+    """
+    One search hit: the table it came from, the decade key for per-decade tables, and the option text.
+    """
+
+    __slots__ = ("table", "key", "position", "text", "score")
+
+    def __init__(self, table, key, position, text, score):
+        self.table = table
+        self.key = key
+        self.position = position
+        self.text = text
+        self.score = score
+
+    def to_dict(self):
+        return {"table": self.table, "key": self.key, "position": self.position, "text": self.text, "score": self.score}
+
+    def __repr__(self):
+        scope = f"{self.table}[{self.key}]" if self.key is not None else self.table
+        return f"OptionMatch({scope}: {self.text!r}, score={self.score})"
+
+
+class OptionIndex:
+    """
+    Prefix and trigram index over the option tables of an OptionsCatalog.
+    """
+
+    def __init__(self, catalog):
+        self.entries = []  # (table, key, position, text)
+        self._folded = []  # Lower-cased entry text (plus decade key) for substring checks
+        self._scopes = {}  # id(option list) -> (table, key)
+        self._scope_entries = {}  # (table, key) -> set of entry ids
+        word_postings = {}
+
+        for table, data in catalog.tables.items():
+            if isinstance(data, dict):
+                groups = [(key, values) for key, values in data.items()]
+            else:
+                groups = [(None, data)]
+            for key, values in groups:
+                if not isinstance(values, list):
+                    continue
+                self._scopes[id(values)] = (table, key)
+                scope_ids = self._scope_entries.setdefault((table, key), set())
+                for position, text in enumerate(values):
+                    if not isinstance(text, str):
+                        continue
+                    entry_id = len(self.entries)
+                    self.entries.append((table, key, position, text))
+                    folded = text.lower() if key is None else f"{text.lower()} {key.lower()}"
+                    self._folded.append(folded)
+                    scope_ids.add(entry_id)
+                    for word in set(tokenize(folded)):
+                        word_postings.setdefault(word, set()).add(entry_id)
+
+        self._words = sorted(word_postings)
+        self._word_postings = {word: frozenset(ids) for word, ids in word_postings.items()}
+        self._trigram_postings = {}
+        for word, ids in self._word_postings.items():
+            for gram in trigrams(word):
+                self._trigram_postings.setdefault(gram, set()).update(ids)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def scope_for(self, values):
+        """
+        Returns (table, key) if values is one of the catalog's own option lists, else None.
+        """
+        return self._scopes.get(id(values))
+
+    def _prefix_ids(self, token):
+        ids = set()
+        start = bisect.bisect_left(self._words, token)
+        for word in self._words[start:]:
+            if not word.startswith(token):
+                break
+            ids.update(self._word_postings[word])
+        return ids
+
+    def _substring_ids(self, token):
+        grams = trigrams(token)
+        if not grams:
+            return set()
+        postings = sorted((self._trigram_postings.get(gram, ()) for gram in grams), key=len)
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            ids.intersection_update(posting)
+            if not ids:
+                break
+        return {entry_id for entry_id in ids if token in self._folded[entry_id]}
+
+    def search(self, query, tables=None, key=None, limit=DEFAULT_LIMIT):
+        """
+        Finds options matching every word of the query.
+
+        Args:
+            query (str): Free text such as "Arri 1970s" or "hedgehog".
+            tables (iterable): Restrict results to these table names (None searches all tables).
+            key (str): Restrict per-decade tables to this decade.
+            limit (int): Maximum number of matches to return (None returns all).
+
+        Returns:
+            list: OptionMatch objects, best first.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        candidates = None
+        scores = {}
+        for token in tokens:
+            exact = self._word_postings.get(token, frozenset())
+            token_ids = self._prefix_ids(token)
+            infix = False
+            if not token_ids:
+                token_ids = self._substring_ids(token)
+                infix = True
+            candidates = token_ids if candidates is None else candidates & token_ids
+            if not candidates:
+                return []
+            for entry_id in candidates:
+                if entry_id in exact:
+                    points = 3
+                elif infix:
+                    points = 1
+                else:
+                    points = 2
+                scores[entry_id] = scores.get(entry_id, 0) + points
+
+        if tables is not None:
+            tables = set(tables)
+            candidates = {entry_id for entry_id in candidates if self.entries[entry_id][0] in tables}
+        if key is not None:
+            candidates = {entry_id for entry_id in candidates if self.entries[entry_id][1] in (key, None)}
+
+        rank = lambda entry_id: (-scores[entry_id], len(self.entries[entry_id][3]), entry_id)
+        ordered = sorted(candidates, key=rank) if limit is None else heapq.nsmallest(limit, candidates, key=rank)
+        return [OptionMatch(*self.entries[entry_id], score=scores[entry_id]) for entry_id in ordered]
+
+    def search_scope(self, query, values, limit=DEFAULT_LIMIT):
+        """
+        Searches only within one catalog option list (e.g. CAMERAS["1970s"]).
+
+        Returns:
+            list: Matching option strings, best first, or None if values is not a catalog list.
+        """
+        scope = self.scope_for(values)
+        if scope is None:
+            return None
+        table, key = scope
+        matches = self.search(query, tables=(table,), key=key, limit=None)
+        return [match.text for match in matches if match.key == key][:limit]
+
+
+def get_option_index():
+    """
+    Returns the process-wide index over the options catalog, building it on first use.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = OptionIndex(get_catalog())
+    return _index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up options in the Temporal Prompt Engine options catalog.")
+    parser.add_argument("query", nargs="+", help="Free-text query, e.g. \"Arri 1970s\" or \"hedgehog\".")
+    parser.add_argument("--table", action="append", help="Restrict to a table such as CAMERAS (repeatable).")
+    parser.add_argument("--decade", help="Restrict per-decade tables to this decade, e.g. 1970s.")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Maximum number of matches.")
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON.")
+    args = parser.parse_args()
+
+    matches = get_option_index().search(" ".join(args.query), tables=args.table, key=args.decade, limit=args.limit)
+    if args.json:
+        print(json.dumps([match.to_dict() for match in matches], indent=4, ensure_ascii=False))
+        return
+    if not matches:
+        print("No matching options.")
+        return
+    for match in matches:
+        scope = f"{match.table}[{match.key}]" if match.key is not None else match.table
+        print(f"{scope}: {match.text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Options catalog shared by the Temporal Prompt Engine and the video generator scripts.
+
+All option tables (themes, art styles, lighting, cameras per decade, animals, holidays, ...)
+live in options_catalog.json next to this module. The JSON is the single source of truth;
+the first load parses it, builds a category index and writes a compact binary cache
+(options_catalog.cache) so later imports only have to unpickle a single blob.
+The cache is keyed on the catalog version and the JSON file's size and modification time,
+so editing the JSON transparently rebuilds it.
+"""
+
+import json
+import os
+import pickle
+import re
+import threading
+
+CATALOG_VERSION = 1
+CATALOG_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(CATALOG_DIR, "options_catalog.json")
+CACHE_FILE = os.path.join(CATALOG_DIR, "options_catalog.cache")
+
+# Entries such as "BIRDS - Eagle, ..." or "SEASONAL HOLIDAYS - Easter, ..." are grouped by their upper-case prefix
+CATEGORY_PATTERN = re.compile(r"^([A-Z0-9&/' ]+?)\s+-\s+")
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+class OptionsCatalog:
+    """
+    Read-only view over the loaded option tables and their category index.
+    """
+
+    def __init__(self, version, tables, index):
+        self.version = version
+        self.tables = tables
+        self.index = index
+
+    def table(self, name):
+        """
+        Returns the option table with the given name (a list, or a dict keyed by decade).
+        """
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise KeyError(f"Unknown option table '{name}'. Available tables: {', '.join(sorted(self.tables))}")
+
+    def categories(self, name):
+        """
+        Returns the category names found in a list table, in catalog order.
+        """
+        return list(self.index["categories"].get(name, {}).keys())
+
+    def by_category(self, name, category):
+        """
+        Returns all entries of a list table that belong to the given category, e.g. ("WILDLIFE_ANIMALS", "BIRDS").
+        """
+        positions = self.index["categories"].get(name, {}).get(category, [])
+        entries = self.tables[name]
+        return [entries[i] for i in positions]
+
+    def decades(self, name):
+        """
+        Returns the sorted decade keys of a per-decade table such as CAMERAS or RESOLUTIONS.
+        """
+        return list(self.index["decades"].get(name, []))
+
+
+def build_index(tables):
+    """
+    Builds the category and decade index for the given tables.
+
+    Returns:
+        dict: {"categories": {table: {category: [positions]}}, "decades": {table: [sorted keys]}}
+    """
+    categories = {}
+    decades = {}
+    for name, table in tables.items():
+        if isinstance(table, dict):
+            decades[name] = sorted(table.keys())
+            continue
+        table_categories = {}
+        for position, entry in enumerate(table):
+            if not isinstance(entry, str):
+                continue
+            match = CATEGORY_PATTERN.match(entry)
+            if match:
+                table_categories.setdefault(match.group(1).strip(), []).append(position)
+        if table_categories:
+            categories[name] = table_categories
+    return {"categories": categories, "decades": decades}
+
+
+def _source_key(path):
+    stat = os.stat(path)
+    return (CATALOG_VERSION, stat.st_size, stat.st_mtime_ns)
+
+
+def _read_cache(cache_path, source_key):
+    try:
+        with open(cache_path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("source_key") != source_key:
+        return None
+    return payload
+
+
+def _write_cache(cache_path, payload):
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        # A read-only install still works, it just parses the JSON on every start
+        print(f"Could not write options cache '{cache_path}': {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_catalog(catalog_path=CATALOG_FILE, cache_path=CACHE_FILE):
+    """
+    Loads the options catalog, preferring the binary cache when it is up to date.
+
+    Args:
+        catalog_path (str): Path to options_catalog.json.
+        cache_path (str): Path to the binary cache, or None to disable caching.
+
+    Returns:
+        OptionsCatalog: The loaded catalog.
+    """
+    source_key = _source_key(catalog_path)
+    if cache_path:
+        payload = _read_cache(cache_path, source_key)
+        if payload is not None:
+            return OptionsCatalog(payload["version"], payload["tables"], payload["index"])
+
+    with open(catalog_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    version = data.get("version")
+    if version != CATALOG_VERSION:
+        raise ValueError(f"Unsupported options catalog version {version} in '{catalog_path}' (expected {CATALOG_VERSION}).")
+
+    tables = data["tables"]
+    payload = {
+        "source_key": source_key,
+        "version": version,
+        "tables": tables,
+        "index": build_index(tables),
+    }
+    if cache_path:
+        _write_cache(cache_path, payload)
+    return OptionsCatalog(payload["version"], payload["tables"], payload["index"])
+
+
+def get_catalog():
+    """
+    Returns the process-wide catalog, loading it on first use.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = load_catalog()
+    return _catalog
@@ -0,0 +1,430 @@
+"""
+Benchmarks for the text parsers and range expanders that run on every prompt of every run.
+
+Covered: parse_prompt_file (TemporalCog-5b, TemporalHYV-12b), parse_prompt_line (TemporalCog-2b,
+and TemporalCog-5b where it parses line by line), parse_outline, clean_prompt_text and
+validate_prompts (TemporalPromptEngine), parse_range_list (generation_jobs), parse_range
+(TemporalHYV-12b) and extract_settings_from_filename (WatermarkVideos), each over a synthetic
+corpus such as 10k prompt sets or a 500-line outline.
+
+The scripts load models, open Tk dialogs or download fonts when imported, so each function is
+compiled straight from its source file instead (decorators stripped). A benchmark whose function
+does not exist in this tree is reported as skipped.
+
+Timings are normalised by a fixed pure-Python calibration loop, so a baseline recorded on one machine
+remains usable on another. The loop is interleaved with the timed runs of every benchmark, so a
+slow patch on a shared machine slows both sides of the ratio instead of skewing it. A benchmark fails when its normalised best time exceeds the recorded
+baseline by more than its threshold.
+
+    python parser_benchmarks.py            # compare against parser_benchmarks_baseline.json
+    python parser_benchmarks.py --record   # record a new baseline
+"""
+
+import argparse
+import ast
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from typing import List, Optional, Union
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASE_DIR, "parser_benchmarks_baseline.json")
+
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown over the baseline (0.25 = 25%)
+DEFAULT_REPEAT = 5  # Timed runs per benchmark; the best one is compared
+CORPUS_SEED = 1990
+
+PROMPT_SETS = 10000
+OUTLINE_LINES = 500
+OUTLINE_ROUNDS = 20  # A single outline parses in about a millisecond
+RAW_RESPONSES = 2000
+PROMPT_LINES = 30000
+FILENAMES = 10000
+
+WORDS = (
+    "cinematic sweeping dolly shot golden hour misty harbor lighthouse weathered fisherman wool sweater "
+    "kodachrome grain 1970s arriflex anamorphic lens flare neon rain alley vintage convertible chrome "
+    "hedgehog meadow dew macro shallow depth of field soft backlight crowd festival lanterns paper "
+    "avoid blurry deformed limbs cluttered background watermark text low resolution oversaturated"
+).split()
+
+
+# --------------------- Loading functions from source ---------------------
+
+def load_function(path, name, class_name=None):
+    """
+    Compiles one function (or method, with class_name) from a source file without importing the file.
+    When the name is defined more than once, the last definition wins, as it would at import time.
+
+    Returns:
+        function: The compiled function, or None if it is not defined in the file.
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    body = tree.body
+    if class_name is not None:
+        classes = [node for node in body if isinstance(node, ast.ClassDef) and node.name == class_name]
+        if not classes:
+            return None
+        body = classes[-1].body
+
+    definitions = [node for node in body if isinstance(node, ast.FunctionDef) and node.name == name]
+    if not definitions:
+        return None
+    node = definitions[-1]
+    node.decorator_list = []
+    module = ast.fix_missing_locations(ast.Module(body=[node], type_ignores=[]))
+    namespace = {"re": re, "os": os, "logging": logging, "List": List, "Optional": Optional, "Union": Union}
+    exec(compile(module, path, "exec"), namespace)
+    return namespace[name]
+
+
+# --------------------- Synthetic corpora ---------------------
+
+def _sentence(rng, low, high):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def prompt_file_lines(rng, count=PROMPT_SETS):
+    """
+    Lines of a *_video_prompts.txt file with count prompt sets. About one set in twenty continues its
+    positive section on a second line, and one in a hundred is missing its negative section.
+    """
+    lines = []
+    for index in range(count):
+        lines.append(f"positive: {_sentence(rng, 40, 90)}.\n")
+        if index % 20 == 7:
+            lines.append(f"{_sentence(rng, 10, 20)}.\n")
+        if index % 100 != 42:
+            lines.append(f"negative: {_sentence(rng, 10, 30)}.\n")
+        lines.append("--------------------\n")
+    return lines
+
+
+def prompt_file_text(rng, count=PROMPT_SETS):
+    """
+    The accepted prompt sets of a run as the engine joins them, all valid.
+    """
+    sets = [f"positive: {_sentence(rng, 40, 90)}.\nnegative: {_sentence(rng, 10, 30)}." for _ in range(count)]
+    return "\n--------------------\n".join(sets)
+
+
+def outline_text(rng, count=OUTLINE_LINES):
+    lines = [f"{index}. {_sentence(rng, 20, 60)}." for index in range(1, count + 1)]
+    return "Here is the outline:\n" + "\n".join(lines) + "\n"
+
+
+def raw_responses(rng, count=RAW_RESPONSES):
+    responses = []
+    for _ in range(count):
+        negative_lines = "\n".join(f"- Avoid {_sentence(rng, 3, 8)}" for _ in range(rng.randint(2, 5)))
+        responses.append(f"  Positive: {_sentence(rng, 40, 90)}.\nNegative:\n{negative_lines}\n")
+    return responses
+
+
+def range_specs():
+    """
+    Inputs for parse_range_list: comma lists and stepped ranges of floats and ints.
+    """
+    return [
+        ("5.0, 6.5, 7.0, 7.5, 10.0", float),
+        ("1.0 - 20.0 : 0.01", float),
+        ("0.5 - 12.5 : 0.5, 3.0, 4.25, 6 - 9", float),
+        ("10 - 5000 : 5", int),
+        ("1 - 2000", int),
+        ("10, 20, 30, 40, 50 - 150 : 10", int),
+    ]
+
+
+def hyv_range_specs():
+    """
+    Inputs for TemporalHYV-12b's parse_range: single values and start-end[:step] ranges.
+    """
+    return [
+        ("129", int),
+        ("1-10000", int),
+        ("1-10000:3", int),
+        ("0.5-500:0.05", float),
+        ("6", float),
+    ]
+
+
+def watermark_filenames(rng, count=FILENAMES):
+    names = []
+    for index in range(count):
+        if index % 10 == 3:
+            names.append(f"clip_{index}_final.mp4")
+        else:
+            gs = rng.choice(["5.0", "6.5", "7.0", "10.0"])
+            steps = rng.choice([10, 20, 40, 50])
+            names.append(f"video_{index}_5b_{gs}gs_{steps}steps_{_sentence(rng, 3, 5).replace(' ', '_')[:20]}.mp4")
+    return names
+
+
+# --------------------- Benchmarks ---------------------
+
+class Benchmark:
+    """
+    One timed workload.
+
+    Args:
+        name (str): Key in the baseline file.
+        source (str): Source file, relative to this directory.
+        function (str): Function name in the source file.
+        class_name (str): Class holding the function, for engine methods.
+        corpus (callable): corpus(rng) -> data, built once before timing.
+        run (callable): run(function, data), the timed call.
+        threshold (float): Allowed slowdown over the baseline; DEFAULT_THRESHOLD when None.
+    """
+
+    def __init__(self, name, source, function, corpus, run, class_name=None, threshold=None):
+        self.name = name
+        self.source = source
+        self.function = function
+        self.class_name = class_name
+        self.corpus = corpus
+        self.run = run
+        self.threshold = threshold
+
+
+def _each(function, items):
+    for item in items:
+        function(item)
+
+
+def _each_range(function, specs, rounds=20):
+    for _ in range(rounds):
+        for text, type_func in specs:
+            function(text, type_func)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "cog5b.parse_prompt_file", "VideoGeneratorUtilities/TemporalCog-5b.py", "parse_prompt_file",
+        prompt_file_lines, lambda f, lines: f(lines),
+    ),
+    Benchmark(
+        "hyv.parse_prompt_file", "VideoGeneratorUtilities/TemporalHYV-12b.py", "parse_prompt_file",
+        prompt_file_lines, lambda f, lines: f(lines),
+    ),
+    Benchmark(
+        "cog2b.parse_prompt_line", "VideoGeneratorUtilities/TemporalCog-2b.py", "parse_prompt_line",
+        lambda rng: prompt_file_lines(rng, PROMPT_LINES // 3), _each,
+    ),
+    Benchmark(
+        "cog5b.parse_prompt_line", "VideoGeneratorUtilities/TemporalCog-5b.py", "parse_prompt_line",
+        lambda rng: prompt_file_lines(rng, PROMPT_LINES // 3), _each,
+    ),
+    Benchmark(
+        "engine.parse_outline", "TemporalPromptEngine.py", "parse_outline",
+        outline_text, lambda f, text: [f(None, text, OUTLINE_LINES) for _ in range(OUTLINE_ROUNDS)],
+        class_name="MultimediaSuiteApp",
+    ),
+    Benchmark(
+        "engine.clean_prompt_text", "TemporalPromptEngine.py", "clean_prompt_text",
+        raw_responses, lambda f, responses: [f(None, response) for response in responses], class_name="MultimediaSuiteApp",
+    ),
+    Benchmark(
+        "engine.validate_prompts", "TemporalPromptEngine.py", "validate_prompts",
+        prompt_file_text, lambda f, text: f(None, text, PROMPT_SETS), class_name="MultimediaSuiteApp",
+    ),
+    Benchmark(
+        "jobs.parse_range_list", "generation_jobs.py", "parse_range_list",
+        lambda rng: range_specs(), _each_range,
+    ),
+    Benchmark(
+        "hyv.parse_range", "VideoGeneratorUtilities/TemporalHYV-12b.py", "parse_range",
+        lambda rng: hyv_range_specs(), _each_range,
+    ),
+    Benchmark(
+        "watermark.extract_settings_from_filename", "VideoGeneratorUtilities/WatermarkVideos.py",
+        "extract_settings_from_filename", watermark_filenames, _each,
+    ),
+]
+
+
+def calibrate(repeat=DEFAULT_REPEAT):
+    """
+    Times a fixed pure-Python workload (string building, splitting and regex matching).
+
+    Returns:
+        float: Best time in seconds.
+    """
+    pattern = re.compile(r"^(\d+)\.\s*(.*)")
+    lines = [f"{index}. {' '.join(WORDS[index % 7:index % 7 + 12])}" for index in range(20000)]
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        total = 0
+        for line in lines:
+            match = pattern.match(line)
+            total += len(match.group(2).split()) + len(line.strip().lower())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+@contextlib.contextmanager
+def _quiet():
+    # The parsers print or log a warning for every malformed entry
+    logging.disable(logging.CRITICAL)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            yield
+        finally:
+            logging.disable(logging.NOTSET)
+
+
+def run_benchmark(benchmark, repeat=DEFAULT_REPEAT):
+    """
+    Runs one benchmark.
+
+    Returns:
+        dict: {"best_seconds", "median_seconds", "calibration_seconds", "score"} or {"skipped": reason}.
+        score is the best time divided by the best calibration loop measured alongside it.
+    """
+    function = load_function(os.path.join(BASE_DIR, benchmark.source), benchmark.function, benchmark.class_name)
+    if function is None:
+        return {"skipped": f"{benchmark.function} is not defined in {benchmark.source}"}
+    data = benchmark.corpus(random.Random(CORPUS_SEED))
+    timings = []
+    calibrations = []
+    with _quiet():
+        benchmark.run(function, data)  # Warm-up (regex cache, allocator)
+        for _ in range(repeat):
+            calibrations.append(calibrate(1))
+            started = time.perf_counter()
+            benchmark.run(function, data)
+            timings.append(time.perf_counter() - started)
+    best = min(timings)
+    calibration = min(calibrations)
+    return {
+        "best_seconds": best,
+        "median_seconds": statistics.median(timings),
+        "calibration_seconds": calibration,
+        "score": best / calibration,
+    }
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def record_baseline(results, path=BASELINE_FILE, previous=None):
+    """
+    Writes the results as the new baseline, keeping per-benchmark thresholds from the previous file.
+    """
+    previous_entries = (previous or {}).get("benchmarks", {})
+    entries = {}
+    for name, result in results.items():
+        if "skipped" in result:
+            continue
+        entry = {"score": round(result["score"], 4), "best_seconds": round(result["best_seconds"], 6)}
+        if "threshold" in previous_entries.get(name, {}):
+            entry["threshold"] = previous_entries[name]["threshold"]
+        entries[name] = entry
+    baseline = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "threshold": (previous or {}).get("threshold", DEFAULT_THRESHOLD),
+        "benchmarks": entries,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+        f.write("\n")
+    return baseline
+
+
+def compare(results, baseline, threshold=None):
+    """
+    Compares normalised timings against the baseline.
+
+    Returns:
+        list: (name, ratio or None, allowed ratio or None, status) per benchmark, status being
+        "ok", "REGRESSION", "new" or "skipped".
+    """
+    rows = []
+    entries = baseline.get("benchmarks", {}) if baseline else {}
+    for benchmark in BENCHMARKS:
+        result = results.get(benchmark.name)
+        if result is None:
+            continue
+        if "skipped" in result:
+            rows.append((benchmark.name, None, None, "skipped"))
+            continue
+        entry = entries.get(benchmark.name)
+        if entry is None:
+            rows.append((benchmark.name, None, None, "new"))
+            continue
+        allowed = threshold
+        if allowed is None:
+            allowed = entry.get("threshold", benchmark.threshold)
+        if allowed is None:
+            allowed = baseline.get("threshold", DEFAULT_THRESHOLD)
+        ratio = result["score"] / entry["score"]
+        rows.append((benchmark.name, ratio, 1.0 + allowed, "REGRESSION" if ratio > 1.0 + allowed else "ok"))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prompt parsers and range expanders.")
+    parser.add_argument("--record", action="store_true", help="Record the results as the new baseline.")
+    parser.add_argument("--only", action="append", help="Run only benchmarks whose name contains this text (repeatable).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark.")
+    parser.add_argument("--threshold", type=float, help="Override the allowed slowdown, e.g. 0.25 for 25%%.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare against or record.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    selected = [b for b in BENCHMARKS if not args.only or any(text in b.name for text in args.only)]
+    results = {benchmark.name: run_benchmark(benchmark, args.repeat) for benchmark in selected}
+    baseline = load_baseline(args.baseline)
+
+    if args.record:
+        recorded = results
+        if args.only and baseline:
+            # Keep the entries of benchmarks that were not run this time
+            recorded = dict(baseline.get("benchmarks", {}))
+            recorded.update(results)
+        record_baseline(recorded, args.baseline, previous=baseline)
+        print(f"Baseline recorded to {args.baseline}")
+
+    rows = compare(results, None if args.record else baseline, args.threshold)
+    if args.json:
+        print(json.dumps({"results": results,
+                          "comparison": [dict(zip(("name", "ratio", "allowed", "status"), row)) for row in rows]}, indent=4))
+    else:
+        print(f"{'benchmark':<44}{'best ms':>10}{'median ms':>11}{'score':>8}{'vs base':>9}{'limit':>8}  status")
+        for name, ratio, allowed, status in rows:
+            result = results[name]
+            if status == "skipped":
+                print(f"{name:<44}{'-':>10}{'-':>11}{'-':>8}{'-':>9}{'-':>8}  skipped: {result['skipped']}")
+                continue
+            ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+            allowed_text = f"{allowed:.2f}x" if allowed is not None else "-"
+            print(f"{name:<44}{result['best_seconds'] * 1000:>10.2f}{result['median_seconds'] * 1000:>11.2f}"
+                  f"{result['score']:>8.2f}{ratio_text:>9}{allowed_text:>8}  {status}")
+        if baseline is None and not args.record:
+            print(f"No baseline at {args.baseline}; run with --record to create one.")
+
+    if any(status == "REGRESSION" for _, _, _, status in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
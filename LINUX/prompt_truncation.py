@@ -0,0 +1,119 @@
+"""
+Token-accurate prompt truncation for the video generator scripts.
+
+CogVideoX encodes prompts with its T5 tokenizer and silently drops everything past
+max_sequence_length (226 tokens, including the end-of-sequence token). PromptTruncator counts and
+cuts prompts with that same tokenizer. With a fast tokenizer it encodes a prompt once with offset
+mappings and reads the cut position straight from the offsets; slow tokenizers fall back to a binary
+search over word boundaries (O(log n) encodes). The cut is moved back to the last sentence end, or
+failing that the last whole word, so a prompt never ends in half a word. Counts and cuts are cached
+per prompt, so logging the lengths afterwards costs nothing.
+"""
+
+import re
+from collections import OrderedDict
+
+DEFAULT_MAX_TOKENS = 226  # CogVideoX's max_sequence_length
+DEFAULT_CACHE_ENTRIES = 1024
+SENTENCE_MIN_FRACTION = 0.75  # Cut at a sentence end only if it keeps this much of the allowed text
+
+_SENTENCE_END = re.compile(r"[.!?;][\"')\]]*(?=\s|$)")
+_WORD_END = re.compile(r"\S+")
+
+
+class PromptTruncator:
+    """
+    Counts and truncates prompts with a pipeline's own tokenizer.
+
+    Args:
+        tokenizer: A transformers tokenizer, e.g. pipe.tokenizer or the model's "tokenizer" subfolder.
+        max_tokens (int): Default token limit, special tokens included.
+        cache_entries (int): Prompts kept in each cache; the least recently used are dropped first.
+    """
+
+    def __init__(self, tokenizer, max_tokens=DEFAULT_MAX_TOKENS, cache_entries=DEFAULT_CACHE_ENTRIES):
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.cache_entries = cache_entries
+        self.special_tokens = tokenizer.num_special_tokens_to_add(pair=False)
+        self.fast = getattr(tokenizer, "is_fast", False)  # Only fast tokenizers return offset mappings
+        self._counts = OrderedDict()
+        self._cuts = OrderedDict()
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_entries:
+            cache.popitem(last=False)
+        return value
+
+    def _encode(self, text, offsets=False):
+        return self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=offsets)
+
+    def count(self, text):
+        """
+        Returns the number of tokens the pipeline encodes text to, special tokens included.
+        """
+        cached = self._counts.get(text)
+        if cached is not None:
+            self._counts.move_to_end(text)
+            return cached
+        return self._remember(self._counts, text, len(self._encode(text)["input_ids"]) + self.special_tokens)
+
+    @staticmethod
+    def _offset_cut(text, offsets, budget):
+        """
+        Returns the character position where the first `budget` tokens of text end, never inside a word.
+        """
+        end = offsets[budget - 1][1]
+        if end < len(text) and text[end - 1].isalnum() and text[end].isalnum():
+            # The token limit fell inside a word: keep only the words that fit entirely
+            while end > 0 and not text[end - 1].isspace():
+                end -= 1
+        return end
+
+    def _search_cut(self, text, budget):
+        """
+        Slow tokenizers: binary search for the longest whole-word prefix of text within the budget.
+        """
+        word_ends = [match.end() for match in _WORD_END.finditer(text)]
+        low, high = 0, len(word_ends) - 1
+        best = 0
+        while low <= high:
+            middle = (low + high) // 2
+            if len(self._encode(text[:word_ends[middle]])["input_ids"]) <= budget:
+                best = word_ends[middle]
+                low = middle + 1
+            else:
+                high = middle - 1
+        return best
+
+    def truncate(self, text, max_tokens=None):
+        """
+        Returns text cut to at most max_tokens tokens (default: self.max_tokens), ending at a sentence
+        end where one falls close enough to the limit and at a word boundary otherwise.
+        """
+        max_tokens = max_tokens or self.max_tokens
+        key = (text, max_tokens)
+        cached = self._cuts.get(key)
+        if cached is not None:
+            self._cuts.move_to_end(key)
+            return cached
+
+        # One encode gives both the length and, with a fast tokenizer, the offsets of every token
+        encoding = self._encode(text, offsets=self.fast)
+        num_tokens = len(encoding["input_ids"])
+        self._remember(self._counts, text, num_tokens + self.special_tokens)
+        budget = max(1, max_tokens - self.special_tokens)
+        if num_tokens <= budget:
+            return self._remember(self._cuts, key, text)
+
+        if self.fast:
+            end = self._offset_cut(text, encoding["offset_mapping"], budget)
+        else:
+            end = self._search_cut(text, budget)
+        sentence_ends = [match.end() for match in _SENTENCE_END.finditer(text, 0, end)]
+        if sentence_ends and sentence_ends[-1] >= end * SENTENCE_MIN_FRACTION:
+            end = sentence_ends[-1]
+        truncated = text[:end].rstrip().rstrip(",:-–—").rstrip()
+        return self._remember(self._cuts, key, truncated)
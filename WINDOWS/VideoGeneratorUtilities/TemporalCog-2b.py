@@ -12,13 +12,20 @@ negative: [Your negative prompt here]
 positive: [Next positive prompt]
 negative: [Next negative prompt]
 --------------------
+
+Run without arguments, the script asks for its inputs with dialogs. For unattended runs, pass the
+inputs on the command line or in a JSON job spec (see generation_jobs.py), e.g.:
+
+    python TemporalCog-2b.py --prompt-file prompts.txt --guidance-scales "6.0, 7.0" --seeds "1 - 4"
+    python TemporalCog-2b.py --job render_job.json --failure-policy abort --log-file render.log
 """
 
-import argparse
 import os
+import sys
 import random
 import time
 import gc
+import logging
 from typing import Optional
 
 import torch
@@ -34,17 +41,49 @@ from diffusers.utils import export_to_video, load_image, load_video
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 
-from transformers import AutoTokenizer, pipeline
+from transformers import AutoTokenizer
+
+# Shared engine modules (stage profiler) live one directory up, next to TemporalPromptEngine.py
+ENGINE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
+
+from embedding_cache import EmbeddingCache
+from generation_jobs import (
+    GenerationAborted,
+    JobSpecError,
+    Notifier,
+    build_arg_parser,
+    configure_logging,
+    resolve_job,
+)
+from prompt_summary import KeywordExtractor, LazySummarizer
+from prompt_truncation import PromptTruncator
+from stage_profiler import (
+    STAGE_DENOISE,
+    STAGE_EXPORT,
+    STAGE_PARSING,
+    STAGE_PIPELINE_LOAD,
+    STAGE_SUMMARIZATION,
+    STAGE_TOKENIZATION,
+    consume_profile_flag,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+    profiled,
+)
+from video_encoder import EncoderSettings, clip_to_uint8, write_video
 
 # --------------------- Configuration ---------------------
 
 # Summarization settings
-TOKENIZER_NAME = "gpt2"  # Tokenizer compatible with your summarization model
+TOKENIZER_SUBFOLDER = "tokenizer"  # Prompts are measured with the video model's own T5 tokenizer
 SUMMARIZATION_MODEL = "facebook/bart-large-cnn"  # Summarization model
 POSITIVE_MAX_TOKENS = 160  # Max tokens for positive prompts
 NEGATIVE_MAX_TOKENS = 60   # Max tokens for negative prompts
 POSITIVE_MIN_TOKENS = 80   # Min tokens for positive prompts
 NEGATIVE_MIN_TOKENS = 30   # Min tokens for negative prompts
+FILENAME_SUMMARY = "keywords"  # Output file names from "keywords" (fast, local) or "bart" (SUMMARIZATION_MODEL)
 
 # Video generation settings
 MODEL_PATH_2B = "THUDM/CogVideoX-2B"  # Pre-trained 2B model path
@@ -56,27 +95,44 @@ INFERENCE_STEPS = [10, 20, 40, 60, 80, 100]  # Default inference steps (will be
 SEED = 1990
 DTYPE = torch.float16 if torch.cuda.is_available() else torch.float32
 
+# Prompt embedding cache (T5 encodings reused across sweep points and runs)
+EMBEDDING_CACHE_DIR = os.path.join(ENGINE_DIR, "embedding_cache")
+MAX_SEQUENCE_LENGTH = 226  # Token length CogVideoX encodes prompts to
+
+# Video encoding: frames are streamed into ffmpeg as raw RGB (export_to_video is used when ffmpeg is missing)
+VIDEO_ENCODER = EncoderSettings(codec="libx264", crf=18, preset="medium", pix_fmt="yuv420p")
+
+# `--profile` records cProfile and tracemalloc data per stage and writes a report next to the videos
+if consume_profile_flag():
+    enable_profiling("TemporalCog-2b")
+
+# Errors go through the notifier: always logged, shown in message boxes only in interactive runs
+logger = logging.getLogger("TemporalCog-2b")
+notifier = Notifier(logger)
+
 # --------------------- Initialization ---------------------
 
-# Initialize the tokenizer and summarization pipeline globally to avoid reloading for each prompt
-try:
-    tokenizer = AutoTokenizer.from_pretrained(TOKENIZER_NAME)
-except Exception as e:
-    print(f"Error loading tokenizer '{TOKENIZER_NAME}': {e}")
-    tokenizer = None
-
-try:
-    summarizer = pipeline(
-        "summarization",
-        model=SUMMARIZATION_MODEL,
-        device=0 if torch.cuda.is_available() else -1
-    )
-except Exception as e:
-    print(f"Error loading summarization model '{SUMMARIZATION_MODEL}': {e}")
-    summarizer = None
+# Initialize the tokenizer globally to avoid reloading for each prompt
+with profile_stage(STAGE_PIPELINE_LOAD):
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH_2B, subfolder=TOKENIZER_SUBFOLDER)
+    except Exception as e:
+        print(f"Error loading the tokenizer of '{MODEL_PATH_2B}': {e}")
+        tokenizer = None
+
+# Counts and cuts prompts in the tokens the pipeline sees; results are cached per prompt
+prompt_truncator = PromptTruncator(tokenizer, MAX_SEQUENCE_LENGTH) if tokenizer else None
+
+# The summarization model is only loaded the first time a prompt needs it; file names use keywords
+summarizer = LazySummarizer(SUMMARIZATION_MODEL, device=0 if torch.cuda.is_available() else -1)
+keyword_extractor = KeywordExtractor(max_words=5)
+
+# Prompt embeddings are encoded once per distinct text and model, then served from memory or disk
+embedding_cache = EmbeddingCache(MODEL_PATH_2B, EMBEDDING_CACHE_DIR, MAX_SEQUENCE_LENGTH)
 
 # --------------------- Helper Functions ---------------------
 
+@profiled(STAGE_TOKENIZATION)
 def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> str:
     """
     Refines and truncates the input text to fit within the specified token limit, preserving essential details.
@@ -89,36 +145,26 @@ def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> st
     Returns:
     - str: The refined and truncated text adhering to the token limit.
     """
-    if not tokenizer:
+    if not prompt_truncator:
         print("Tokenizer not initialized. Returning original text.")
         return text
 
-    # Tokenize the input text
-    tokens = tokenizer.encode(text, return_tensors="pt")
-    num_tokens = tokens.shape[1]
-
     # If the input is already within limits, return as is
-    if num_tokens <= max_tokens:
+    if prompt_truncator.count(text) <= max_tokens:
         return text
 
     # Summarize the text to fit within the token limit
-    try:
-        summary = summarizer(
-            text,
-            max_length=max_tokens,
-            min_length=min_tokens,
-            do_sample=False,
-            truncation=True,
-        )[0]['summary_text']
-        return summary
-    except Exception as e:
-        print(f"Error during summarization: {e}")
+    summary = summarizer.summarize(text, max_length=max_tokens, min_length=min_tokens)
+    if summary is None:
         # If summarization fails, fallback to truncation
         return truncate_to_token_limit(text, max_tokens)
+    return summary
 
+@profiled(STAGE_TOKENIZATION)
 def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     """
-    Truncates the input text to the specified token limit, ensuring that key elements remain intact.
+    Truncates the input text to the specified token limit, cutting at the last sentence end or whole
+    word that fits.
 
     Parameters:
     - text (str): The text to truncate.
@@ -127,27 +173,12 @@ def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     Returns:
     - str: The truncated text adhering to the token limit.
     """
-    # Tokenize text
-    tokens = tokenizer.encode(text, return_tensors="pt")
-    num_tokens = tokens.shape[1]
-
-    if num_tokens <= max_tokens:
-        return text  # No need to truncate
-
-    # Split text into words and truncate based on token count
-    words = text.split()
-
-    # Token limit truncation (even if breaking sentences)
-    truncated_words = []
-    for word in words:
-        truncated_words.append(word)
-        truncated_text = ' '.join(truncated_words)
-        if tokenizer.encode(truncated_text, return_tensors="pt").shape[1] > max_tokens:
-            truncated_words.pop()  # Remove the last word that exceeded the limit
-            break
-
-    return ' '.join(truncated_words)
+    if not prompt_truncator:
+        print("Tokenizer not initialized. Returning original text.")
+        return text
+    return prompt_truncator.truncate(text, max_tokens)
 
+@profiled(STAGE_SUMMARIZATION)
 def create_five_word_summary(text: str) -> str:
     """
     Creates a 5-word summary of the given text.
@@ -158,25 +189,14 @@ def create_five_word_summary(text: str) -> str:
     Returns:
     - str: A 5-word summary.
     """
-    if not summarizer:
-        print("Summarizer not initialized. Returning first 5 words.")
-        return ' '.join(text.split()[:5])
-
-    try:
+    if FILENAME_SUMMARY == "bart":
         # Summarize the text with a low max_length to aim for a short summary
-        summary = summarizer(
-            text,
-            max_length=10,  # Adjust as needed
-            min_length=5,
-            do_sample=False,
-            truncation=True,
-        )[0]['summary_text']
-        # Extract first 5 words
-        five_word_summary = ' '.join(summary.split()[:5])
-        return five_word_summary
-    except Exception as e:
-        print(f"Error during 5-word summarization: {e}")
-        return ' '.join(text.split()[:5])
+        summary = summarizer.summarize(text, max_length=10, min_length=5)
+        if summary:
+            return ' '.join(summary.split()[:5])
+        print("Summarizer not available. Using keywords instead.")
+
+    return keyword_extractor.summary(text)
 
 def create_srt_file(video_path: str, subtitle_text: str, duration: float):
     """
@@ -214,8 +234,7 @@ def create_srt_file(video_path: str, subtitle_text: str, duration: float):
         print(f"SRT file saved to: {srt_path}")
 
     except Exception as e:
-        print(f"Error creating SRT file for video '{video_path}': {e}")
-        messagebox.showerror("SRT Generation Error", f"Error creating SRT file for video '{video_path}':\n{e}")
+        notifier.error("SRT Generation Error", f"Error creating SRT file for video '{video_path}': {e}")
 
 def select_prompt_file():
     """
@@ -348,65 +367,72 @@ def generate_video(
 
         # Enable inference mode to reduce memory usage
         with torch.inference_mode():
+            # Reuse cached T5 embeddings instead of re-encoding both prompts on every call
+            prompt_inputs = embedding_cache.prompt_inputs(pipe, prompt, negative_prompt)
+
             # Generate the video frames based on the prompt
-            if generate_type == "i2v":
-                image = load_image(image=image_or_video_path)
-                if image is None:
-                    raise ValueError(f"Failed to load image from path: {image_or_video_path}")
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    image=image,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    num_frames=49,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            elif generate_type == "t2v":
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    num_frames=49,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            elif generate_type == "v2v":
-                video = load_video(image_or_video_path)
-                if video is None:
-                    raise ValueError(f"Failed to load video from path: {image_or_video_path}")
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    video=video,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            else:
-                raise ValueError(f"Invalid generate_type: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
+            with profile_stage(STAGE_DENOISE):
+                if generate_type == "i2v":
+                    image = load_image(image=image_or_video_path)
+                    if image is None:
+                        raise ValueError(f"Failed to load image from path: {image_or_video_path}")
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        image=image,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        num_frames=49,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",  # NumPy frames for the streaming encoder, skipping the PIL conversion
+                        generator=generator,
+                    ).frames[0]
+                elif generate_type == "t2v":
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        num_frames=49,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",
+                        generator=generator,
+                    ).frames[0]
+                elif generate_type == "v2v":
+                    video = load_video(image_or_video_path)
+                    if video is None:
+                        raise ValueError(f"Failed to load video from path: {image_or_video_path}")
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        video=video,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",
+                        generator=generator,
+                    ).frames[0]
+                else:
+                    raise ValueError(f"Invalid generate_type: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
+
+            # The pipeline returns float32 frames; keep only their uint8 copy, a quarter of the size
+            video_generate = clip_to_uint8(video_generate)
 
             # Export the generated frames to a video file. fps must be 8 for original video.
-            export_to_video(video_generate, output_path, fps=8)
-            print(f"Video saved to: {output_path}")
+            with profile_stage(STAGE_EXPORT):
+                write_video(video_generate, output_path, fps=8, settings=VIDEO_ENCODER, fallback=export_to_video)
+                print(f"Video saved to: {output_path}")
 
-            # Calculate video duration based on num_frames and fps
-            num_frames = 49
-            fps = 8
-            duration_seconds = num_frames / fps
+                # Calculate video duration based on num_frames and fps
+                num_frames = 49
+                fps = 8
+                duration_seconds = num_frames / fps
 
-            # Create corresponding .srt file
-            create_srt_file(output_path, prompt, duration_seconds)
+                # Create corresponding .srt file
+                create_srt_file(output_path, prompt, duration_seconds)
 
     except Exception as e:
-        print(f"Error generating video for prompt '{prompt}': {e}")
-        messagebox.showerror("Video Generation Error", f"Error generating video for prompt:\n{e}")
+        notifier.failure("Video Generation Error", f"Error generating video for prompt '{prompt}': {e}")
 
     finally:
         # Clear memory to prevent GPU/CPU overload
@@ -414,127 +440,32 @@ def generate_video(
             torch.cuda.empty_cache()
         gc.collect()
 
-# --------------------- Main Function ---------------------
-
-def main():
-    # Select the prompt list file
-    prompt_file = select_prompt_file()
-    if not prompt_file:
-        return
-
-    # Get parameters from the user
-    guidance_scales, inference_steps = get_parameters()
-    if not guidance_scales or not inference_steps:
-        # User canceled or provided invalid input
-        messagebox.showwarning("No Parameters Provided", "No parameters were provided. Using default values.")
-        guidance_scales = GUIDANCE_SCALES
-        inference_steps = INFERENCE_STEPS
-
-    # Determine the directory of the prompt file
-    output_dir = os.path.dirname(prompt_file)
-
-    # Read and parse the prompts
-    try:
-        with open(prompt_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        prompts = []
-        current_prompt = {}
-        for idx, line in enumerate(lines, start=1):
-            parsed = parse_prompt_line(line)
-            if "unrecognized" in parsed:
-                print(f"Warning: Unrecognized line format at line {idx}: '{line.strip()}'. Skipping.")
-                continue
-            if "delimiter" in parsed:
-                if "positive" in current_prompt and "negative" in current_prompt:
-                    prompts.append(current_prompt)
-                    current_prompt = {}
-                else:
-                    if "positive" in current_prompt:
-                        print(f"Warning: 'negative:' section missing for prompt at line {idx}. Skipping.")
-                    current_prompt = {}
-                continue
-            if "positive" in parsed:
-                if "positive" in current_prompt:
-                    print(f"Warning: New 'positive:' found before completing previous prompt at line {idx}. Skipping previous prompt.")
-                current_prompt["positive"] = parsed["positive"]
-            elif "negative" in parsed:
-                if "positive" not in current_prompt:
-                    print(f"Warning: 'negative:' section without a preceding 'positive:' at line {idx}. Skipping.")
-                    continue
-                current_prompt["negative"] = parsed["negative"]
-
-        # Handle last prompt if missing delimiter
-        if "positive" in current_prompt and "negative" in current_prompt:
-            prompts.append(current_prompt)
-        elif "positive" in current_prompt:
-            print(f"Warning: Last prompt missing 'negative:' section. Skipping.")
-
-    except Exception as e:
-        print(f"Error reading prompt file: {e}")
-        messagebox.showerror("File Read Error", f"Error reading prompt file:\n{e}")
-        return
-
-    if not prompts:
-        print("No valid prompts found in the selected file.")
-        messagebox.showinfo("No Prompts", "No valid prompts found in the selected file.")
-        return
-
-    # Clear any residual memory before loading the model
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
-    gc.collect()
-
-    # Load the pipeline once outside the loop to optimize memory usage
-    try:
-        print(f"\nLoading model pipeline '{MODEL_PATH_2B}'...")
-        if GENERATE_TYPE == "i2v":
-            pipe = CogVideoXImageToVideoPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
-        elif GENERATE_TYPE == "t2v":
-            pipe = CogVideoXPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
-        elif GENERATE_TYPE == "v2v":
-            pipe = CogVideoXVideoToVideoPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
-        else:
-            raise ValueError(f"Invalid GENERATE_TYPE: {GENERATE_TYPE}. Choose from 't2v', 'i2v', 'v2v'.")
-
-        # Apply LoRA weights if provided
-        if LORA_PATH:
-            if not os.path.isfile(LORA_PATH):
-                raise FileNotFoundError(f"LoRA weights file not found at: {LORA_PATH}")
-            pipe.load_lora_weights(
-                LORA_PATH,
-                weight_name="pytorch_lora_weights.safetensors",
-                adapter_name="lora_adapter",
-            )
-            pipe.fuse_lora(lora_scale=1 / LORA_RANK)
-
-        # Set Scheduler
-        pipe.scheduler = CogVideoXDPMScheduler.from_config(pipe.scheduler.config, timestep_spacing="trailing")
-
-        # Device Handling
-        if torch.cuda.is_available():
-            pipe.to("cuda")
-        else:
-            pipe.to("cpu")
-
-        # Enable memory optimizations
-        pipe.enable_sequential_cpu_offload()
-        pipe.vae.enable_slicing()
-        pipe.vae.enable_tiling()
-        pipe.enable_attention_slicing("max")  # Enable attention slicing for lower memory usage
-
-        # Optional: Enable xformers for memory-efficient attention (if available)
-        try:
-            pipe.enable_xformers_memory_efficient_attention()
-        except Exception as e:
-            print(f"Could not enable xformers memory efficient attention: {e}")
-
-    except Exception as e:
-        print(f"Error loading the pipeline: {e}")
-        messagebox.showerror("Pipeline Load Error", f"Error loading the pipeline:\n{e}")
-        return
+def generate_all(
+    pipe,
+    prompts: list,
+    guidance_scales: list,
+    inference_steps: list,
+    seeds: list,
+    output_dir: str,
+    generate_type: str = GENERATE_TYPE,
+    image_or_video_path: Optional[str] = None,
+):
+    """
+    Generates every prompt at every guidance scale, step count and seed.
 
-    # Iterate through each prompt and generate videos
+    Parameters:
+    - pipe: The pre-loaded pipeline object.
+    - prompts (list): Dicts with 'positive' and 'negative' prompt text.
+    - guidance_scales (list): Guidance scales to sweep.
+    - inference_steps (list): Step counts to sweep.
+    - seeds (list): Seeds to sweep. With more than one seed, each video's file name carries its seed.
+    - output_dir (str): Where the videos are written.
+    - generate_type (str): The type of video generation ('t2v', 'i2v', 'v2v').
+    - image_or_video_path (str, optional): The image or video used for 'i2v' or 'v2v'.
+    """
+    seed_part = "[seed]seed_" if len(seeds) > 1 else ""
+    # File names use the words that set each prompt apart from the others in the file
+    keyword_extractor.fit([prompt_data.get("positive") for prompt_data in prompts])
     for idx, prompt_data in enumerate(prompts, start=1):
         positive_prompt = prompt_data.get("positive")
         negative_prompt = prompt_data.get("negative")
@@ -549,9 +480,9 @@ def main():
 
         if summarized_positive != positive_prompt:
             print("Positive prompt was too long and has been summarized to fit the model's token limit.")
-            if tokenizer:
-                pos_length = len(tokenizer.encode(positive_prompt))
-                summarized_pos_length = len(tokenizer.encode(summarized_positive))
+            if prompt_truncator:
+                pos_length = prompt_truncator.count(positive_prompt)
+                summarized_pos_length = prompt_truncator.count(summarized_positive)
                 print(f"Original Positive Prompt Length: {pos_length} tokens")
                 print(f"Summarized Positive Prompt Length: {summarized_pos_length} tokens")
             else:
@@ -559,9 +490,9 @@ def main():
 
         if summarized_negative != negative_prompt:
             print("Negative prompt was too long and has been summarized to fit the model's token limit.")
-            if tokenizer:
-                neg_length = len(tokenizer.encode(negative_prompt))
-                summarized_neg_length = len(tokenizer.encode(summarized_negative))
+            if prompt_truncator:
+                neg_length = prompt_truncator.count(negative_prompt)
+                summarized_neg_length = prompt_truncator.count(summarized_negative)
                 print(f"Original Negative Prompt Length: {neg_length} tokens")
                 print(f"Summarized Negative Prompt Length: {summarized_neg_length} tokens")
             else:
@@ -579,43 +510,210 @@ def main():
         print(f"Positive Prompt: {summarized_positive}")
         print(f"Negative Prompt: {summarized_negative}")
         print(f"5-Word Summary: {five_word_summary}")
-        print(f"Output Filename: video_{idx}_2B_[gs]gs_[steps]steps_{safe_summary}.mp4")
+        print(f"Output Filename: video_{idx}_2B_[gs]gs_[steps]steps_{seed_part}{safe_summary}.mp4")
 
-        # Iterate over each guidance scale and inference step to generate multiple videos per prompt
+        # Iterate over each guidance scale, inference step and seed to generate multiple videos per prompt
         for gs in guidance_scales:
             for steps in inference_steps:
-                # Define output filename with the new naming convention
-                output_filename = f"video_{idx}_2B_{gs}gs_{steps}steps_{safe_summary}.mp4"
-                output_path = os.path.join(output_dir, output_filename)
-
-                print(f"  - Generating video with guidance_scale={gs} and num_inference_steps={steps}")
-                print(f"    Output: {output_path}")
-
-                # Generate the video with the current guidance_scale and num_inference_steps
-                generate_video(
-                    prompt=summarized_positive,
-                    negative_prompt=summarized_negative,
-                    generate_type=GENERATE_TYPE,
-                    pipe=pipe,
-                    output_path=output_path,
-                    image_or_video_path=None,  # Modify if using 'i2v' or 'v2v'
-                    num_inference_steps=steps,
-                    guidance_scale=gs,
-                    seed=SEED,  # Optional: You can set a fixed seed if needed
-                )
+                for seed in seeds:
+                    # Define output filename with the new naming convention
+                    seed_name = f"{seed}seed_" if len(seeds) > 1 else ""
+                    output_filename = f"video_{idx}_2B_{gs}gs_{steps}steps_{seed_name}{safe_summary}.mp4"
+                    output_path = os.path.join(output_dir, output_filename)
+
+                    print(f"  - Generating video with guidance_scale={gs}, num_inference_steps={steps} and seed={seed}")
+                    print(f"    Output: {output_path}")
+
+                    # Generate the video with the current guidance_scale, num_inference_steps and seed
+                    generate_video(
+                        prompt=summarized_positive,
+                        negative_prompt=summarized_negative,
+                        generate_type=generate_type,
+                        pipe=pipe,
+                        output_path=output_path,
+                        image_or_video_path=image_or_video_path,
+                        num_inference_steps=steps,
+                        guidance_scale=gs,
+                        seed=seed,
+                    )
+
+                    # Clear memory after each video generation
+                    if torch.cuda.is_available():
+                        torch.cuda.empty_cache()
+                    gc.collect()
+
+# --------------------- Main Function ---------------------
+
+def main():
+    """
+    Runs one generation job. Inputs missing from the command line and job spec are asked for with
+    dialogs in interactive runs and fall back to defaults in headless ones.
 
-                # Clear memory after each video generation
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                gc.collect()
+    Returns:
+    - int: The process exit code (0 when every video was generated).
+    """
+    args = build_arg_parser("Generate CogVideoX-2b videos from a prompt list file.").parse_args()
+    configure_logging(args.log_file)
+    try:
+        job = resolve_job(args)
+    except JobSpecError as e:
+        logger.error(str(e))
+        return 2
+    notifier.interactive = job["interactive"]
+    notifier.failure_policy = job["failure_policy"]
+    generate_type = job["generate_type"] or GENERATE_TYPE
+    seeds = job["seeds"] or [SEED]
 
-    # Clear memory after all videos are generated
+    # Select the prompt list file
+    prompt_file = job["prompt_file"]
+    if not prompt_file and notifier.interactive:
+        prompt_file = select_prompt_file()
+    if not prompt_file:
+        notifier.error("No File Selected", "No prompt list file was given (--prompt-file or prompt_file in the job spec).")
+        return 1
+
+    # Get parameters from the user
+    guidance_scales = job["guidance_scales"]
+    inference_steps = job["inference_steps"]
+    if (guidance_scales is None or inference_steps is None) and notifier.interactive:
+        dialog_scales, dialog_steps = get_parameters()
+        guidance_scales = guidance_scales or dialog_scales
+        inference_steps = inference_steps or dialog_steps
+    if not guidance_scales or not inference_steps:
+        # User canceled or provided invalid input
+        notifier.warning("No Parameters Provided", "No parameters were provided. Using default values.")
+        guidance_scales = guidance_scales or GUIDANCE_SCALES
+        inference_steps = inference_steps or INFERENCE_STEPS
+
+    # Videos go next to the prompt file unless an output directory was given
+    output_dir = job["output_dir"] or os.path.dirname(prompt_file)
+    os.makedirs(output_dir or ".", exist_ok=True)
+    get_profiler().output_directory = output_dir
+
+    # Read and parse the prompts
+    try:
+        with open(prompt_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        with profile_stage(STAGE_PARSING):
+            prompts = []
+            current_prompt = {}
+            for idx, line in enumerate(lines, start=1):
+                parsed = parse_prompt_line(line)
+                if "unrecognized" in parsed:
+                    print(f"Warning: Unrecognized line format at line {idx}: '{line.strip()}'. Skipping.")
+                    continue
+                if "delimiter" in parsed:
+                    if "positive" in current_prompt and "negative" in current_prompt:
+                        prompts.append(current_prompt)
+                        current_prompt = {}
+                    else:
+                        if "positive" in current_prompt:
+                            print(f"Warning: 'negative:' section missing for prompt at line {idx}. Skipping.")
+                        current_prompt = {}
+                    continue
+                if "positive" in parsed:
+                    if "positive" in current_prompt:
+                        print(f"Warning: New 'positive:' found before completing previous prompt at line {idx}. Skipping previous prompt.")
+                    current_prompt["positive"] = parsed["positive"]
+                elif "negative" in parsed:
+                    if "positive" not in current_prompt:
+                        print(f"Warning: 'negative:' section without a preceding 'positive:' at line {idx}. Skipping.")
+                        continue
+                    current_prompt["negative"] = parsed["negative"]
+
+            # Handle last prompt if missing delimiter
+            if "positive" in current_prompt and "negative" in current_prompt:
+                prompts.append(current_prompt)
+            elif "positive" in current_prompt:
+                print(f"Warning: Last prompt missing 'negative:' section. Skipping.")
+
+    except Exception as e:
+        notifier.error("File Read Error", f"Error reading prompt file: {e}")
+        return 1
+
+    if not prompts:
+        notifier.error("No Prompts", "No valid prompts found in the selected file.")
+        return 1
+
+    # Clear any residual memory before loading the model
     if torch.cuda.is_available():
         torch.cuda.empty_cache()
     gc.collect()
 
-    print("\nAll videos have been generated successfully.")
-    messagebox.showinfo("Generation Complete", "All videos have been generated successfully.")
+    # Load the pipeline once outside the loop to optimize memory usage
+    try:
+        with profile_stage(STAGE_PIPELINE_LOAD):
+            print(f"\nLoading model pipeline '{MODEL_PATH_2B}'...")
+            if generate_type == "i2v":
+                pipe = CogVideoXImageToVideoPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
+            elif generate_type == "t2v":
+                pipe = CogVideoXPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
+            elif generate_type == "v2v":
+                pipe = CogVideoXVideoToVideoPipeline.from_pretrained(MODEL_PATH_2B, torch_dtype=DTYPE)
+            else:
+                raise ValueError(f"Invalid GENERATE_TYPE: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
+
+            # Apply LoRA weights if provided
+            if LORA_PATH:
+                if not os.path.isfile(LORA_PATH):
+                    raise FileNotFoundError(f"LoRA weights file not found at: {LORA_PATH}")
+                pipe.load_lora_weights(
+                    LORA_PATH,
+                    weight_name="pytorch_lora_weights.safetensors",
+                    adapter_name="lora_adapter",
+                )
+                pipe.fuse_lora(lora_scale=1 / LORA_RANK)
+
+            # Set Scheduler
+            pipe.scheduler = CogVideoXDPMScheduler.from_config(pipe.scheduler.config, timestep_spacing="trailing")
+
+            # Device Handling
+            if torch.cuda.is_available():
+                pipe.to("cuda")
+            else:
+                pipe.to("cpu")
+
+            # Enable memory optimizations
+            pipe.enable_sequential_cpu_offload()
+            pipe.vae.enable_slicing()
+            pipe.vae.enable_tiling()
+            pipe.enable_attention_slicing("max")  # Enable attention slicing for lower memory usage
+
+            # Optional: Enable xformers for memory-efficient attention (if available)
+            try:
+                pipe.enable_xformers_memory_efficient_attention()
+            except Exception as e:
+                print(f"Could not enable xformers memory efficient attention: {e}")
+
+    except Exception as e:
+        notifier.error("Pipeline Load Error", f"Error loading the pipeline: {e}")
+        return 1
+
+    # Iterate through each prompt and generate videos
+    try:
+        generate_all(pipe, prompts, guidance_scales, inference_steps, seeds, output_dir,
+                     generate_type=generate_type, image_or_video_path=job["image_or_video_path"])
+    except GenerationAborted as e:
+        logger.error(f"Run aborted by the 'abort' failure policy: {e}")
+        return 1
+    finally:
+        # Clear memory after all videos are generated
+        del pipe
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        gc.collect()
+
+    print(embedding_cache.stats())
+    if notifier.failures:
+        notifier.warning("Generation Complete", f"Generation finished with {notifier.failures} failed video(s).")
+    else:
+        notifier.info("Generation Complete", "All videos have been generated successfully.")
+    return notifier.exit_code()
 
 if __name__ == "__main__":
-    main()
+    try:
+        exit_code = main()
+    finally:
+        get_profiler().write_report()
+    sys.exit(exit_code)
@@ -1,8 +1,11 @@
-import argparse
 import os
+import sys
 import random
 import time
 import gc
+import functools
+import logging
+from contextlib import nullcontext
 from typing import Optional
 
 import torch
@@ -18,17 +21,63 @@ from diffusers.utils import export_to_video, load_image, load_video
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 
-from transformers import AutoTokenizer, pipeline
+from transformers import AutoTokenizer
+
+# Shared engine modules (stage profiler) live one directory up, next to TemporalPromptEngine.py
+ENGINE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
+
+from denoise_checkpoint import DenoiseCheckpoints
+from embedding_cache import EmbeddingCache
+from export_queue import ExportQueue
+from generation_jobs import (
+    GenerationAborted,
+    JobSpecError,
+    Notifier,
+    build_arg_parser,
+    configure_logging,
+    parse_range_list,
+    resolve_job,
+)
+from generation_manifest import GenerationManifest, commit_output, partial_path_for, video_key
+from memory_policy import (
+    MemoryBudget,
+    PeakMemory,
+    apply_policy,
+    choose_policy,
+    component_sizes,
+    measure_memory,
+    record_policy,
+)
+from prompt_summary import KeywordExtractor, LazySummarizer
+from prompt_truncation import PromptTruncator
+from stage_profiler import (
+    STAGE_DENOISE,
+    STAGE_EXPORT,
+    STAGE_PARSING,
+    STAGE_PIPELINE_LOAD,
+    STAGE_SUMMARIZATION,
+    STAGE_TOKENIZATION,
+    consume_profile_flag,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+    profiled,
+)
+from step_telemetry import StepTelemetry, combine_step_callbacks
+from video_encoder import EncoderSettings, clip_to_uint8, write_video
 
 # --------------------- Configuration ---------------------
 
 # Summarization settings
-TOKENIZER_NAME = "gpt2"  # Tokenizer compatible with your summarization model
+TOKENIZER_SUBFOLDER = "tokenizer"  # Prompts are measured with the video model's own T5 tokenizer
 SUMMARIZATION_MODEL = "facebook/bart-large-cnn"  # Summarization model
-POSITIVE_MAX_TOKENS = 210  # Max tokens for positive prompts
+POSITIVE_MAX_TOKENS = 226  # Max tokens for positive prompts (CogVideoX's max_sequence_length)
 NEGATIVE_MAX_TOKENS = 60   # Max tokens for negative prompts
 POSITIVE_MIN_TOKENS = 80   # Min tokens for positive prompts
 NEGATIVE_MIN_TOKENS = 30   # Min tokens for negative prompts
+FILENAME_SUMMARY = "keywords"  # Output file names from "keywords" (fast, local) or "bart" (SUMMARIZATION_MODEL)
 
 # Video generation settings
 MODEL_PATH_5B = "THUDM/CogVideoX-5b"  # Pre-trained 5b model path
@@ -40,27 +89,68 @@ INFERENCE_STEPS = [10, 20, 40, 60, 80, 100]  # Default inference steps (will be
 SEED = 1990  # Default seed value
 DTYPE = torch.bfloat16 if torch.cuda.is_available() else torch.float32
 
+# Prompt embedding cache (T5 encodings reused across sweep points and runs)
+EMBEDDING_CACHE_DIR = os.path.join(ENGINE_DIR, "embedding_cache")
+MAX_SEQUENCE_LENGTH = 226  # Token length CogVideoX encodes prompts to
+
+# Batched denoising: t2v prompts sharing a guidance scale and step count go through one pipeline call
+BATCH_SIZE = "auto"          # "auto" sizes batches to free GPU memory; an int fixes the size (1 disables batching)
+MAX_BATCH_SIZE = 8           # Upper bound for automatically sized batches
+BATCH_MEMORY_HEADROOM = 0.8  # Fraction of free GPU memory an automatic batch may plan to use
+
+# Resuming sweeps: finished videos are listed in generation_manifest.jsonl in the output directory
+SKIP_COMPLETED = True  # Skip videos the manifest lists as finished (set False to regenerate everything)
+NUM_FRAMES = 49        # Frames per t2v/i2v video; fps must be 8 for the original model
+
+# Denoising checkpoints: a crashed or preempted render resumes from its last checkpoint on the next run
+CHECKPOINT_EVERY = 10  # Steps between checkpoints of the latents and scheduler state (0 disables)
+
+# Step telemetry: per-step time and memory in <output dir>/telemetry/*.steps.jsonl, plus a per-sweep summary
+STEP_TELEMETRY = True  # Set False to skip the telemetry files
+
+# Background export: finished videos are encoded and written while the next one denoises
+EXPORT_QUEUE_SIZE = 2  # Videos that may wait for export before generation pauses (0 exports synchronously)
+
+# Video encoding: frames are streamed into ffmpeg as raw RGB (export_to_video is used when ffmpeg is missing)
+VIDEO_ENCODER = EncoderSettings(codec="libx264", crf=18, preset="medium", pix_fmt="yuv420p")
+
+# Memory policy: offloading, attention slicing and VAE slicing/tiling are chosen from the memory available
+MEMORY_BUDGET = None  # None measures this machine; (device_gb, host_gb), e.g. (24, 64), plans on the CPU for a simulated one
+
+# `--profile` records cProfile and tracemalloc data per stage and writes a report next to the videos
+if consume_profile_flag():
+    enable_profiling("TemporalCog-5b")
+
+# Errors go through the notifier: always logged, shown in message boxes only in interactive runs
+logger = logging.getLogger("TemporalCog-5b")
+notifier = Notifier(logger)
+
 # --------------------- Initialization ---------------------
 
-# Initialize the tokenizer and summarization pipeline globally to avoid reloading for each prompt
-try:
-    tokenizer = AutoTokenizer.from_pretrained(TOKENIZER_NAME)
-except Exception as e:
-    print(f"Error loading tokenizer '{TOKENIZER_NAME}': {e}")
-    tokenizer = None
-
-try:
-    summarizer = pipeline(
-        "summarization",
-        model=SUMMARIZATION_MODEL,
-        device=0 if torch.cuda.is_available() else -1
-    )
-except Exception as e:
-    print(f"Error loading summarization model '{SUMMARIZATION_MODEL}': {e}")
-    summarizer = None
+# Initialize the tokenizer globally to avoid reloading for each prompt
+with profile_stage(STAGE_PIPELINE_LOAD):
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH_5B, subfolder=TOKENIZER_SUBFOLDER)
+    except Exception as e:
+        print(f"Error loading the tokenizer of '{MODEL_PATH_5B}': {e}")
+        tokenizer = None
+
+# Counts and cuts prompts in the tokens the pipeline sees; results are cached per prompt
+prompt_truncator = PromptTruncator(tokenizer, MAX_SEQUENCE_LENGTH) if tokenizer else None
+
+# The summarization model is only loaded the first time a prompt needs it; file names use keywords
+summarizer = LazySummarizer(SUMMARIZATION_MODEL, device=0 if torch.cuda.is_available() else -1)
+keyword_extractor = KeywordExtractor(max_words=5)
+
+# Prompt embeddings are encoded once per distinct text and model, then served from memory or disk
+embedding_cache = EmbeddingCache(MODEL_PATH_5B, EMBEDDING_CACHE_DIR, MAX_SEQUENCE_LENGTH)
+
+# Highest GPU and host memory of the run, recorded with the memory policy in memory_policy.jsonl
+peak_memory = PeakMemory()
 
 # --------------------- Helper Functions ---------------------
 
+@profiled(STAGE_TOKENIZATION)
 def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> str:
     """
     Truncates the input text to fit within the specified token limit without summarizing.
@@ -72,31 +162,19 @@ def summarize_text(text: str, max_tokens: int = 220, min_tokens: int = 30) -> st
     Returns:
     - str: The text truncated to the token limit.
     """
-    if not tokenizer:
-        print("Tokenizer not initialized. Returning original text.")
-        return text
-
-    # Tokenize the input text
-    tokens = tokenizer.encode(text, return_tensors="pt")
-    num_tokens = tokens.shape[1]
-
-    # If the input is within limits, return as is
-    if num_tokens <= max_tokens:
-        return text
-
-    # Truncate the text to the maximum token limit
-    truncated_text = tokenizer.decode(tokens[0, :max_tokens], skip_special_tokens=True)
-
-    print("Prompt was too long and has been truncated to fit the model's token limit.")
-    print(f"Original Prompt Length: {num_tokens} tokens")
-    print(f"Truncated Prompt Length: {max_tokens} tokens")
-
+    truncated_text = truncate_to_token_limit(text, max_tokens)
+    if truncated_text != text:
+        print("Prompt was too long and has been truncated to fit the model's token limit.")
+        print(f"Original Prompt Length: {prompt_truncator.count(text)} tokens")
+        print(f"Truncated Prompt Length: {prompt_truncator.count(truncated_text)} tokens")
     return truncated_text
 
 
+@profiled(STAGE_TOKENIZATION)
 def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     """
-    Truncates the input text to the specified token limit, ensuring that key elements remain intact.
+    Truncates the input text to the specified token limit, cutting at the last sentence end or whole
+    word that fits.
 
     Parameters:
     - text (str): The text to truncate.
@@ -105,27 +183,12 @@ def truncate_to_token_limit(text: str, max_tokens: int) -> str:
     Returns:
     - str: The truncated text adhering to the token limit.
     """
-    # Tokenize text
-    tokens = tokenizer.encode(text, return_tensors="pt")
-    num_tokens = tokens.shape[1]
-
-    if num_tokens <= max_tokens:
-        return text  # No need to truncate
-
-    # Split text into words and truncate based on token count
-    words = text.split()
-
-    # Token limit truncation (even if breaking sentences)
-    truncated_words = []
-    for word in words:
-        truncated_words.append(word)
-        truncated_text = ' '.join(truncated_words)
-        if tokenizer.encode(truncated_text, return_tensors="pt").shape[1] > max_tokens:
-            truncated_words.pop()  # Remove the last word that exceeded the limit
-            break
-
-    return ' '.join(truncated_words)
+    if not prompt_truncator:
+        print("Tokenizer not initialized. Returning original text.")
+        return text
+    return prompt_truncator.truncate(text, max_tokens)
 
+@profiled(STAGE_SUMMARIZATION)
 def create_five_word_summary(text: str) -> str:
     """
     Creates a 5-word summary of the given text.
@@ -136,25 +199,14 @@ def create_five_word_summary(text: str) -> str:
     Returns:
     - str: A 5-word summary.
     """
-    if not summarizer:
-        print("Summarizer not initialized. Returning first 5 words.")
-        return ' '.join(text.split()[:5])
-
-    try:
+    if FILENAME_SUMMARY == "bart":
         # Summarize the text with a low max_length to aim for a short summary
-        summary = summarizer(
-            text,
-            max_length=10,  # Adjust as needed
-            min_length=5,
-            do_sample=False,
-            truncation=True,
-        )[0]['summary_text']
-        # Extract first 5 words
-        five_word_summary = ' '.join(summary.split()[:5])
-        return five_word_summary
-    except Exception as e:
-        print(f"Error during 5-word summarization: {e}")
-        return ' '.join(text.split()[:5])
+        summary = summarizer.summarize(text, max_length=10, min_length=5)
+        if summary:
+            return ' '.join(summary.split()[:5])
+        print("Summarizer not available. Using keywords instead.")
+
+    return keyword_extractor.summary(text)
 
 def create_srt_file(video_path: str, subtitle_text: str, duration: float):
     """
@@ -192,8 +244,7 @@ def create_srt_file(video_path: str, subtitle_text: str, duration: float):
         print(f"SRT file saved to: {srt_path}")
 
     except Exception as e:
-        print(f"Error creating SRT file for video '{video_path}': {e}")
-        messagebox.showerror("SRT Generation Error", f"Error creating SRT file for video '{video_path}':\n{e}")
+        notifier.error("SRT Generation Error", f"Error creating SRT file for video '{video_path}': {e}")
 
 def select_prompt_file():
     """
@@ -240,59 +291,6 @@ def sanitize_filename(filename: str):
     keepcharacters = (" ", ".", "_", "-")
     return "".join(c for c in filename if c.isalnum() or c in keepcharacters).rstrip()
 
-def parse_range_list(s: str, type_func):
-    """
-    Parses a string containing numbers and ranges into a list of numbers.
-
-    Parameters:
-    - s (str): The input string.
-    - type_func: The type to which the numbers are converted (int or float).
-
-    Returns:
-    - list: A list of numbers.
-    """
-    result = []
-    items = [item.strip() for item in s.split(',') if item.strip()]
-    for item in items:
-        if '-' in item:
-            # Range detected
-            if ':' in item:
-                # Range with step, format is start - end : step
-                range_part, step_part = item.split(':')
-                start_str, end_str = range_part.split('-')
-                start = type_func(start_str.strip())
-                end = type_func(end_str.strip())
-                step = type_func(step_part.strip())
-            else:
-                # Range without step, default step is 1 for ints, 0.1 for floats
-                start_str, end_str = item.split('-')
-                start = type_func(start_str.strip())
-                end = type_func(end_str.strip())
-                step = type_func(1) if type_func is int else type_func(0.1)
-            # Generate the range
-            if step == 0:
-                raise ValueError(f"Step cannot be zero in '{item}'")
-            elif (end - start) * step < 0:
-                raise ValueError(f"Step does not move towards end in '{item}'")
-            current = start
-            values = []
-            if step > 0:
-                while current <= end + 1e-8:  # Small epsilon to account for float errors
-                    values.append(current)
-                    current += step
-            else:
-                while current >= end - 1e-8:
-                    values.append(current)
-                    current += step  # step is negative
-            if type_func is float:
-                values = [round(v, 8) for v in values]
-            result.extend(values)
-        else:
-            # Single value
-            value = type_func(item)
-            result.append(value)
-    return result
-
 def get_parameters():
     """
     Opens a popup dialog to get parameters like guidance scales and inference steps.
@@ -352,18 +350,22 @@ def get_parameters():
 
     return guidance_scales, inference_steps
 
-def get_seed():
+def get_seeds():
     """
-    Opens a popup dialog to get the seed value.
+    Opens a popup dialog to get the seed values.
+    Accepts a single seed or several, separated by commas or as ranges ('start - end : step').
     Includes a secondary button to randomize the seed.
+
+    Returns:
+    - seeds (list of int): The seeds to generate every video with.
     """
     import tkinter as tk
     from tkinter import simpledialog, messagebox
 
     class SeedDialog(simpledialog.Dialog):
         def body(self, master):
-            self.title("Input Seed Value")
-            tk.Label(master, text="Enter Seed Value:").grid(row=0, column=0, padx=5, pady=5)
+            self.title("Input Seed Values")
+            tk.Label(master, text="Enter Seed(s):").grid(row=0, column=0, padx=5, pady=5)
             self.seed_entry = tk.Entry(master)
             self.seed_entry.grid(row=0, column=1, padx=5, pady=5)
             self.seed_entry.insert(0, str(SEED))  # Pre-fill with default SEED value
@@ -371,6 +373,10 @@ def get_seed():
             self.randomize_button = tk.Button(master, text="Randomize", command=self.randomize_seed)
             self.randomize_button.grid(row=0, column=2, padx=5, pady=5)
 
+            tk.Label(master, text="Examples: 1990  |  1990, 42, 7  |  100 - 104").grid(
+                row=1, column=0, columnspan=3, padx=5, pady=(0, 5)
+            )
+
             return self.seed_entry  # initial focus
 
         def randomize_seed(self):
@@ -381,23 +387,23 @@ def get_seed():
 
         def apply(self):
             try:
-                self.result = int(self.seed_entry.get())
+                self.result = parse_range_list(self.seed_entry.get(), int) or None
             except ValueError:
                 self.result = None
-                messagebox.showerror("Input Error", "Please enter a valid integer for the seed.")
+                messagebox.showerror("Input Error", "Please enter integer seeds, separated by commas or as ranges.")
 
     root = tk.Tk()
     root.withdraw()
 
     dialog = SeedDialog(root)
-    seed_value = dialog.result
+    seeds = dialog.result
     root.destroy()
 
-    if seed_value is None:
+    if seeds is None:
         messagebox.showwarning("No Seed Provided", "No seed value was provided. Using default seed.")
-        seed_value = SEED
+        seeds = [SEED]
 
-    return seed_value
+    return seeds
 
 def get_generation_mode():
     """
@@ -470,8 +476,139 @@ def select_output_directory(prompt_dir: str):
 
     return output_dir
 
+# --------------------- Pipeline Loading ---------------------
+
+def load_pipeline(generate_type: str = GENERATE_TYPE):
+    """
+    Loads the CogVideoX pipeline for the given generation type, with LoRA, scheduler and the memory
+    policy that suits this machine (or MEMORY_BUDGET) applied. Called once per run; the pipeline is
+    reused for every prompt and sweep point.
+
+    Parameters:
+    - generate_type (str): The type of video generation ('t2v', 'i2v', 'v2v').
+
+    Returns:
+    - tuple: The ready-to-use pipeline object and the MemoryPolicy applied to it.
+    """
+    with profile_stage(STAGE_PIPELINE_LOAD):
+        print(f"\nLoading model pipeline '{MODEL_PATH_5B}'...")
+        if generate_type == "i2v":
+            pipe = CogVideoXImageToVideoPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
+        elif generate_type == "t2v":
+            pipe = CogVideoXPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
+        elif generate_type == "v2v":
+            pipe = CogVideoXVideoToVideoPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
+        else:
+            raise ValueError(f"Invalid GENERATE_TYPE: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
+
+        # Apply LoRA weights if provided
+        if LORA_PATH:
+            if not os.path.isfile(LORA_PATH):
+                raise FileNotFoundError(f"LoRA weights file not found at: {LORA_PATH}")
+            pipe.load_lora_weights(
+                LORA_PATH,
+                weight_name="pytorch_lora_weights.safetensors",
+                adapter_name="lora_adapter",
+            )
+            pipe.fuse_lora(lora_scale=1 / LORA_RANK)
+
+        # Set Scheduler
+        pipe.scheduler = CogVideoXDPMScheduler.from_config(pipe.scheduler.config, timestep_spacing="trailing")
+
+        # Keep as much of the pipeline on the GPU as the memory allows; sequential offload only when nothing else fits
+        budget = MemoryBudget.simulated(*MEMORY_BUDGET) if MEMORY_BUDGET else measure_memory()
+        batch_size = 1 if BATCH_SIZE == "auto" else max(1, int(BATCH_SIZE))
+        policy = choose_policy(component_sizes(pipe), budget, batch_size=batch_size)
+        print(f"Memory policy: {policy.describe()}")
+        apply_policy(pipe, policy)
+
+        # Optional: Enable xformers for memory-efficient attention (if available)
+        try:
+            pipe.enable_xformers_memory_efficient_attention()
+        except Exception as e:
+            print(f"Could not enable xformers memory efficient attention: {e}")
+
+    return pipe, policy
+
+def reset_memory(pipe=None):
+    """
+    Frees what one video left behind so the next one starts from the same memory state as the
+    first, without reloading the pipeline.
+
+    Parameters:
+    - pipe (optional): The shared pipeline. Its offload hooks are reset so no model stays on the
+      GPU after a generation that failed halfway through.
+    """
+    peak_memory.observe()  # Before the peak statistics are cleared
+    if pipe is not None:
+        try:
+            pipe.maybe_free_model_hooks()
+        except Exception as e:
+            print(f"Could not reset pipeline offload hooks: {e}")
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+        torch.cuda.reset_peak_memory_stats()
+        torch.cuda.reset_accumulated_memory_stats()
+
+# --------------------- Video Export ---------------------
+
+def save_video(frames, output_path: str, prompt: str, on_saved=None):
+    """
+    Encodes generated frames to a video file and writes its .srt file. Runs on the export queue's
+    worker thread, so errors are raised to the queue instead of being reported here.
+
+    Parameters:
+    - frames (list): The generated frames.
+    - output_path (str): The path where the video will be saved.
+    - prompt (str): The subtitle text.
+    - on_saved (callable, optional): Called once the video and .srt are in place.
+    """
+    with profile_stage(STAGE_EXPORT):
+        # Written under a temporary name first, so a crash never leaves a half-written video
+        partial_path = partial_path_for(output_path)
+        write_video(frames, partial_path, fps=8, settings=VIDEO_ENCODER, fallback=export_to_video)  # fps must be 8 for the original model
+        commit_output(partial_path, output_path)
+        print(f"Video saved to: {output_path}")
+
+        # Create corresponding .srt file spanning the whole clip
+        create_srt_file(output_path, prompt, len(frames) / 8)
+    if on_saved is not None:
+        on_saved()
+
+def submit_export(export_queue: Optional[ExportQueue], frames, output_path: str, prompt: str, on_saved=None):
+    """
+    Hands a finished video to the export queue, or saves it right away when there is no queue.
+    Blocks while the queue is full.
+    """
+    if export_queue is None:
+        save_video(frames, output_path, prompt, on_saved)
+    else:
+        export_queue.submit(save_video, frames, output_path, prompt, on_saved, description=output_path)
+
+def report_export_failures(export_queue: Optional[ExportQueue]):
+    """
+    Reports the exports that failed on the queue's worker thread since the last call.
+    """
+    if export_queue is None:
+        return
+    for failure in export_queue.take_failures():
+        notifier.failure("Video Export Error", f"Error saving video '{failure.description}': {failure.error}")
+
 # --------------------- Video Generation Function ---------------------
 
+def denoise_step_inputs(checkpoint_session=None, step_recorder=None) -> dict:
+    """
+    Returns the extra pipeline arguments of one call: the latents to resume from and a step callback
+    running the checkpoint session and the telemetry recorder, whichever are given.
+    """
+    inputs = checkpoint_session.pipe_kwargs() if checkpoint_session else {}
+    callback = combine_step_callbacks(inputs.get("callback_on_step_end"), step_recorder.on_step_end if step_recorder else None)
+    if callback is not None:
+        inputs["callback_on_step_end"] = callback
+        inputs["callback_on_step_end_tensor_inputs"] = ["latents"]
+    return inputs
+
 def generate_video(
     prompt: str,
     negative_prompt: str,
@@ -482,6 +619,11 @@ def generate_video(
     num_inference_steps: int = 42,
     guidance_scale: float = 10.0,
     seed: Optional[int] = None,
+    export_queue: Optional[ExportQueue] = None,
+    on_saved=None,
+    checkpoints: Optional[DenoiseCheckpoints] = None,
+    checkpoint_key: Optional[str] = None,
+    telemetry: Optional[StepTelemetry] = None,
 ):
     """
     Generates a video based on the given prompt and saves it to the specified path.
@@ -496,170 +638,522 @@ def generate_video(
     - num_inference_steps (int): Number of steps for the inference process.
     - guidance_scale (float): The scale for classifier-free guidance.
     - seed (int, optional): The seed for reproducibility.
+    - export_queue (ExportQueue, optional): Encodes and writes the video in the background. Without
+      it the video is saved before this function returns.
+    - on_saved (callable, optional): Called once the video is saved, e.g. to record it in the manifest.
+    - checkpoints (DenoiseCheckpoints, optional): Saves the denoising state every few steps under
+      checkpoint_key, and resumes from it when a checkpoint for that key exists.
+    - checkpoint_key (str, optional): The video's key, normally its manifest key.
+    - telemetry (StepTelemetry, optional): Records the time and memory of every denoising step.
+
+    Returns:
+    - bool: True if the video was saved (or queued for export).
     """
+    video_generate = None
+    step_recorder = None
     try:
         # Set random seed for reproducibility
         generator = torch.Generator(device="cuda" if torch.cuda.is_available() else "cpu")
         if seed is not None:
             generator = generator.manual_seed(seed)
 
+        # Checkpoint the denoising loop; v2v is left out because its pipeline cuts the schedule again by strength
+        checkpoint_session = None
+        if checkpoints is not None and checkpoint_key and generate_type != "v2v":
+            checkpoint_session = checkpoints.session(pipe, [checkpoint_key], [generator], num_inference_steps)
+            on_saved = checkpoints.discard_after(checkpoint_key, on_saved)
+        if telemetry is not None:
+            step_recorder = telemetry.recorder([output_path], guidance_scale, num_inference_steps,
+                                               start_step=checkpoint_session.start_step if checkpoint_session else 0)
+        step_inputs = denoise_step_inputs(checkpoint_session, step_recorder)
+
         # Enable inference mode to reduce memory usage
         with torch.inference_mode():
-            # Generate the video frames based on the prompt
-            if generate_type == "i2v":
-                if image_or_video_path is None:
-                    raise ValueError("Image path must be provided for 'i2v' generation type.")
-                image = load_image(image=image_or_video_path)
-                if image is None:
-                    raise ValueError(f"Failed to load image from path: {image_or_video_path}")
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    image=image,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    num_frames=49,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            elif generate_type == "t2v":
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    num_frames=49,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            elif generate_type == "v2v":
-                video = load_video(image_or_video_path)
-                if video is None:
-                    raise ValueError(f"Failed to load video from path: {image_or_video_path}")
-                video_generate = pipe(
-                    prompt=prompt,
-                    negative_prompt=negative_prompt,
-                    video=video,
-                    num_videos_per_prompt=1,
-                    num_inference_steps=num_inference_steps,
-                    use_dynamic_cfg=True,
-                    guidance_scale=guidance_scale,
-                    generator=generator,
-                ).frames[0]
-            else:
-                raise ValueError(f"Invalid generate_type: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
+            # Reuse cached T5 embeddings instead of re-encoding both prompts on every call
+            prompt_inputs = embedding_cache.prompt_inputs(pipe, prompt, negative_prompt)
 
-            # Export the generated frames to a video file. fps must be 8 for original video.
-            export_to_video(video_generate, output_path, fps=8)
-            print(f"Video saved to: {output_path}")
+            # Generate the video frames based on the prompt
+            with profile_stage(STAGE_DENOISE), checkpoint_session or nullcontext():
+                if step_recorder is not None:
+                    step_recorder.start()
+                if generate_type == "i2v":
+                    if image_or_video_path is None:
+                        raise ValueError("Image path must be provided for 'i2v' generation type.")
+                    image = load_image(image=image_or_video_path)
+                    if image is None:
+                        raise ValueError(f"Failed to load image from path: {image_or_video_path}")
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        **step_inputs,
+                        image=image,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        num_frames=NUM_FRAMES,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",  # NumPy frames for the streaming encoder, skipping the PIL conversion
+                        generator=generator,
+                    ).frames[0]
+                elif generate_type == "t2v":
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        **step_inputs,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        num_frames=NUM_FRAMES,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",
+                        generator=generator,
+                    ).frames[0]
+                elif generate_type == "v2v":
+                    video = load_video(image_or_video_path)
+                    if video is None:
+                        raise ValueError(f"Failed to load video from path: {image_or_video_path}")
+                    video_generate = pipe(
+                        **prompt_inputs,
+                        **step_inputs,
+                        video=video,
+                        num_videos_per_prompt=1,
+                        num_inference_steps=num_inference_steps,
+                        use_dynamic_cfg=True,
+                        guidance_scale=guidance_scale,
+                        output_type="np",
+                        generator=generator,
+                    ).frames[0]
+                else:
+                    raise ValueError(f"Invalid generate_type: {generate_type}. Choose from 't2v', 'i2v', 'v2v'.")
 
-            # Calculate video duration based on num_frames and fps
-            num_frames = 49
-            fps = 8
-            duration_seconds = num_frames / fps
+        # The pipeline returns float32 frames; keep only their uint8 copy, a quarter of the size
+        video_generate = clip_to_uint8(video_generate)
 
-            # Create corresponding .srt file
-            create_srt_file(output_path, prompt, duration_seconds)
+        # Export the generated frames to a video file (in the background when a queue is given)
+        submit_export(export_queue, video_generate, output_path, prompt, on_saved)
+        return True
 
     except Exception as e:
-        print(f"Error generating video for prompt '{prompt}': {e}")
-        messagebox.showerror("Video Generation Error", f"Error generating video for prompt:\n{e}")
+        notifier.failure("Video Generation Error", f"Error generating video for prompt '{prompt}': {e}")
+        return False
 
     finally:
+        if step_recorder is not None:
+            step_recorder.close()
         # Delete variables to free up memory
         del video_generate
         if 'image' in locals():
             del image
         if 'video' in locals():
             del video
-        # Clear memory to prevent GPU/CPU overload
+        # Clear memory to prevent GPU/CPU overload before the next video reuses the pipeline
+        reset_memory(pipe)
+
+def generate_video_batch(
+    jobs: list,
+    pipe,
+    num_inference_steps: int,
+    guidance_scale: float,
+    manifest: Optional[GenerationManifest] = None,
+    export_queue: Optional[ExportQueue] = None,
+    checkpoints: Optional[DenoiseCheckpoints] = None,
+    telemetry: Optional[StepTelemetry] = None,
+    batch_sizer: Optional["BatchSizer"] = None,
+):
+    """
+    Generates one text-to-video clip per job in a single pipeline call and saves each to its own path.
+
+    Parameters:
+    - jobs (list): Dicts with 'prompt', 'negative_prompt', 'seed' and 'output_path'. A prompt may
+      appear several times with different seeds.
+    - pipe: The pre-loaded text-to-video pipeline object.
+    - num_inference_steps (int): Number of steps for the inference process.
+    - guidance_scale (float): The scale for classifier-free guidance.
+    - manifest (GenerationManifest, optional): Records each video (by its job's 'key') once saved.
+    - export_queue (ExportQueue, optional): Encodes and writes the videos in the background.
+    - checkpoints (DenoiseCheckpoints, optional): Saves the denoising state of each video (by its
+      job's 'key') every few steps; the batch resumes if every video in it has a checkpoint.
+    - telemetry (StepTelemetry, optional): Records the time and memory of every denoising step.
+    - batch_sizer (BatchSizer, optional): Measures the GPU memory of this batch for the next one.
+
+    Every job gets its own torch.Generator seeded with its seed, so a clip comes out the same whether
+    it was generated alone or in a batch.
+
+    Out-of-memory errors are raised to the caller so the batch can be retried smaller.
+    """
+    videos = None
+    step_recorder = None
+    try:
+        if batch_sizer is not None:
+            batch_sizer.start()
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        generators = []
+        for job in jobs:
+            generator = torch.Generator(device=device)
+            if job["seed"] is not None:
+                generator = generator.manual_seed(job["seed"])
+            generators.append(generator)
+
+        checkpoint_session = None
+        if checkpoints is not None:
+            checkpoint_session = checkpoints.session(pipe, [job["key"] for job in jobs], generators, num_inference_steps)
+        if telemetry is not None:
+            step_recorder = telemetry.recorder([job["output_path"] for job in jobs], guidance_scale, num_inference_steps,
+                                               start_step=checkpoint_session.start_step if checkpoint_session else 0)
+        step_inputs = denoise_step_inputs(checkpoint_session, step_recorder)
+
+        with torch.inference_mode():
+            inputs = [embedding_cache.prompt_inputs(pipe, job["prompt"], job["negative_prompt"]) for job in jobs]
+            if all("prompt_embeds" in item for item in inputs):
+                prompt_inputs = {
+                    "prompt_embeds": torch.cat([item["prompt_embeds"] for item in inputs]),
+                    "negative_prompt_embeds": torch.cat([item["negative_prompt_embeds"] for item in inputs]),
+                }
+            else:
+                prompt_inputs = {
+                    "prompt": [job["prompt"] for job in jobs],
+                    "negative_prompt": [job["negative_prompt"] for job in jobs],
+                }
+
+            with profile_stage(STAGE_DENOISE), checkpoint_session or nullcontext():
+                if step_recorder is not None:
+                    step_recorder.start()
+                videos = pipe(
+                    **prompt_inputs,
+                    **step_inputs,
+                    num_videos_per_prompt=1,
+                    num_inference_steps=num_inference_steps,
+                    num_frames=NUM_FRAMES,
+                    use_dynamic_cfg=True,
+                    guidance_scale=guidance_scale,
+                    output_type="np",
+                    generator=generators,
+                ).frames
+            # Measured before reset_memory() clears the peak; a resumed batch ran only part of its steps
+            if batch_sizer is not None and not (checkpoint_session and checkpoint_session.start_step):
+                batch_sizer.record(len(jobs))
+            # The pipeline returns float32 frames; keep only their uint8 copy, a quarter of the size
+            videos = clip_to_uint8(videos)
+
+        # Split the batch back into one file (and .srt) per prompt
+        for job, frames in zip(jobs, videos):
+            on_saved = None
+            if manifest is not None:
+                on_saved = functools.partial(manifest.mark_done, job["key"], job["output_path"], seed=job["seed"])
+            if checkpoints is not None:
+                on_saved = checkpoints.discard_after(job["key"], on_saved)
+            submit_export(export_queue, frames, job["output_path"], job["prompt"], on_saved)
+
+    finally:
+        if step_recorder is not None:
+            step_recorder.close()
+        del videos
+        reset_memory(pipe)
+
+class BatchSizer:
+    """
+    Chooses how many prompts go into one pipeline call.
+
+    With BATCH_SIZE = "auto" the first call runs initial_size videos (one prompt's seed list) and
+    measures the peak GPU memory per video; later batches are as large as the free memory allows
+    (within BATCH_MEMORY_HEADROOM and MAX_BATCH_SIZE). An out-of-memory error halves the size and
+    lowers the ceiling for the rest of the run. Without CUDA there is no memory to measure, so
+    automatic batches stay at initial_size.
+
+    Parameters:
+    - batch_size ("auto" or int): The configured batch size.
+    - max_batch_size (int): Upper bound for automatic sizes.
+    - initial_size (int): Automatic size used until a batch has been measured.
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE, max_batch_size=MAX_BATCH_SIZE, initial_size=1):
+        self.fixed_size = None if batch_size == "auto" else max(1, int(batch_size))
+        self.max_batch_size = max_batch_size
+        self.initial_size = max(1, initial_size)
+        self.bytes_per_video = None
+        self._start_allocated = 0
+
+    def next_size(self, remaining: int) -> int:
+        if self.fixed_size is not None:
+            return min(self.fixed_size, remaining)
+        if not torch.cuda.is_available() or self.bytes_per_video is None:
+            return max(1, min(self.initial_size, self.max_batch_size, remaining))
+        free_bytes, _ = torch.cuda.mem_get_info()
+        size = int(free_bytes * BATCH_MEMORY_HEADROOM // max(self.bytes_per_video, 1))
+        return max(1, min(size, self.max_batch_size, remaining))
+
+    def start(self):
+        # reset_memory() has cleared the peak statistics, so the next peak belongs to this batch
         if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        gc.collect()
+            self._start_allocated = torch.cuda.memory_allocated()
+
+    def record(self, size: int):
+        """
+        Takes the batch's peak GPU memory per video. Call right after the pipeline call, before
+        reset_memory() clears the peak statistics.
+        """
+        if not torch.cuda.is_available():
+            return
+        used = torch.cuda.max_memory_allocated() - self._start_allocated
+        self.bytes_per_video = max(self.bytes_per_video or 0, used / size)
+
+    def shrink(self, size: int) -> bool:
+        """
+        Lowers the batch size after an out-of-memory error. Returns False if it already was 1.
+        """
+        if size <= 1:
+            return False
+        if self.fixed_size is not None:
+            self.fixed_size = max(1, size // 2)
+        self.max_batch_size = max(1, size // 2)
+        return True
+
+def run_sweep(
+    pipe,
+    jobs: list,
+    guidance_scales: list,
+    inference_steps: list,
+    output_dir: str,
+    generate_type: str = GENERATE_TYPE,
+    seeds: Optional[list] = None,
+    manifest: Optional[GenerationManifest] = None,
+    skip_completed: bool = SKIP_COMPLETED,
+    export_queue: Optional[ExportQueue] = None,
+    checkpoints: Optional[DenoiseCheckpoints] = None,
+    telemetry: Optional[StepTelemetry] = None,
+):
+    """
+    Generates every prompt at every guidance scale, step count and seed. Text-to-video prompts are
+    batched per sweep point, with the seeds of a prompt kept together in one call where memory
+    allows; image- and video-conditioned prompts are generated one at a time.
+
+    Parameters:
+    - pipe: The pre-loaded pipeline object.
+    - jobs (list): Dicts with 'index', 'prompt', 'negative_prompt', 'safe_summary' and
+      'image_or_video_path' for each prompt.
+    - guidance_scales (list): Guidance scales to sweep.
+    - inference_steps (list): Step counts to sweep.
+    - output_dir (str): Where the videos are written.
+    - generate_type (str): The type of video generation ('t2v', 'i2v', 'v2v').
+    - seeds (list of int, optional): The seeds for reproducibility. With more than one seed, each
+      video's file name carries its seed.
+    - manifest (GenerationManifest, optional): Records finished videos in the output directory.
+    - skip_completed (bool): Skip videos the manifest already lists as finished.
+    - export_queue (ExportQueue, optional): Encodes and writes finished videos while the next ones
+      denoise. Without it every video is saved before the next one starts.
+    - checkpoints (DenoiseCheckpoints, optional): Checkpoints the denoising of each video under its
+      manifest key, so a rerun resumes interrupted videos instead of starting them over.
+    - telemetry (StepTelemetry, optional): Writes per-step telemetry for every video and, at the
+      end, the sweep summary per guidance scale and step count.
+    """
+    seeds = seeds or [None]
+    model = MODEL_PATH_5B + (f"+lora:{LORA_PATH}" if LORA_PATH else "")
+    sizer = BatchSizer(initial_size=len(seeds))
+    for gs in guidance_scales:
+        for steps in inference_steps:
+            print(f"\nGenerating {len(jobs) * len(seeds)} video(s) with guidance_scale={gs} and num_inference_steps={steps}")
+            pending = []
+            for job in jobs:
+                for seed in seeds:
+                    # Define output filename with the new naming convention
+                    seed_part = f"{seed}seed_" if len(seeds) > 1 else ""
+                    output_filename = f"video_{job['index']}_5b_{gs}gs_{steps}steps_{seed_part}{job['safe_summary']}.mp4"
+                    key = video_key(
+                        job["prompt"], job["negative_prompt"], model, gs, steps, seed, NUM_FRAMES,
+                        generate_type=generate_type, input=job["image_or_video_path"],
+                    )
+                    if skip_completed and manifest is not None and manifest.is_done(key):
+                        print(f"  - Skipping {output_filename}: already generated.")
+                        continue
+                    pending.append(dict(job, seed=seed, key=key, output_path=os.path.join(output_dir, output_filename)))
+
+            while pending:
+                if generate_type != "t2v" or pending[0]["image_or_video_path"]:
+                    job = pending.pop(0)
+                    print(f"  - Output: {job['output_path']}")
+                    on_saved = None
+                    if manifest is not None:
+                        on_saved = functools.partial(manifest.mark_done, job["key"], job["output_path"], seed=job["seed"])
+                    generate_video(
+                        prompt=job["prompt"],
+                        negative_prompt=job["negative_prompt"],
+                        generate_type=generate_type,
+                        pipe=pipe,
+                        output_path=job["output_path"],
+                        image_or_video_path=job["image_or_video_path"],
+                        num_inference_steps=steps,
+                        guidance_scale=gs,
+                        seed=job["seed"],
+                        export_queue=export_queue,
+                        on_saved=on_saved,
+                        checkpoints=checkpoints,
+                        checkpoint_key=job["key"],
+                        telemetry=telemetry,
+                    )
+                    report_export_failures(export_queue)
+                    continue
+
+                size = sizer.next_size(len(pending))
+                batch = pending[:size]
+                print(f"  - Batch of {size}: " + ", ".join(os.path.basename(job["output_path"]) for job in batch))
+                try:
+                    generate_video_batch(
+                        batch, pipe, num_inference_steps=steps, guidance_scale=gs,
+                        manifest=manifest, export_queue=export_queue, checkpoints=checkpoints, telemetry=telemetry,
+                        batch_sizer=sizer,
+                    )
+                except torch.cuda.OutOfMemoryError as e:
+                    if sizer.shrink(size):
+                        print(f"    Out of memory with {size} videos per batch; retrying with {sizer.next_size(size)}.")
+                        continue  # Retry the same prompts in a smaller batch
+                    notifier.failure("Video Generation Error", f"Error generating video for prompt '{batch[0]['prompt']}': {e}")
+                except Exception as e:
+                    notifier.failure("Video Generation Error", f"Error generating videos for batch: {e}")
+                pending = pending[size:]
+                report_export_failures(export_queue)
+
+    # Wait for the last exports so their failures are reported with this sweep
+    if export_queue is not None:
+        export_queue.join()
+        report_export_failures(export_queue)
+
+    if telemetry is not None:
+        summary_path = telemetry.write_summary()
+        if summary_path:
+            print(telemetry.format_summary())
+            print(f"Step telemetry summary written to: {summary_path}")
 
 # --------------------- Main Function ---------------------
 
 def main():
-    global SEED  # Use the global SEED variable
+    """
+    Runs one generation job. Inputs missing from the command line and job spec are asked for with
+    dialogs in interactive runs and fall back to defaults in headless ones.
+
+    Returns:
+    - int: The process exit code (0 when every video was generated).
+    """
+    args = build_arg_parser("Generate CogVideoX-5b videos from a prompt list file.").parse_args()
+    configure_logging(args.log_file)
+    try:
+        job = resolve_job(args)
+    except JobSpecError as e:
+        logger.error(str(e))
+        return 2
+    notifier.interactive = job["interactive"]
+    notifier.failure_policy = job["failure_policy"]
+    generate_type = job["generate_type"] or GENERATE_TYPE
 
     # Select the prompt list file
-    prompt_file = select_prompt_file()
+    prompt_file = job["prompt_file"]
+    if not prompt_file and notifier.interactive:
+        prompt_file = select_prompt_file()
     if not prompt_file:
-        return
+        notifier.error("No File Selected", "No prompt list file was given (--prompt-file or prompt_file in the job spec).")
+        return 1
 
     # Determine the directory of the prompt file
     prompt_dir = os.path.dirname(prompt_file)
 
     # Select the output directory
-    output_dir = select_output_directory(prompt_dir)
-
-    # Get generation mode from the user
-    generation_mode = get_generation_mode()
-    if not generation_mode:
-        return
+    output_dir = job["output_dir"]
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    elif notifier.interactive:
+        output_dir = select_output_directory(prompt_dir)
+    else:
+        output_dir = os.path.join(prompt_dir, "Generated_Videos")
+        os.makedirs(output_dir, exist_ok=True)
+    get_profiler().output_directory = output_dir
+
+    # Get generation mode from the user. Headless runs use added images when the input is a
+    # directory holding video_<n>.png files.
+    image_dir = output_dir
+    if notifier.interactive and not job["image_or_video_path"]:
+        generation_mode = get_generation_mode()
+        if not generation_mode:
+            return 1
+    elif job["image_or_video_path"] and os.path.isdir(job["image_or_video_path"]):
+        generation_mode = "added_images"
+        image_dir = job["image_or_video_path"]
+    else:
+        generation_mode = "normal"
 
     # Get parameters from the user
-    guidance_scales, inference_steps = get_parameters()
+    guidance_scales = job["guidance_scales"]
+    inference_steps = job["inference_steps"]
+    if (guidance_scales is None or inference_steps is None) and notifier.interactive:
+        dialog_scales, dialog_steps = get_parameters()
+        guidance_scales = guidance_scales or dialog_scales
+        inference_steps = inference_steps or dialog_steps
     if not guidance_scales or not inference_steps:
         # User canceled or provided invalid input
-        messagebox.showwarning("No Parameters Provided", "No parameters were provided. Using default values.")
-        guidance_scales = GUIDANCE_SCALES
-        inference_steps = INFERENCE_STEPS
+        notifier.warning("No Parameters Provided", "No parameters were provided. Using default values.")
+        guidance_scales = guidance_scales or GUIDANCE_SCALES
+        inference_steps = inference_steps or INFERENCE_STEPS
 
-    # Get seed value from the user
-    SEED = get_seed()
-    print(f"Using seed value: {SEED}")
+    # Get seed values from the user
+    seeds = job["seeds"]
+    if seeds is None:
+        seeds = get_seeds() if notifier.interactive else [SEED]
+    print(f"Using seed value(s): {', '.join(str(seed) for seed in seeds)}")
 
     # Read and parse the prompts
     try:
         with open(prompt_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
 
-        prompts = []
-        current_prompt = {}
-        for idx, line in enumerate(lines, start=1):
-            parsed = parse_prompt_line(line)
-            if "unrecognized" in parsed:
-                print(f"Warning: Unrecognized line format at line {idx}: '{line.strip()}'. Skipping.")
-                continue
-            if "delimiter" in parsed:
-                if "positive" in current_prompt and "negative" in current_prompt:
-                    prompts.append(current_prompt)
-                    current_prompt = {}
-                else:
-                    if "positive" in current_prompt:
-                        print(f"Warning: 'negative:' section missing for prompt at line {idx}. Skipping.")
-                    current_prompt = {}
-                continue
-            if "positive" in parsed:
-                if "positive" in current_prompt:
-                    print(f"Warning: New 'positive:' found before completing previous prompt at line {idx}. Skipping previous prompt.")
-                current_prompt["positive"] = parsed["positive"]
-            elif "negative" in parsed:
-                if "positive" not in current_prompt:
-                    print(f"Warning: 'negative:' section without a preceding 'positive:' at line {idx}. Skipping.")
+        with profile_stage(STAGE_PARSING):
+            prompts = []
+            current_prompt = {}
+            for idx, line in enumerate(lines, start=1):
+                parsed = parse_prompt_line(line)
+                if "unrecognized" in parsed:
+                    print(f"Warning: Unrecognized line format at line {idx}: '{line.strip()}'. Skipping.")
                     continue
-                current_prompt["negative"] = parsed["negative"]
-
-        # Handle last prompt if missing delimiter
-        if "positive" in current_prompt and "negative" in current_prompt:
-            prompts.append(current_prompt)
-        elif "positive" in current_prompt:
-            print(f"Warning: Last prompt missing 'negative:' section. Skipping.")
+                if "delimiter" in parsed:
+                    if "positive" in current_prompt and "negative" in current_prompt:
+                        prompts.append(current_prompt)
+                        current_prompt = {}
+                    else:
+                        if "positive" in current_prompt:
+                            print(f"Warning: 'negative:' section missing for prompt at line {idx}. Skipping.")
+                        current_prompt = {}
+                    continue
+                if "positive" in parsed:
+                    if "positive" in current_prompt:
+                        print(f"Warning: New 'positive:' found before completing previous prompt at line {idx}. Skipping previous prompt.")
+                    current_prompt["positive"] = parsed["positive"]
+                elif "negative" in parsed:
+                    if "positive" not in current_prompt:
+                        print(f"Warning: 'negative:' section without a preceding 'positive:' at line {idx}. Skipping.")
+                        continue
+                    current_prompt["negative"] = parsed["negative"]
+
+            # Handle last prompt if missing delimiter
+            if "positive" in current_prompt and "negative" in current_prompt:
+                prompts.append(current_prompt)
+            elif "positive" in current_prompt:
+                print(f"Warning: Last prompt missing 'negative:' section. Skipping.")
 
     except Exception as e:
-        print(f"Error reading prompt file: {e}")
-        messagebox.showerror("File Read Error", f"Error reading prompt file:\n{e}")
-        return
+        notifier.error("File Read Error", f"Error reading prompt file: {e}")
+        return 1
 
     if not prompts:
-        print("No valid prompts found in the selected file.")
-        messagebox.showinfo("No Prompts", "No valid prompts found in the selected file.")
-        return
+        notifier.error("No Prompts", "No valid prompts found in the selected file.")
+        return 1
+
+    # Load the pipeline once and reuse it for every prompt and sweep point
+    reset_memory()
+    try:
+        pipe, memory_policy = load_pipeline(generate_type)
+    except Exception as e:
+        notifier.error("Pipeline Load Error", f"Error loading the pipeline: {e}")
+        return 1
 
-    # Iterate through each prompt and generate videos
+    # Summarize each prompt and collect the videos to generate. File names use the words that set
+    # each prompt apart from the others in the file.
+    keyword_extractor.fit([prompt_data.get("positive") for prompt_data in prompts])
+    jobs = []
     for idx, prompt_data in enumerate(prompts, start=1):
         positive_prompt = prompt_data.get("positive")
         negative_prompt = prompt_data.get("negative")
@@ -674,9 +1168,9 @@ def main():
 
         if summarized_positive != positive_prompt:
             print("Positive prompt was too long and has been summarized to fit the model's token limit.")
-            if tokenizer:
-                pos_length = len(tokenizer.encode(positive_prompt))
-                summarized_pos_length = len(tokenizer.encode(summarized_positive))
+            if prompt_truncator:
+                pos_length = prompt_truncator.count(positive_prompt)
+                summarized_pos_length = prompt_truncator.count(summarized_positive)
                 print(f"Original Positive Prompt Length: {pos_length} tokens")
                 print(f"Summarized Positive Prompt Length: {summarized_pos_length} tokens")
             else:
@@ -684,9 +1178,9 @@ def main():
 
         if summarized_negative != negative_prompt:
             print("Negative prompt was too long and has been summarized to fit the model's token limit.")
-            if tokenizer:
-                neg_length = len(tokenizer.encode(negative_prompt))
-                summarized_neg_length = len(tokenizer.encode(summarized_negative))
+            if prompt_truncator:
+                neg_length = prompt_truncator.count(negative_prompt)
+                summarized_neg_length = prompt_truncator.count(summarized_negative)
                 print(f"Original Negative Prompt Length: {neg_length} tokens")
                 print(f"Summarized Negative Prompt Length: {summarized_neg_length} tokens")
             else:
@@ -700,11 +1194,12 @@ def main():
         if not safe_summary:
             safe_summary = f"summary_{idx}"
 
-        print(f"\nGenerating videos for prompt {idx}/{len(prompts)}:")
+        print(f"\nPrepared prompt {idx}/{len(prompts)}:")
         print(f"Positive Prompt: {summarized_positive}")
         print(f"Negative Prompt: {summarized_negative}")
         print(f"5-Word Summary: {five_word_summary}")
-        print(f"Output Filename: video_{idx}_5b_[gs]gs_[steps]steps_{safe_summary}.mp4")
+        seed_part = "[seed]seed_" if len(seeds) > 1 else ""
+        print(f"Output Filename: video_{idx}_5b_[gs]gs_[steps]steps_{seed_part}{safe_summary}.mp4")
 
         # Determine the image path if in 'added_images' mode
         image_path = None
@@ -712,108 +1207,67 @@ def main():
             # Look for 'video_{idx}.png' or 'video_{idx}.jpeg' in the output_dir
             possible_extensions = ['.png', '.jpeg', '.jpg']
             for ext in possible_extensions:
-                potential_path = os.path.join(output_dir, f"video_{idx}{ext}")
+                potential_path = os.path.join(image_dir, f"video_{idx}{ext}")
                 if os.path.isfile(potential_path):
                     image_path = potential_path
                     print(f"Using image for video {idx}: {potential_path}")
                     break
             if image_path is None:
-                print(f"No corresponding image found for video {idx}. Skipping this prompt.")
-                messagebox.showwarning("Image Not Found", f"No corresponding image found for video {idx} (expected 'video_{idx}.png' or 'video_{idx}.jpeg'). Skipping this prompt.")
+                notifier.warning("Image Not Found", f"No corresponding image found for video {idx} (expected 'video_{idx}.png' or 'video_{idx}.jpeg'). Skipping this prompt.")
                 continue  # Skip this prompt if image is not found
 
-        # Iterate over each guidance scale and inference step to generate multiple videos per prompt
-        for gs in guidance_scales:
-            for steps in inference_steps:
-                # Define output filename with the new naming convention
-                output_filename = f"video_{idx}_5b_{gs}gs_{steps}steps_{safe_summary}.mp4"
-                output_path = os.path.join(output_dir, output_filename)
-
-                print(f"  - Generating video with guidance_scale={gs} and num_inference_steps={steps}")
-                print(f"    Output: {output_path}")
-
-                # Clear any residual memory before loading the model
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                gc.collect()
-
-                # Load the pipeline inside the loop to clear memory between generations
-                try:
-                    print(f"Loading model pipeline '{MODEL_PATH_5B}'...")
-                    if GENERATE_TYPE == "i2v":
-                        pipe = CogVideoXImageToVideoPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
-                    elif GENERATE_TYPE == "t2v":
-                        pipe = CogVideoXPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
-                    elif GENERATE_TYPE == "v2v":
-                        pipe = CogVideoXVideoToVideoPipeline.from_pretrained(MODEL_PATH_5B, torch_dtype=DTYPE)
-                    else:
-                        raise ValueError(f"Invalid GENERATE_TYPE: {GENERATE_TYPE}. Choose from 't2v', 'i2v', 'v2v'.")
-
-                    # Apply LoRA weights if provided
-                    if LORA_PATH:
-                        if not os.path.isfile(LORA_PATH):
-                            raise FileNotFoundError(f"LoRA weights file not found at: {LORA_PATH}")
-                        pipe.load_lora_weights(
-                            LORA_PATH,
-                            weight_name="pytorch_lora_weights.safetensors",
-                            adapter_name="lora_adapter",
-                        )
-                        pipe.fuse_lora(lora_scale=1 / LORA_RANK)
-
-                    # Set Scheduler
-                    pipe.scheduler = CogVideoXDPMScheduler.from_config(pipe.scheduler.config, timestep_spacing="trailing")
-
-                    # Device Handling
-                    if torch.cuda.is_available():
-                        pipe.to("cuda")
-                    else:
-                        pipe.to("cpu")
-
-                    # Enable memory optimizations
-                    pipe.enable_sequential_cpu_offload()
-                    pipe.vae.enable_slicing()
-                    pipe.vae.enable_tiling()
-                    pipe.enable_attention_slicing("max")  # Enable attention slicing for lower memory usage
-
-                    # Optional: Enable xformers for memory-efficient attention (if available)
-                    try:
-                        pipe.enable_xformers_memory_efficient_attention()
-                    except Exception as e:
-                        print(f"Could not enable xformers memory efficient attention: {e}")
-
-                except Exception as e:
-                    print(f"Error loading the pipeline: {e}")
-                    messagebox.showerror("Pipeline Load Error", f"Error loading the pipeline:\n{e}")
-                    continue  # Skip to next iteration
-
-                # Generate the video with the current guidance_scale and num_inference_steps
-                generate_video(
-                    prompt=summarized_positive,
-                    negative_prompt=summarized_negative,
-                    generate_type=GENERATE_TYPE,
-                    pipe=pipe,
-                    output_path=output_path,
-                    image_or_video_path=image_path if generation_mode == "added_images" else None,
-                    num_inference_steps=steps,
-                    guidance_scale=gs,
-                    seed=SEED,  # Use the seed value obtained from the user
-                )
-
-                # Delete the pipeline to free up memory
-                del pipe
-
-                # Clear memory after each video generation
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                gc.collect()
-
-    # Clear memory after all videos are generated
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
-    gc.collect()
-
-    print("\nAll videos have been generated successfully.")
-    messagebox.showinfo("Generation Complete", "All videos have been generated successfully.")
+        # The sweep runs once all prompts are prepared, so prompts sharing a sweep point can be batched
+        jobs.append({
+            "index": idx,
+            "prompt": summarized_positive,
+            "negative_prompt": summarized_negative,
+            "safe_summary": safe_summary,
+            "image_or_video_path": image_path if generation_mode == "added_images" else job["image_or_video_path"],
+        })
+
+    # Iterate over each guidance scale and inference step to generate multiple videos per prompt.
+    # Finished videos are encoded on a worker thread while the next ones denoise.
+    export_queue = ExportQueue(EXPORT_QUEUE_SIZE)
+    checkpoints = DenoiseCheckpoints(output_dir, every=CHECKPOINT_EVERY) if CHECKPOINT_EVERY else None
+    telemetry = StepTelemetry(output_dir, policy=memory_policy.name) if STEP_TELEMETRY else None
+    try:
+        run_sweep(
+            pipe,
+            jobs,
+            guidance_scales,
+            inference_steps,
+            output_dir,
+            generate_type=generate_type,
+            seeds=seeds,  # Use the seed values obtained from the user
+            manifest=GenerationManifest(output_dir),
+            export_queue=export_queue,
+            checkpoints=checkpoints,
+            telemetry=telemetry,
+        )
+    except GenerationAborted as e:
+        logger.error(f"Run aborted by the 'abort' failure policy: {e}")
+        return 1
+    finally:
+        # Finish the queued exports, then release the pipeline once all videos are generated
+        export_queue.close()
+        del pipe
+        reset_memory()
+        record_policy(output_dir, memory_policy, peak_memory, model=MODEL_PATH_5B, generate_type=generate_type)
+
+    print(embedding_cache.stats())
+    print(f"Exported {export_queue.completed} video(s) in the background; generation waited "
+          f"{export_queue.wait_seconds:.1f}s for the export queue.")
+    if checkpoints is not None and checkpoints.resumed:
+        print(f"Resumed {checkpoints.resumed} video(s) from denoising checkpoints.")
+    if notifier.failures:
+        notifier.warning("Generation Complete", f"Generation finished with {notifier.failures} failed video(s).")
+    else:
+        notifier.info("Generation Complete", "All videos have been generated successfully.")
+    return notifier.exit_code()
 
 if __name__ == "__main__":
-    main()
+    try:
+        exit_code = main()
+    finally:
+        get_profiler().write_report()
+    sys.exit(exit_code)
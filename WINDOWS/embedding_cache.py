@@ -0,0 +1,142 @@
+"""
+Text-embedding cache for the CogVideoX generator scripts.
+
+CogVideoX pipelines run every prompt and negative prompt through the T5 text encoder on each call,
+so a sweep over guidance scales and step counts encodes the same strings again and again, which is
+slow under enable_sequential_cpu_offload. EmbeddingCache encodes each distinct text once and hands
+the pipeline prompt_embeds / negative_prompt_embeds instead of strings.
+
+Entries are keyed by model, text, max sequence length and dtype. Recently used ones stay in memory
+(on the CPU) and every entry is also written to <directory>/<key>.safetensors, so later runs start
+warm. Delete the directory to clear the cache.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+import torch
+
+from stage_profiler import STAGE_TEXT_ENCODER, profile_stage
+
+DEFAULT_MAX_SEQUENCE_LENGTH = 226  # CogVideoX's T5 prompt length
+DEFAULT_MEMORY_ENTRIES = 64  # About 1.8 MB per bf16 entry at 226 tokens
+EMBEDDING_TENSOR_NAME = "prompt_embeds"
+
+
+class EmbeddingCache:
+    """
+    Memory and disk cache of CogVideoX prompt embeddings.
+
+    Args:
+        model_id (str): Model path or hub id the embeddings belong to.
+        directory (str): Where .safetensors entries are kept (None keeps the cache in memory only).
+        max_sequence_length (int): Token length the prompts are encoded to.
+        max_memory_entries (int): Entries kept in memory; the least recently used are dropped first.
+    """
+
+    def __init__(self, model_id, directory=None, max_sequence_length=DEFAULT_MAX_SEQUENCE_LENGTH,
+                 max_memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.model_id = model_id
+        self.directory = directory
+        self.max_sequence_length = max_sequence_length
+        self.max_memory_entries = max_memory_entries
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, text, dtype=None):
+        """
+        Returns the cache key of a text for this model, sequence length and dtype.
+        """
+        source = "\0".join((self.model_id, str(self.max_sequence_length), str(dtype), text))
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.safetensors")
+
+    def _remember(self, key, embeds):
+        self._entries[key] = embeds
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_memory_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key):
+        if not self.directory or not os.path.isfile(self._path(key)):
+            return None
+        from safetensors.torch import load_file
+        try:
+            return load_file(self._path(key))[EMBEDDING_TENSOR_NAME]
+        except Exception as e:
+            print(f"Ignoring unreadable embedding cache entry {self._path(key)}: {e}")
+            return None
+
+    def _store(self, key, embeds, text):
+        if not self.directory:
+            return
+        from safetensors.torch import save_file
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        metadata = {"model": self.model_id, "max_sequence_length": str(self.max_sequence_length), "text": text[:1000]}
+        try:
+            save_file({EMBEDDING_TENSOR_NAME: embeds.contiguous()}, temp_path, metadata=metadata)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Could not write embedding cache entry {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def get(self, pipe, text):
+        """
+        Returns the embedding of text on the pipeline's execution device, encoding it only if it is
+        neither in memory nor on disk.
+        """
+        device = pipe._execution_device
+        dtype = pipe.text_encoder.dtype if getattr(pipe, "text_encoder", None) is not None else None
+        key = self.key(text, dtype)
+
+        embeds = self._entries.get(key)
+        if embeds is not None:
+            self.memory_hits += 1
+        else:
+            embeds = self._load(key)
+            if embeds is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                with profile_stage(STAGE_TEXT_ENCODER), torch.inference_mode():
+                    encoded = pipe.encode_prompt(
+                        prompt=text,
+                        do_classifier_free_guidance=False,
+                        num_videos_per_prompt=1,
+                        max_sequence_length=self.max_sequence_length,
+                        device=device,
+                    )[0]
+                embeds = encoded.detach().to("cpu")
+                self._store(key, embeds, text)
+        self._remember(key, embeds)
+        return embeds.to(device)
+
+    def prompt_inputs(self, pipe, prompt, negative_prompt):
+        """
+        Returns the prompt arguments for a pipeline call: prompt_embeds and negative_prompt_embeds
+        from the cache, or the plain strings if the pipeline cannot encode prompts separately.
+        """
+        try:
+            return {
+                "prompt_embeds": self.get(pipe, prompt),
+                "negative_prompt_embeds": self.get(pipe, negative_prompt or ""),
+            }
+        except Exception as e:
+            print(f"Embedding cache unavailable, passing prompts as text: {e}")
+            return {"prompt": prompt, "negative_prompt": negative_prompt}
+
+    def stats(self):
+        """
+        Returns a one-line summary of hits and misses.
+        """
+        return (f"Embedding cache: {self.memory_hits} memory hits, {self.disk_hits} disk hits, "
+                f"{self.misses} encoded")
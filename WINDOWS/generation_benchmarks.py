@@ -0,0 +1,573 @@
+"""
+End-to-end CPU benchmark of the CogVideoX generation path.
+
+Builds a miniature, randomly initialised CogVideoX pipeline (a one-layer transformer, a four-block
+VAE with 8 channels, a one-layer T5 encoder and a word-level tokenizer over the benchmark prompts),
+saves it to a temporary model directory and drives the real TemporalCog-5b.py code with it:
+load_pipeline() with its memory policy, one generate_video() call, then run_sweep() over several
+prompts, seeds, guidance scales and step counts with batching, the embedding cache, denoising
+checkpoints, the manifest, the background export queue and step telemetry all switched on. Nothing
+is downloaded and no GPU is needed, so it runs anywhere torch, diffusers and transformers are
+installed, in well under a minute.
+
+Two checks follow the sweep. FakeCudaMemory stands in for the torch.cuda memory calls so that code
+paths which only run on a GPU can be exercised on the CPU:
+
+    - batch sizing: generate_video_batch() must measure each batch's peak memory per video before
+      reset_memory() clears it, so the next batch is sized to the free memory, and must not measure
+      a batch resumed from a denoising checkpoint;
+    - memory policy: choose_policy() must pick the expected policy for simulated machines, and
+      apply_policy() must leave the pipeline on the CPU for a simulated budget even though CUDA
+      appears to be available.
+
+--memory-budget DEVICE_GB HOST_GB runs the whole benchmark under that simulated budget instead of
+the CPU policy and fails unless the pipeline stayed on the CPU.
+
+Reported: pipeline load time, seconds per denoising step (mean and p95, from the step telemetry),
+export time per video, sweep wall time, embedding cache hits and peak RSS. The run fails when a
+video is missing or a generation error was reported, and, given a baseline, when a timing grows by
+more than its threshold. Timings are raw seconds, so record the baseline on the machine that
+compares against it.
+
+    python generation_benchmarks.py            # compare against generation_benchmarks_baseline.json
+    python generation_benchmarks.py --record   # record a new baseline
+    python generation_benchmarks.py --memory-budget 24 64   # plan for a 24 GB card and 64 GB of RAM
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATH = os.path.join(BASE_DIR, "VideoGeneratorUtilities", "TemporalCog-5b.py")
+BASELINE_FILE = os.path.join(BASE_DIR, "generation_benchmarks_baseline.json")
+
+DEFAULT_THRESHOLD = 0.5  # Allowed growth over the baseline (0.5 = 50%); tiny CPU runs are noisy
+MODEL_SEED = 1990
+
+# Miniature model: 9 frames of 32x32 pixels become 3 latent frames of 4x4
+NUM_FRAMES = 9
+SAMPLE_SIZE = 4  # Latent height and width
+TEXT_LENGTH = 16  # Prompt tokens; replaces the 226 of the real model
+PROMPTS = 4
+SEEDS = [1990, 1991]
+GUIDANCE_SCALES = [6.0, 7.0]
+INFERENCE_STEPS = [4, 8]
+CHECKPOINT_EVERY = 2
+
+GIB = 1024 ** 3
+FAKE_ALLOCATED_BYTES = 1 * GIB  # Memory FakeCudaMemory reports as allocated between batches
+FAKE_BYTES_PER_SAMPLE = 1 * GIB  # What FakeCudaMemory "allocates" per sample of a transformer call
+FAKE_FREE_BYTES = 10 * GIB  # Free device memory FakeCudaMemory reports
+
+# Simulated machines for choose_policy(): (device GB or None, host GB), the expected policy and a
+# phrase its reason must contain. The component sizes are those of CogVideoX-5b in bfloat16.
+POLICY_COMPONENT_GB = {"transformer": 11, "text_encoder": 9, "vae": 1}
+POLICY_CASES = (
+    ((80, 128), "full", "fit in"),
+    ((24, 64), "model_offload", "does not"),
+    ((8, 64), "sequential_offload", "exceed"),
+    ((24, 16), "sequential_offload", "host RAM"),  # The card would do, the RAM cannot hold the offloaded weights
+    ((None, 64), "cpu", "no CUDA device"),
+)
+
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED_METRICS = ("load_seconds", "mean_seconds_per_step", "export_seconds_per_video", "sweep_seconds")
+
+POSITIVE_WORDS = (
+    "cinematic sweeping dolly shot golden hour misty harbor lighthouse weathered fisherman wool sweater "
+    "kodachrome grain anamorphic lens flare neon rain alley vintage convertible chrome hedgehog meadow"
+).split()
+NEGATIVE_WORDS = "avoid blurry deformed cluttered background watermark text low resolution oversaturated".split()
+
+
+# --------------------- Miniature model ---------------------
+
+def build_tokenizer():
+    """
+    Returns a word-level fast tokenizer over the benchmark words that pads and ends sequences like T5's.
+    """
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+    from transformers import PreTrainedTokenizerFast
+
+    vocab = {"<pad>": 0, "</s>": 1, "<unk>": 2}
+    for word in POSITIVE_WORDS + NEGATIVE_WORDS:
+        vocab.setdefault(word, len(vocab))
+    backend = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    backend.post_processor = processors.TemplateProcessing(single="$A </s>", special_tokens=[("</s>", 1)])
+    return PreTrainedTokenizerFast(
+        tokenizer_object=backend, pad_token="<pad>", eos_token="</s>", unk_token="<unk>",
+        model_max_length=TEXT_LENGTH,
+    )
+
+
+def build_tiny_pipeline(directory):
+    """
+    Saves a randomly initialised miniature CogVideoX text-to-video pipeline to directory.
+    """
+    import torch
+    from diffusers import AutoencoderKLCogVideoX, CogVideoXDDIMScheduler, CogVideoXPipeline, CogVideoXTransformer3DModel
+    from transformers import T5Config, T5EncoderModel
+
+    torch.manual_seed(MODEL_SEED)
+    tokenizer = build_tokenizer()
+    text_encoder = T5EncoderModel(T5Config(
+        vocab_size=len(tokenizer), d_model=32, d_kv=8, d_ff=37, num_layers=1, num_heads=4,
+        relative_attention_num_buckets=8, pad_token_id=0, eos_token_id=1, decoder_start_token_id=0,
+    ))
+    transformer = CogVideoXTransformer3DModel(
+        num_attention_heads=4, attention_head_dim=8, in_channels=4, out_channels=4, time_embed_dim=2,
+        text_embed_dim=32, num_layers=1, sample_width=SAMPLE_SIZE, sample_height=SAMPLE_SIZE,
+        sample_frames=NUM_FRAMES, patch_size=2, temporal_compression_ratio=4, max_text_seq_length=TEXT_LENGTH,
+    )
+    vae = AutoencoderKLCogVideoX(
+        in_channels=3, out_channels=3,
+        down_block_types=("CogVideoXDownBlock3D",) * 4, up_block_types=("CogVideoXUpBlock3D",) * 4,
+        block_out_channels=(8, 8, 8, 8), latent_channels=4, layers_per_block=1, norm_num_groups=2,
+        temporal_compression_ratio=4,
+    )
+    pipe = CogVideoXPipeline(
+        tokenizer=tokenizer, text_encoder=text_encoder, transformer=transformer, vae=vae,
+        scheduler=CogVideoXDDIMScheduler(),
+    )
+    pipe.save_pretrained(directory)
+    return directory
+
+
+def benchmark_prompts(count=PROMPTS):
+    """
+    Returns count distinct (positive, negative) prompt pairs of at most TEXT_LENGTH - 1 words.
+    """
+    prompts = []
+    for index in range(count):
+        positive = [POSITIVE_WORDS[(index * 5 + offset) % len(POSITIVE_WORDS)] for offset in range(10)]
+        negative = NEGATIVE_WORDS[index % 3:index % 3 + 4]
+        prompts.append((" ".join(positive), " ".join(negative)))
+    return prompts
+
+
+# --------------------- Generator script ---------------------
+
+def load_generator_script(model_dir, work_dir):
+    """
+    Imports TemporalCog-5b.py and points it at the miniature model: its model path, frame count,
+    prompt length and embedding cache directory are replaced, and it runs headless.
+    """
+    # The script loads the real tokenizer at import time; offline that fails fast and is reported
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    spec = importlib.util.spec_from_file_location("temporal_cog_5b", SCRIPT_PATH)
+    cog = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(cog)
+
+    from embedding_cache import EmbeddingCache
+
+    cog.MODEL_PATH_5B = model_dir
+    cog.LORA_PATH = None
+    cog.MEMORY_BUDGET = None
+    cog.NUM_FRAMES = NUM_FRAMES
+    cog.MAX_SEQUENCE_LENGTH = TEXT_LENGTH
+    cog.embedding_cache = EmbeddingCache(model_dir, os.path.join(work_dir, "embedding_cache"), TEXT_LENGTH)
+    cog.notifier.interactive = False
+    return cog
+
+
+def pipeline_devices(pipe):
+    """
+    Returns the device types holding the parameters of the pipeline's model components.
+    """
+    return {parameter.device.type for component in pipe.components.values() if hasattr(component, "parameters")
+            for parameter in component.parameters()}
+
+
+def _timed(function, timings):
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings.append(time.perf_counter() - started)
+    return timed
+
+
+# --------------------- Checks ---------------------
+
+class FakeCudaMemory:
+    """
+    Makes torch.cuda look available on a CPU-only machine, for the memory calls only.
+
+    is_available() returns True, mem_get_info() reports free_bytes, memory_allocated() reports
+    allocated_bytes, and every forward call of the pipeline's transformer "allocates" bytes_per_sample
+    per sample of its batch, which max_memory_allocated() reports until reset_peak_memory_stats().
+    Generators requested on "cuda" are created on the CPU. Nothing is ever placed on a device, so
+    code that would really move tensors to the GPU fails.
+    """
+
+    PATCHED = ("is_available", "mem_get_info", "memory_allocated", "max_memory_allocated", "reset_peak_memory_stats",
+               "reset_accumulated_memory_stats", "empty_cache", "synchronize")
+
+    def __init__(self, torch, pipe, bytes_per_sample=FAKE_BYTES_PER_SAMPLE, free_bytes=FAKE_FREE_BYTES,
+                 allocated_bytes=FAKE_ALLOCATED_BYTES):
+        self.torch = torch
+        self.pipe = pipe
+        self.bytes_per_sample = bytes_per_sample
+        self.free_bytes = free_bytes
+        self.allocated_bytes = allocated_bytes
+        self.peak_bytes = allocated_bytes
+        self._originals = {}
+        self._generator = None
+        self._hook = None
+
+    def _transformer_called(self, module, args, kwargs):
+        hidden_states = kwargs.get("hidden_states", args[0] if args else None)
+        self.peak_bytes = max(self.peak_bytes, self.allocated_bytes + hidden_states.shape[0] * self.bytes_per_sample)
+
+    def _reset_peak(self, device=None):
+        self.peak_bytes = self.allocated_bytes
+
+    def __enter__(self):
+        fakes = {
+            "is_available": lambda: True,
+            "mem_get_info": lambda device=None: (self.free_bytes, self.free_bytes + self.allocated_bytes),
+            "memory_allocated": lambda device=None: self.allocated_bytes,
+            "max_memory_allocated": lambda device=None: self.peak_bytes,
+            "reset_peak_memory_stats": self._reset_peak,
+            "reset_accumulated_memory_stats": lambda device=None: None,
+            "empty_cache": lambda: None,
+            "synchronize": lambda device=None: None,
+        }
+        for name in self.PATCHED:
+            self._originals[name] = getattr(self.torch.cuda, name)
+            setattr(self.torch.cuda, name, fakes[name])
+        generator = self._generator = self.torch.Generator
+        self.torch.Generator = lambda device="cpu": generator(device="cpu")
+        self._hook = self.pipe.transformer.register_forward_pre_hook(self._transformer_called, with_kwargs=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._hook.remove()
+        self.torch.Generator = self._generator
+        for name, original in self._originals.items():
+            setattr(self.torch.cuda, name, original)
+        self._originals = {}
+
+
+def check_batch_sizer(cog, pipe, work_dir, num_inference_steps=4):
+    """
+    Runs two generate_video_batch() calls under FakeCudaMemory: a fresh batch, which must be measured
+    at its real peak per video so the next size follows the free memory, and the same batch resumed
+    from its checkpoints, which must not be measured.
+
+    Returns:
+        list: Failure messages, empty if the check passed.
+    """
+    import torch
+    from denoise_checkpoint import DenoiseCheckpoints
+
+    directory = os.path.join(work_dir, "batch_sizer")
+    os.makedirs(directory, exist_ok=True)
+    positive, negative = benchmark_prompts(1)[0]
+    jobs = [
+        {"prompt": positive, "negative_prompt": negative, "seed": seed, "key": f"batch_sizer_{seed}",
+         "output_path": os.path.join(directory, f"batch_sizer_{seed}.mp4")}
+        for seed in SEEDS
+    ]
+    guidance_scale = GUIDANCE_SCALES[0]  # Above 1, so classifier-free guidance runs every video twice
+    expected_bytes = 2 * FAKE_BYTES_PER_SAMPLE
+    expected_size = max(1, min(int(FAKE_FREE_BYTES * cog.BATCH_MEMORY_HEADROOM // expected_bytes), cog.MAX_BATCH_SIZE))
+
+    failures = []
+    save_video = cog.save_video
+    cog.save_video = lambda frames, output_path, prompt, on_saved=None: None  # Keeps the batch's checkpoints
+    try:
+        with FakeCudaMemory(torch, pipe):
+            checkpoints = DenoiseCheckpoints(directory, every=CHECKPOINT_EVERY)
+            sizer = cog.BatchSizer("auto", initial_size=len(jobs))
+            cog.generate_video_batch(jobs, pipe, num_inference_steps, guidance_scale, checkpoints=checkpoints,
+                                     batch_sizer=sizer)
+            if sizer.bytes_per_video is None or abs(sizer.bytes_per_video - expected_bytes) > expected_bytes * 0.01:
+                failures.append(f"batch sizer measured {sizer.bytes_per_video} bytes per video, expected {expected_bytes}")
+            size = sizer.next_size(cog.MAX_BATCH_SIZE * 4)
+            if size != expected_size:
+                failures.append(f"next batch size is {size}, expected {expected_size} for the free memory")
+
+            resumed = cog.BatchSizer("auto", initial_size=len(jobs))
+            cog.generate_video_batch(jobs, pipe, num_inference_steps, guidance_scale, checkpoints=checkpoints,
+                                     batch_sizer=resumed)
+            if checkpoints.resumed != len(jobs):
+                failures.append(f"{checkpoints.resumed} of {len(jobs)} videos resumed from their checkpoints")
+            elif resumed.bytes_per_video is not None:
+                failures.append("a batch resumed from a checkpoint was measured")
+    except Exception as e:
+        failures.append(f"batch sizing check could not run: {e}")
+    finally:
+        cog.save_video = save_video
+    return failures
+
+
+def check_memory_policies(pipe):
+    """
+    Checks choose_policy() against the simulated machines of POLICY_CASES, and that apply_policy()
+    keeps the pipeline on the CPU for each simulated budget while CUDA appears to be available.
+
+    Returns:
+        list: Failure messages, empty if the check passed.
+    """
+    import torch
+    from memory_policy import MemoryBudget, apply_policy, choose_policy
+
+    sizes = {name: size * GIB for name, size in POLICY_COMPONENT_GB.items()}
+    failures = []
+    for (device_gb, host_gb), expected, reason in POLICY_CASES:
+        policy = choose_policy(sizes, MemoryBudget.simulated(device_gb, host_gb))
+        machine = f"{device_gb} GB device / {host_gb} GB host"
+        if policy.name != expected or reason not in policy.reason:
+            failures.append(f"{machine}: chose {policy.name} ({policy.reason}), expected {expected} ({reason})")
+        with FakeCudaMemory(torch, pipe):
+            try:
+                apply_policy(pipe, policy)
+            except Exception as e:
+                failures.append(f"{machine}: apply_policy() of {policy.name} touched the GPU: {e}")
+                continue
+        devices = pipeline_devices(pipe)
+        if devices != {"cpu"}:
+            failures.append(f"{machine}: apply_policy() of {policy.name} left the pipeline on {', '.join(sorted(devices))}")
+    return failures
+
+
+# --------------------- Benchmark ---------------------
+
+def run_benchmark(work_dir, prompts=PROMPTS, seeds=SEEDS, guidance_scales=GUIDANCE_SCALES, inference_steps=INFERENCE_STEPS,
+                  memory_budget=None):
+    """
+    Builds the miniature model, loads it through the generator script and generates one video with
+    generate_video() and a full sweep with run_sweep(), then runs the batch sizing and memory policy
+    checks on the loaded pipeline.
+
+    Args:
+        memory_budget (tuple): (device_gb, host_gb) to plan the memory policy for, or None for this machine.
+
+    Returns:
+        dict: The measured metrics, the expected and written video counts, the failures reported
+        and the failed checks.
+    """
+    from denoise_checkpoint import DenoiseCheckpoints
+    from export_queue import ExportQueue
+    from generation_manifest import PARTIAL_SUFFIX, GenerationManifest
+    from step_telemetry import StepTelemetry
+
+    model_dir = build_tiny_pipeline(os.path.join(work_dir, "model"))
+    cog = load_generator_script(model_dir, work_dir)
+    cog.MEMORY_BUDGET = memory_budget
+    output_dir = os.path.join(work_dir, "videos")
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Export runs on the queue's worker thread; timing save_video there measures encoding and .srt writing
+    export_timings = []
+    cog.save_video = _timed(cog.save_video, export_timings)
+
+    started = time.perf_counter()
+    pipe, policy = cog.load_pipeline("t2v")
+    load_seconds = time.perf_counter() - started
+    check_failures = []
+    if memory_budget is not None and pipeline_devices(pipe) != {"cpu"}:
+        check_failures.append(f"the simulated budget {memory_budget} moved the pipeline off the CPU")
+
+    telemetry = StepTelemetry(output_dir, policy=policy.name)
+    pairs = benchmark_prompts(prompts)
+    positive, negative = pairs[0]
+    started = time.perf_counter()
+    single_ok = cog.generate_video(
+        positive, negative, "t2v", pipe, os.path.join(output_dir, "single.mp4"),
+        num_inference_steps=inference_steps[0], guidance_scale=guidance_scales[0], seed=seeds[0],
+        telemetry=telemetry,
+    )
+    single_seconds = time.perf_counter() - started
+
+    jobs = [
+        {"index": index, "prompt": positive, "negative_prompt": negative,
+         "safe_summary": f"bench{index}", "image_or_video_path": None}
+        for index, (positive, negative) in enumerate(pairs, start=1)
+    ]
+    export_queue = ExportQueue(cog.EXPORT_QUEUE_SIZE)
+    started = time.perf_counter()
+    try:
+        cog.run_sweep(
+            pipe, jobs, guidance_scales, inference_steps, output_dir,
+            generate_type="t2v", seeds=seeds, manifest=GenerationManifest(output_dir),
+            export_queue=export_queue, checkpoints=DenoiseCheckpoints(output_dir, every=CHECKPOINT_EVERY),
+            telemetry=telemetry,
+        )
+    finally:
+        export_queue.close()
+    sweep_seconds = time.perf_counter() - started
+
+    rows = telemetry.summary()
+    steps = sum(row["steps"] - row["calls"] for row in rows)
+    step_seconds = sum((row["mean_seconds_per_step"] or 0) * (row["steps"] - row["calls"]) for row in rows)
+    expected = 1 + len(jobs) * len(seeds) * len(guidance_scales) * len(inference_steps)
+    written = len([name for name in os.listdir(output_dir)
+                   if name.endswith(".mp4") and not name.endswith(PARTIAL_SUFFIX + ".mp4")])
+    cog.peak_memory.observe()
+    results = {
+        "load_seconds": load_seconds,
+        "single_video_seconds": single_seconds if single_ok else None,
+        "sweep_seconds": sweep_seconds,
+        "mean_seconds_per_step": step_seconds / steps if steps else None,
+        "p95_seconds_per_step": max((row["p95_seconds_per_step"] or 0) for row in rows) if rows else None,  # Worst sweep point
+        "export_seconds_per_video": sum(export_timings) / len(export_timings) if export_timings else None,
+        "peak_rss_bytes": cog.peak_memory.host_bytes,
+        "peak_device_bytes": cog.peak_memory.device_bytes,
+        "memory_policy": policy.name,
+        "embedding_cache": cog.embedding_cache.stats(),
+        "videos_expected": expected,
+        "videos_written": written,
+        "failures": cog.notifier.failures,
+    }
+
+    # After the metrics are taken: the checks fake device memory and generate further videos
+    check_failures += check_batch_sizer(cog, pipe, work_dir)
+    check_failures += check_memory_policies(pipe)
+    results["check_failures"] = check_failures
+    del pipe
+    cog.reset_memory()
+    return results
+
+
+# --------------------- Baseline ---------------------
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def record_baseline(results, path=BASELINE_FILE, previous=None):
+    """
+    Writes the compared metrics as the new baseline, keeping per-metric thresholds from the previous file.
+    """
+    previous_entries = (previous or {}).get("metrics", {})
+    entries = {}
+    for name in COMPARED_METRICS:
+        if results.get(name) is None:
+            continue
+        entry = {"value": round(results[name], 6)}
+        if "threshold" in previous_entries.get(name, {}):
+            entry["threshold"] = previous_entries[name]["threshold"]
+        entries[name] = entry
+    baseline = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+        "threshold": (previous or {}).get("threshold", DEFAULT_THRESHOLD),
+        "metrics": entries,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+        f.write("\n")
+    return baseline
+
+
+def compare(results, baseline, threshold=None):
+    """
+    Compares the timings against the baseline.
+
+    Returns:
+        list: (name, ratio or None, allowed ratio or None, status) per metric, status being "ok",
+        "REGRESSION", "new" or "skipped".
+    """
+    rows = []
+    entries = baseline.get("metrics", {}) if baseline else {}
+    for name in COMPARED_METRICS:
+        value = results.get(name)
+        if value is None:
+            rows.append((name, None, None, "skipped"))
+            continue
+        entry = entries.get(name)
+        if entry is None:
+            rows.append((name, None, None, "new"))
+            continue
+        allowed = threshold
+        if allowed is None:
+            allowed = entry.get("threshold", baseline.get("threshold", DEFAULT_THRESHOLD))
+        ratio = value / entry["value"] if entry["value"] else None
+        status = "REGRESSION" if ratio is not None and ratio > 1.0 + allowed else "ok"
+        rows.append((name, ratio, 1.0 + allowed, status))
+    return rows
+
+
+def _format_value(name, value):
+    if value is None:
+        return "-"
+    if name.endswith("_bytes"):
+        return f"{value / 1024 ** 2:.1f} MB"
+    if name.endswith("_seconds") or "_seconds_" in name:
+        return f"{value * 1000:.1f} ms" if value < 1 else f"{value:.2f} s"
+    return str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CogVideoX generation path with a miniature model on CPU.")
+    parser.add_argument("--record", action="store_true", help="Record the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, help="Override the allowed slowdown, e.g. 0.5 for 50%%.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare against or record.")
+    parser.add_argument("--prompts", type=int, default=PROMPTS, help="Prompts in the sweep.")
+    parser.add_argument("--steps", type=int, nargs="+", default=INFERENCE_STEPS, help="Step counts of the sweep.")
+    parser.add_argument("--memory-budget", type=float, nargs=2, metavar=("DEVICE_GB", "HOST_GB"),
+                        help="Plan the memory policy for this simulated machine instead of this one.")
+    parser.add_argument("--work-dir", help="Keep the model, videos and telemetry in this directory instead of a temporary one.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    if args.work_dir:
+        os.makedirs(args.work_dir, exist_ok=True)
+        results = run_benchmark(args.work_dir, prompts=args.prompts, inference_steps=args.steps,
+                                memory_budget=args.memory_budget)
+    else:
+        with tempfile.TemporaryDirectory(prefix="generation_benchmark_") as work_dir:
+            results = run_benchmark(work_dir, prompts=args.prompts, inference_steps=args.steps,
+                                    memory_budget=args.memory_budget)
+    baseline = load_baseline(args.baseline)
+
+    if args.record:
+        record_baseline(results, args.baseline, previous=baseline)
+        print(f"Baseline recorded to {args.baseline}")
+
+    rows = compare(results, None if args.record else baseline, args.threshold)
+    if args.json:
+        print(json.dumps({"results": results,
+                          "comparison": [dict(zip(("name", "ratio", "allowed", "status"), row)) for row in rows]}, indent=4))
+    else:
+        for name in ("single_video_seconds", "p95_seconds_per_step", "peak_rss_bytes", "peak_device_bytes",
+                     "memory_policy", "embedding_cache"):
+            print(f"{name:<28}{_format_value(name, results[name])}")
+        print(f"{'videos':<28}{results['videos_written']}/{results['videos_expected']} written, "
+              f"{results['failures']} failure(s)")
+        print(f"\n{'metric':<28}{'value':>12}{'vs base':>9}{'limit':>8}  status")
+        for name, ratio, allowed, status in rows:
+            ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+            allowed_text = f"{allowed:.2f}x" if allowed is not None else "-"
+            print(f"{name:<28}{_format_value(name, results[name]):>12}{ratio_text:>9}{allowed_text:>8}  {status}")
+        if baseline is None and not args.record:
+            print(f"No baseline at {args.baseline}; run with --record to create one.")
+
+    for failure in results["check_failures"]:
+        print(f"Check failed: {failure}")
+    incomplete = results["failures"] or results["videos_written"] < results["videos_expected"]
+    if incomplete:
+        print("Generation path broken: not every video was generated.")
+    if incomplete or results["check_failures"] or any(status == "REGRESSION" for _, _, _, status in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
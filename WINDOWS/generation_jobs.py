@@ -0,0 +1,291 @@
+"""
+Command line and JSON job specs for the CogVideoX generator scripts.
+
+Run without arguments, TemporalCog-2b.py and TemporalCog-5b.py ask for everything through Tk
+dialogs, as before. Given --job, --headless or any job option (--prompt-file, --seeds, ...) they run
+unattended: every input comes from the command line and/or a JSON job spec, settings left out fall
+back to their defaults (the prompt file is required), errors are logged instead of shown in message
+boxes, and the exit code tells whether every video was generated.
+
+A job spec holds any of the JOB_FIELDS; command line options override it:
+
+    {
+        "prompt_file": "prompts/forest_video_prompts.txt",
+        "guidance_scales": "6.0 - 8.0 : 1.0",
+        "inference_steps": [50],
+        "seeds": "1990, 42",
+        "generate_type": "t2v",
+        "image_or_video_path": null,
+        "output_dir": "renders/forest",
+        "failure_policy": "continue"
+    }
+
+Value lists are numbers or strings in the range syntax of parse_range_list. Relative paths are
+resolved against the job file's directory.
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+
+GENERATE_TYPES = ("t2v", "i2v", "v2v")
+
+# What happens when a video fails: log it and go on with the next one, or stop the run
+FAILURE_CONTINUE = "continue"
+FAILURE_ABORT = "abort"
+FAILURE_POLICIES = (FAILURE_CONTINUE, FAILURE_ABORT)
+
+JOB_FIELDS = (
+    "prompt_file",
+    "guidance_scales",
+    "inference_steps",
+    "seeds",
+    "generate_type",
+    "image_or_video_path",
+    "output_dir",
+    "failure_policy",
+)
+PATH_FIELDS = ("prompt_file", "image_or_video_path", "output_dir")
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(message)s"
+
+
+class JobSpecError(ValueError):
+    """
+    Raised for an unreadable or invalid job spec or command line value.
+    """
+
+
+class GenerationAborted(BaseException):
+    """
+    Raised when a video fails under the "abort" failure policy. Derives from BaseException so the
+    per-video `except Exception` handlers in the scripts do not swallow it.
+    """
+
+
+def parse_range_list(s: str, type_func):
+    """
+    Parses a string containing numbers and ranges into a list of numbers.
+
+    Parameters:
+    - s (str): The input string.
+    - type_func: The type to which the numbers are converted (int or float).
+
+    Returns:
+    - list: A list of numbers.
+    """
+    result = []
+    items = [item.strip() for item in s.split(',') if item.strip()]
+    for item in items:
+        if '-' in item:
+            # Range detected
+            if ':' in item:
+                # Range with step, format is start - end : step
+                range_part, step_part = item.split(':')
+                start_str, end_str = range_part.split('-')
+                start = type_func(start_str.strip())
+                end = type_func(end_str.strip())
+                step = type_func(step_part.strip())
+            else:
+                # Range without step, default step is 1 for ints, 0.1 for floats
+                start_str, end_str = item.split('-')
+                start = type_func(start_str.strip())
+                end = type_func(end_str.strip())
+                step = type_func(1) if type_func is int else type_func(0.1)
+            # Generate the range
+            if step == 0:
+                raise ValueError(f"Step cannot be zero in '{item}'")
+            elif (end - start) * step < 0:
+                raise ValueError(f"Step does not move towards end in '{item}'")
+            current = start
+            values = []
+            if step > 0:
+                while current <= end + 1e-8:  # Small epsilon to account for float errors
+                    values.append(current)
+                    current += step
+            else:
+                while current >= end - 1e-8:
+                    values.append(current)
+                    current += step  # step is negative
+            if type_func is float:
+                values = [round(v, 8) for v in values]
+            result.extend(values)
+        else:
+            # Single value
+            value = type_func(item)
+            result.append(value)
+    return result
+
+
+def parse_values(value, type_func, field):
+    """
+    Converts a job or command line value (number, list of numbers/strings, or range string) into a
+    list of numbers.
+
+    Raises:
+        JobSpecError: If the value cannot be parsed or yields no numbers.
+    """
+    if value is None:
+        return None
+    items = value if isinstance(value, list) else [value]
+    result = []
+    try:
+        for item in items:
+            if isinstance(item, str):
+                result.extend(parse_range_list(item, type_func))
+            else:
+                result.append(type_func(item))
+    except (TypeError, ValueError) as e:
+        raise JobSpecError(f"Invalid {field}: {e}") from e
+    if not result:
+        raise JobSpecError(f"Invalid {field}: no values given.")
+    return result
+
+
+def load_job_spec(path):
+    """
+    Reads a JSON job spec.
+
+    Returns:
+        dict: The job fields, with relative paths resolved against the job file's directory.
+
+    Raises:
+        JobSpecError: If the file cannot be read or contains unknown fields.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+    except (OSError, ValueError) as e:
+        raise JobSpecError(f"Could not read job spec '{path}': {e}") from e
+    if not isinstance(spec, dict):
+        raise JobSpecError(f"Job spec '{path}' must be a JSON object.")
+    unknown = sorted(set(spec) - set(JOB_FIELDS))
+    if unknown:
+        raise JobSpecError(f"Unknown field(s) in job spec '{path}': {', '.join(unknown)}")
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for field in PATH_FIELDS:
+        if spec.get(field):
+            spec[field] = os.path.join(base_dir, os.path.expanduser(spec[field]))
+    return spec
+
+
+def build_arg_parser(description):
+    """
+    Returns the argument parser shared by the Cog generator scripts.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--job", help="JSON job spec; command line options override its fields.")
+    parser.add_argument("--prompt-file", help="Prompt list file (*_video_prompts.txt).")
+    parser.add_argument("--guidance-scales", help="Guidance scales, e.g. '6.0, 7.5' or '5.0 - 10.0 : 0.5'.")
+    parser.add_argument("--inference-steps", help="Inference steps, e.g. '50' or '10 - 30 : 10'.")
+    parser.add_argument("--seeds", help="Seeds, e.g. '1990' or '1990, 42' or '100 - 104'.")
+    parser.add_argument("--generate-type", choices=GENERATE_TYPES, help="Generation type.")
+    parser.add_argument("--input", dest="image_or_video_path", help="Image (i2v) or video (v2v) to condition on.")
+    parser.add_argument("--output-dir", help="Where videos are written (default: the prompt file's directory).")
+    parser.add_argument("--failure-policy", choices=FAILURE_POLICIES,
+                        help="On a failed video: 'continue' with the next one (default) or 'abort' the run.")
+    parser.add_argument("--headless", action="store_true", help="Never open dialogs, even if inputs are missing.")
+    parser.add_argument("--log-file", help="Also write the log to this file.")
+    return parser
+
+
+def resolve_job(args):
+    """
+    Merges the job spec named by args.job with the command line options.
+
+    Returns:
+        dict: Every JOB_FIELDS entry (None where not given), value lists parsed, plus
+        "interactive" (False when any job input came from the command line or --headless was given).
+
+    Raises:
+        JobSpecError: For an invalid job spec or value.
+    """
+    job = dict.fromkeys(JOB_FIELDS)
+    if args.job:
+        job.update(load_job_spec(args.job))
+    from_command_line = False
+    for field in JOB_FIELDS:
+        value = getattr(args, field, None)
+        if value is not None:
+            job[field] = value
+            from_command_line = True
+
+    job["guidance_scales"] = parse_values(job["guidance_scales"], float, "guidance_scales")
+    job["inference_steps"] = parse_values(job["inference_steps"], int, "inference_steps")
+    job["seeds"] = parse_values(job["seeds"], int, "seeds")
+    if job["generate_type"] is not None and job["generate_type"] not in GENERATE_TYPES:
+        raise JobSpecError(f"Invalid generate_type '{job['generate_type']}'. Choose from {', '.join(GENERATE_TYPES)}.")
+    job["failure_policy"] = job["failure_policy"] or FAILURE_CONTINUE
+    if job["failure_policy"] not in FAILURE_POLICIES:
+        raise JobSpecError(f"Invalid failure_policy '{job['failure_policy']}'. Choose from {', '.join(FAILURE_POLICIES)}.")
+
+    job["interactive"] = not (args.headless or args.job or from_command_line)
+    return job
+
+
+def configure_logging(log_file=None):
+    """
+    Sends log records to the console and, if given, to log_file.
+    """
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        directory = os.path.dirname(os.path.abspath(log_file))
+        os.makedirs(directory, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=handlers, force=True)
+
+
+class Notifier:
+    """
+    Reports problems and results: always to the log, and in interactive mode also in Tk message boxes.
+
+    Args:
+        logger (logging.Logger): Where messages are logged.
+        interactive (bool): Show message boxes.
+        failure_policy (str): FAILURE_CONTINUE or FAILURE_ABORT, applied by failure().
+    """
+
+    def __init__(self, logger, interactive=True, failure_policy=FAILURE_CONTINUE):
+        self.logger = logger
+        self.interactive = interactive
+        self.failure_policy = failure_policy
+        self.failures = 0
+
+    def _show(self, kind, title, message):
+        # Tk is not thread-safe: messages from worker threads (e.g. the export queue) are only logged
+        if not self.interactive or threading.current_thread() is not threading.main_thread():
+            return
+        from tkinter import messagebox
+        getattr(messagebox, kind)(title, message)
+
+    def info(self, title, message):
+        self.logger.info(message)
+        self._show("showinfo", title, message)
+
+    def warning(self, title, message):
+        self.logger.warning(message)
+        self._show("showwarning", title, message)
+
+    def error(self, title, message):
+        self.logger.error(message)
+        self._show("showerror", title, message)
+
+    def failure(self, title, message):
+        """
+        Reports a failed video and applies the failure policy.
+
+        Raises:
+            GenerationAborted: Under the "abort" policy.
+        """
+        self.failures += 1
+        self.error(title, message)
+        if self.failure_policy == FAILURE_ABORT:
+            raise GenerationAborted(message)
+
+    def exit_code(self):
+        """
+        Returns the process exit code for the run: 0 if every video was generated, else 1.
+        """
+        return 1 if self.failures else 0
@@ -0,0 +1,118 @@
+"""
+Resume manifest for video generation sweeps.
+
+Every finished video gets one line in <output dir>/generation_manifest.jsonl, keyed by a hash of
+everything that determines its content (prompt, negative prompt, model, guidance scale, steps,
+seed, frame count). Rerunning a sweep that crashed skips the keys already listed, as long as their
+video is still on disk.
+
+Videos are exported under a temporary name and renamed into place only when complete, and the
+manifest line is written after the rename, so a half-written mp4 never counts as done.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+
+MANIFEST_NAME = "generation_manifest.jsonl"
+PARTIAL_SUFFIX = ".partial"
+
+
+def video_key(prompt, negative_prompt, model, guidance_scale, num_inference_steps, seed, num_frames, **extra):
+    """
+    Returns the manifest key of one video: a SHA-256 over its generation settings.
+
+    Args:
+        extra: Further settings that change the output (e.g. generate_type, input path).
+    """
+    settings = {
+        "prompt": prompt,
+        "negative_prompt": negative_prompt,
+        "model": model,
+        "guidance_scale": float(guidance_scale),
+        "num_inference_steps": int(num_inference_steps),
+        "seed": seed,
+        "num_frames": int(num_frames),
+        **extra,
+    }
+    encoded = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def partial_path_for(output_path):
+    """
+    Returns the temporary path a video is written to before it is renamed to output_path.
+    The extension is kept so writers that pick the container from it still work.
+    """
+    base, ext = os.path.splitext(output_path)
+    return f"{base}{PARTIAL_SUFFIX}{ext}"
+
+
+def commit_output(partial_path, output_path):
+    """
+    Atomically moves a finished file from its temporary path to its final path.
+    """
+    os.replace(partial_path, output_path)
+
+
+class GenerationManifest:
+    """
+    Append-only record of the videos finished in one output directory.
+
+    Args:
+        directory (str): The output directory holding the videos and the manifest.
+        name (str): File name of the manifest.
+    """
+
+    def __init__(self, directory, name=MANIFEST_NAME):
+        self.directory = directory or "."
+        self.path = os.path.join(self.directory, name)
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._unterminated = False  # The file ends without a newline (a torn line from a crash)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return
+        self._unterminated = bool(text) and not text.endswith("\n")
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+                self.entries[record["key"]] = record
+            except (ValueError, KeyError, TypeError):
+                continue  # Torn line from a crash; the records after it are still valid
+
+    def is_done(self, key):
+        """
+        Returns True if the video with this key was finished and its file still exists.
+        """
+        record = self.entries.get(key)
+        return record is not None and os.path.isfile(os.path.join(self.directory, record["output"]))
+
+    def mark_done(self, key, output_path, **details):
+        """
+        Records a finished video. Call only after its file has been renamed into place.
+        """
+        record = {
+            "key": key,
+            "output": os.path.relpath(output_path, self.directory),
+            "completed_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            **details,
+        }
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                if self._unterminated:
+                    # Start on a fresh line so the new record is not glued onto the torn one
+                    f.write("\n")
+                    self._unterminated = False
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = record
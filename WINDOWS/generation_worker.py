@@ -0,0 +1,225 @@
+"""
+Background worker for long prompt-generation runs in the Temporal Prompt Engine.
+
+The generation loop runs on a worker thread and never touches Tk widgets directly. It reports
+progress, streamed results and dialogs as events on a queue; the GUI polls that queue with
+root.after() and applies them on the Tk thread. The worker checks in between units of work,
+which is where pause and cancel requests take effect.
+"""
+
+import collections
+import queue
+import threading
+import time
+
+POLL_INTERVAL_MS = 100  # How often the Tk loop drains the event queue
+ETA_WINDOW = 5  # Number of recent units used for the moving-average ETA
+
+
+class GenerationCancelled(BaseException):
+    """
+    Raised inside the worker when the user cancels the run. Derives from BaseException so the
+    generation loop's `except Exception` retry handlers let it through.
+    """
+
+
+class FrozenVar:
+    """
+    Plain stand-in for a tk.Variable, captured on the Tk thread so the worker can read settings safely.
+    """
+
+    def __init__(self, value):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+def snapshot_variables(owner, prefixes):
+    """
+    Captures the current values of an object's tk.Variable attributes (and dicts of them) as FrozenVars.
+
+    Args:
+        owner (object): Object holding the variables, e.g. the application instance.
+        prefixes (tuple): Attribute-name prefixes to capture, e.g. ("video_", "wildlife_animal_").
+
+    Returns:
+        dict: Attribute name -> FrozenVar, or -> {key: FrozenVar} for dicts of variables.
+    """
+    snapshot = {}
+    for name, value in vars(owner).items():
+        if not name.startswith(prefixes):
+            continue
+        if hasattr(value, "get") and hasattr(value, "trace_add"):
+            snapshot[name] = FrozenVar(value.get())
+        elif isinstance(value, dict) and all(hasattr(v, "trace_add") for v in value.values()):
+            snapshot[name] = {key: FrozenVar(var.get()) for key, var in value.items()}
+    return snapshot
+
+
+class EtaEstimator:
+    """
+    Estimates time remaining from a moving average of the most recent unit durations.
+    """
+
+    def __init__(self, window=ETA_WINDOW):
+        self._durations = collections.deque(maxlen=window)
+        self._last_mark = None
+
+    def start(self):
+        self._durations.clear()
+        self._last_mark = time.monotonic()
+
+    def mark(self):
+        """
+        Records the completion of one unit of work.
+        """
+        now = time.monotonic()
+        if self._last_mark is not None:
+            self._durations.append(now - self._last_mark)
+        self._last_mark = now
+
+    def pause_offset(self, seconds):
+        """
+        Excludes time spent paused from the current unit.
+        """
+        if self._last_mark is not None:
+            self._last_mark += seconds
+
+    def eta(self, remaining):
+        """
+        Returns the estimated seconds left for the remaining units, or None before the first unit completes.
+        """
+        if not self._durations:
+            return None
+        return remaining * (sum(self._durations) / len(self._durations))
+
+
+def format_eta(seconds):
+    """
+    Formats an ETA in seconds as H:MM:SS or M:SS.
+    """
+    if seconds is None:
+        return "estimating..."
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class GenerationWorker:
+    """
+    Runs a generation function on a daemon thread and exposes its events through a queue.
+
+    The target is called as target(worker) and should call worker.checkpoint() between units of work
+    and worker.post(...) to report events. Its return value is delivered in a final "done" event;
+    a cancellation yields "cancelled" and an unexpected exception yields "failed".
+
+    Args:
+        target (callable): The generation function.
+        total (int): Number of units of work, used for progress and ETA.
+        name (str): Thread name.
+    """
+
+    def __init__(self, target, total, name="generation-worker"):
+        self.target = target
+        self.total = max(1, total)
+        self.completed = 0
+        self.events = queue.Queue()
+        self.eta = EtaEstimator()
+        self._cancel = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self.eta.start()
+        self._thread.start()
+
+    def _run(self):
+        try:
+            result = self.target(self)
+        except GenerationCancelled:
+            self.post("cancelled")
+        except Exception as e:
+            self.post("failed", error=e)
+        else:
+            self.post("done", result=result)
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def is_worker_thread(self):
+        """
+        Returns True when called from the worker's own thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def post(self, kind, **data):
+        """
+        Queues an event for the Tk loop.
+        """
+        self.events.put((kind, data))
+
+    def advance(self, label=""):
+        """
+        Marks one unit of work as complete and posts a progress event with the updated ETA.
+        """
+        self.completed = min(self.total, self.completed + 1)
+        self.eta.mark()
+        self.post(
+            "progress",
+            completed=self.completed,
+            total=self.total,
+            eta=self.eta.eta(self.total - self.completed),
+            label=label
+        )
+
+    def checkpoint(self):
+        """
+        Blocks while the run is paused and raises GenerationCancelled once it has been cancelled.
+        """
+        if not self._resume.is_set():
+            paused_at = time.monotonic()
+            while not self._resume.wait(0.1):
+                if self._cancel.is_set():
+                    break
+            self.eta.pause_offset(time.monotonic() - paused_at)
+        if self._cancel.is_set():
+            raise GenerationCancelled()
+
+    def sleep(self, seconds):
+        """
+        Waits between retries while still honouring cancel requests.
+        """
+        if self._cancel.wait(seconds):
+            raise GenerationCancelled()
+
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def cancel(self):
+        self._cancel.set()
+        self._resume.set()
+
+    def drain(self):
+        """
+        Yields all events queued so far without blocking.
+        """
+        while True:
+            try:
+                yield self.events.get_nowait()
+            except queue.Empty:
+                return
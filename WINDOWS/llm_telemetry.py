@@ -0,0 +1,180 @@
+"""
+Per-call metrics for the Ollama requests made while generating prompts.
+
+Every call to generate_prompts_via_ollama during a run produces one JSON line in the run's
+llm_telemetry_<timestamp>.jsonl: wall latency, Ollama's own token counters and durations, the stage
+(outline or scene), the prompt number and retry index, and how the call ended (validated, failed
+validation, or the class of error). Closing the run appends a totals record.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+
+# Counters copied from Ollama's /api/generate response (durations are in nanoseconds)
+OLLAMA_METRIC_FIELDS = (
+    "total_duration",
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+)
+
+# Failure classes recorded in the "failure" field
+FAILURE_HTTP = "http_error"
+FAILURE_CONNECTION = "connection_error"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_JSON = "json_decode"
+FAILURE_EMPTY = "empty_response"
+FAILURE_VALIDATION = "validation_failed"
+FAILURE_EXCEPTION = "exception"
+
+
+def telemetry_path_for(directory):
+    """
+    Returns a new per-run telemetry file path inside directory.
+    """
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(directory, f"llm_telemetry_{timestamp}.jsonl")
+
+
+class LLMTelemetry:
+    """
+    Collects one record per LLM call and writes them to a JSONL file.
+
+    A call record stays open after the request returns so the caller can attach the validation
+    outcome; it is written when the outcome is set, when the next call starts, or on close().
+
+    Args:
+        path (str): The JSONL file to write.
+        model (str): Model name recorded with every call.
+    """
+
+    def __init__(self, path, model=None):
+        self.path = path
+        self.model = model
+        self.context = {}
+        self._pending = None
+        self._calls = 0
+        self._totals = {
+            "latency_seconds": 0.0,
+            "prompt_eval_count": 0,
+            "eval_count": 0,
+            "eval_duration": 0,
+            "validated": 0,
+            "failures": {},
+        }
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def set_context(self, **context):
+        """
+        Sets the fields attached to the following calls, e.g. stage="scene", prompt_index=3, retry=1.
+        """
+        with self._lock:
+            self.context = dict(context)
+
+    def start_call(self, prompt_type, prompt_chars):
+        """
+        Starts timing one LLM call.
+
+        Returns:
+            dict: The open call record, to be passed to finish_call().
+        """
+        with self._lock:
+            self._write_pending()
+            self._calls += 1
+            record = {
+                "type": "call",
+                "call": self._calls,
+                "model": self.model,
+                "prompt_type": prompt_type,
+                "prompt_chars": prompt_chars,
+                **self.context,
+                "started_at": datetime.datetime.now().isoformat(timespec='milliseconds'),
+                "_t0": time.perf_counter(),
+            }
+            return record
+
+    def finish_call(self, record, metrics=None, failure=None, error=None, setup_seconds=None):
+        """
+        Completes the timing of a call with Ollama's metrics or the failure class.
+        """
+        with self._lock:
+            record["latency_seconds"] = round(time.perf_counter() - record.pop("_t0"), 4)
+            if setup_seconds is not None:
+                record["setup_seconds"] = round(setup_seconds, 4)
+            for field in OLLAMA_METRIC_FIELDS:
+                record[field] = (metrics or {}).get(field)
+            if record["eval_count"] and record["eval_duration"]:
+                record["tokens_per_second"] = round(record["eval_count"] / (record["eval_duration"] / 1e9), 2)
+            record["failure"] = failure
+            if error is not None:
+                record["error"] = str(error)[:500]
+            record["validation"] = "not_applicable" if failure else "pending"
+            self._pending = record
+            if failure:
+                self._write_pending()
+
+    def set_outcome(self, valid, failure=None):
+        """
+        Attaches the validation outcome to the most recent call and writes its record.
+        """
+        with self._lock:
+            if self._pending is None:
+                return
+            self._pending["validation"] = "passed" if valid else "failed"
+            if not valid:
+                self._pending["failure"] = failure or FAILURE_VALIDATION
+            self._write_pending()
+
+    def _write_pending(self):
+        record = self._pending
+        if record is None:
+            return
+        self._pending = None
+        if record.get("validation") == "pending":
+            record["validation"] = "not_checked"
+        totals = self._totals
+        totals["latency_seconds"] += record.get("latency_seconds") or 0
+        totals["prompt_eval_count"] += record.get("prompt_eval_count") or 0
+        totals["eval_count"] += record.get("eval_count") or 0
+        totals["eval_duration"] += record.get("eval_duration") or 0
+        if record.get("validation") == "passed":
+            totals["validated"] += 1
+        if record.get("failure"):
+            totals["failures"][record["failure"]] = totals["failures"].get(record["failure"], 0) + 1
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self, status="complete"):
+        """
+        Writes any open call record and the per-run totals, then closes the file.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_pending()
+            totals = dict(self._totals)
+            totals["latency_seconds"] = round(totals["latency_seconds"], 4)
+            summary = {
+                "type": "run_totals",
+                "status": status,
+                "model": self.model,
+                "calls": self._calls,
+                "wall_seconds": round(time.monotonic() - self._started, 4),
+                **totals,
+            }
+            if totals["eval_count"] and totals["eval_duration"]:
+                summary["tokens_per_second"] = round(totals["eval_count"] / (totals["eval_duration"] / 1e9), 2)
+            self._file.write(json.dumps(summary) + "\n")
+            self._file.close()
+            print(f"LLM telemetry: {self._calls} calls, {totals['eval_count']} tokens generated, "
+                  f"{totals['latency_seconds']:.1f}s in requests. Details in {self.path}")
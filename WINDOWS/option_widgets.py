@@ -0,0 +1,162 @@
+"""
+Tk widgets for the option windows of the Temporal Prompt Engine.
+
+FilterCombobox replaces the read-only comboboxes that used to be loaded with every entry of
+tables such as WILDLIFE_ANIMALS or HOLIDAYS. It only hands Tk a short window of entries when the
+dropdown is opened (nothing at all at build time), and typing into it narrows the list to the
+matching entries. Leaving the field snaps the text back to a real option. Lists that come
+straight from the options catalog are searched through the shared option index.
+"""
+
+from tkinter import ttk
+
+from option_index import get_option_index
+
+MAX_VISIBLE_OPTIONS = 40  # Entries handed to the dropdown list at a time
+NAVIGATION_KEYS = ("Up", "Down", "Left", "Right", "Return", "KP_Enter", "Escape", "Tab", "ISO_Left_Tab")
+
+
+class FilterCombobox(ttk.Combobox):
+    """
+    Combobox with type-to-filter and lazily populated, windowed dropdown values.
+
+    Args:
+        master (tk.Widget): The parent widget.
+        values (list): The full list of options.
+        max_visible (int): Maximum number of entries shown in the dropdown at once.
+        **kwargs: Passed on to ttk.Combobox (textvariable, font, state, ...).
+    """
+
+    def __init__(self, master=None, values=(), max_visible=MAX_VISIBLE_OPTIONS, **kwargs):
+        kwargs.setdefault("state", "normal")
+        super().__init__(master, postcommand=self._populate, **kwargs)
+        self.max_visible = max_visible
+        self._all_values = list(values)
+        self._source_values = values
+        self._folded_values = None
+        self._last_valid = None
+        self.bind("<KeyRelease>", self._on_key_release, add="+")
+        self.bind("<Return>", self.commit, add="+")
+        self.bind("<FocusOut>", self.commit, add="+")
+        self.bind("<<ComboboxSelected>>", self.commit, add="+")
+
+    @property
+    def all_values(self):
+        return self._all_values
+
+    def set_values(self, values):
+        """
+        Replaces the full option list. The dropdown is refilled the next time it opens.
+        """
+        self._all_values = list(values)
+        self._source_values = values
+        self._folded_values = None
+        self._last_valid = None
+        self.configure(values=())
+
+    def _folded(self):
+        # Lower-cased copy for case-insensitive matching, built on first search
+        if self._folded_values is None:
+            self._folded_values = [value.lower() for value in self._all_values]
+        return self._folded_values
+
+    def matches(self, text, limit=None):
+        """
+        Returns options matching text (case-insensitive), best first. Catalog lists use the
+        word-level option index; other lists fall back to a prefix-then-substring scan.
+        """
+        limit = self.max_visible if limit is None else limit
+        needle = text.strip().lower()
+        if not needle:
+            return self._all_values[:limit]
+        indexed = get_option_index().search_scope(needle, self._source_values, limit=limit)
+        if indexed:
+            return indexed
+        prefix_matches = []
+        other_matches = []
+        for value, folded in zip(self._all_values, self._folded()):
+            if folded.startswith(needle):
+                prefix_matches.append(value)
+                if len(prefix_matches) >= limit:
+                    break
+            elif needle in folded and len(other_matches) < limit:
+                other_matches.append(value)
+        return (prefix_matches + other_matches)[:limit]
+
+    def _window_around(self, value):
+        # A slice of the full list centred on the current value, so the dropdown opens "in place"
+        try:
+            index = self._all_values.index(value)
+        except ValueError:
+            index = 0
+        start = max(0, min(index - self.max_visible // 2, len(self._all_values) - self.max_visible))
+        return self._all_values[start:start + self.max_visible]
+
+    def _populate(self):
+        text = self.get()
+        if not text or text in self._all_values:
+            self.configure(values=self._window_around(text))
+        else:
+            self.configure(values=self.matches(text))
+
+    def _on_key_release(self, event):
+        if event.keysym in NAVIGATION_KEYS:
+            return
+        self.configure(values=self.matches(self.get()))
+
+    def commit(self, event=None):
+        """
+        Snaps the typed text to an option: an exact (case-insensitive) match, else the best match,
+        else the last valid value.
+        """
+        if str(self.cget("state")) == "disabled":
+            return
+        text = self.get().strip()
+        if text in self._all_values:
+            self._last_valid = text
+            return
+        best = self.matches(text, limit=1) if text else []
+        for value, folded in zip(self._all_values, self._folded()):
+            if folded == text.lower():
+                best = [value]
+                break
+        if best:
+            resolved = best[0]
+        elif self._last_valid is not None:
+            resolved = self._last_valid
+        else:
+            resolved = self._all_values[0] if self._all_values else ""
+        self.set(resolved)
+        self._last_valid = resolved
+
+
+def commit_filter_comboboxes(widget):
+    """
+    Commits every FilterCombobox below widget, so half-typed text is never saved as an option.
+    """
+    for child in widget.winfo_children():
+        if isinstance(child, FilterCombobox):
+            child.commit()
+        commit_filter_comboboxes(child)
+
+
+def show_cached_window(window):
+    """
+    Brings a previously built, hidden Toplevel back to the front.
+
+    Returns:
+        bool: False if the window no longer exists and has to be built again.
+    """
+    if window is None or not window.winfo_exists():
+        return False
+    window.deiconify()
+    window.lift()
+    window.focus_set()
+    return True
+
+
+def hide_on_close(window):
+    """
+    Makes the window's close button hide it instead of destroying it, so it can be shown again instantly.
+    """
+    window.protocol("WM_DELETE_WINDOW", window.withdraw)
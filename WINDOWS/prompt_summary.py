@@ -0,0 +1,205 @@
+"""
+Prompt summaries for the video generator scripts: short keyword names for output files, and an
+optional summarization model that is only loaded when a prompt actually needs it.
+
+The generator scripts used to load facebook/bart-large-cnn at import time, mostly to turn each
+prompt into the five words of its output file name. KeywordExtractor does that locally and
+deterministically with RAKE-style phrase scoring, weighted by TF-IDF across the prompts of a run
+once fit() has seen them, so words every prompt shares (style boilerplate) rank below the ones that
+tell the videos apart. LazySummarizer wraps the transformers summarization pipeline and builds it
+on first use, so runs that never summarize never pay for the model.
+"""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from stage_profiler import STAGE_PIPELINE_LOAD, profile_stage
+
+DEFAULT_KEYWORDS = 5
+DEFAULT_CACHE_ENTRIES = 1024
+
+# Common English words that never start, end or belong to a keyword phrase
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had has
+have having he her here hers herself him himself his how i if in into is it its itself just me more
+most my myself no nor not now of off on once only or other our ours ourselves out over own same she
+should so some such than that the their theirs them themselves then there these they this those
+through to too under until up very was we were what when where which while who whom why will with
+would you your yours yourself yourselves
+""".split())
+
+_PHRASE_BREAK = re.compile(r"[.,;:!?()\[\]{}\"“”|/\\\n\t]+")
+_WORD = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+
+def _words(text):
+    return _WORD.findall(text.lower())
+
+
+def _phrases(text):
+    """
+    Splits text into candidate phrases: runs of words between punctuation and stopwords. Each phrase
+    is returned with the position of its first word.
+    """
+    phrases = []
+    position = 0
+    for chunk in _PHRASE_BREAK.split(text.lower()):
+        current = []
+        for word in _WORD.findall(chunk):
+            if word in STOPWORDS or len(word) < 2:
+                if current:
+                    phrases.append((position - len(current), current))
+                current = []
+            else:
+                current.append(word.strip("'-"))
+            position += 1
+        if current:
+            phrases.append((position - len(current), current))
+    return [(start, words) for start, words in phrases if any(words)]
+
+
+class KeywordExtractor:
+    """
+    Picks the few words that best name a prompt.
+
+    Args:
+        max_words (int): Words in a summary.
+        cache_entries (int): Summaries kept; the least recently used are dropped first.
+    """
+
+    def __init__(self, max_words=DEFAULT_KEYWORDS, cache_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_words = max_words
+        self.cache_entries = cache_entries
+        self._idf = {}
+        self._default_idf = 1.0
+        self._cache = OrderedDict()
+
+    def fit(self, documents):
+        """
+        Learns inverse document frequencies from the prompts of a run.
+        """
+        documents = [doc for doc in documents if doc]
+        counts = Counter()
+        for doc in documents:
+            counts.update(set(_words(doc)))
+        total = len(documents)
+        self._idf = {word: math.log((1 + total) / (1 + df)) + 1.0 for word, df in counts.items()}
+        self._default_idf = math.log(1 + total) + 1.0
+        self._cache.clear()
+        return self
+
+    def keywords(self, text):
+        """
+        Returns up to max_words keywords of text, in the order they appear in it.
+        """
+        phrases = _phrases(text)
+        if not phrases:
+            return _words(text)[:self.max_words]
+
+        # RAKE word scores: degree (co-occurring words in phrases) over frequency, weighted by IDF
+        frequency = Counter()
+        degree = Counter()
+        for _, words in phrases:
+            for word in words:
+                frequency[word] += 1
+                degree[word] += len(words)
+        score = {word: degree[word] / frequency[word] * self._idf.get(word, self._default_idf) for word in frequency}
+
+        # Plain RAKE favours long phrases; dividing by sqrt(length) keeps one run-on phrase from taking every slot
+        ranked = sorted(phrases, key=lambda item: (-sum(score[w] for w in item[1]) / len(item[1]) ** 0.5, item[0]))
+        chosen = []
+        used = set()
+        for start, words in ranked:
+            words = [w for w in words if w not in used]
+            if not words:
+                continue
+            words = words[:self.max_words - sum(len(w) for _, w in chosen)]
+            chosen.append((start, words))
+            used.update(words)
+            if sum(len(w) for _, w in chosen) >= self.max_words:
+                break
+        return [word for _, words in sorted(chosen) for word in words]
+
+    def summary(self, text):
+        """
+        Returns the keywords of text joined by spaces, cached per text.
+        """
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+        result = " ".join(self.keywords(text))
+        self._cache[text] = result
+        while len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+        return result
+
+
+class LazySummarizer:
+    """
+    transformers summarization pipeline that is built the first time it is used.
+
+    Args:
+        model (str): Model path or hub id, e.g. "facebook/bart-large-cnn".
+        device (int): Pipeline device (0 for the first GPU, -1 for the CPU).
+    """
+
+    def __init__(self, model, device=-1):
+        self.model = model
+        self.device = device
+        self._pipeline = None
+        self._failed = False
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def get(self):
+        """
+        Returns the pipeline, loading it on first call, or None if it cannot be loaded.
+        """
+        if self._pipeline is None and not self._failed:
+            with self._lock:
+                if self._pipeline is None and not self._failed:
+                    try:
+                        from transformers import pipeline
+                        with profile_stage(STAGE_PIPELINE_LOAD):
+                            self._pipeline = pipeline("summarization", model=self.model, device=self.device)
+                    except Exception as e:
+                        print(f"Error loading summarization model '{self.model}': {e}")
+                        self._failed = True
+        return self._pipeline
+
+    @property
+    def tokenizer(self):
+        """
+        The pipeline's tokenizer, or None if the pipeline cannot be loaded.
+        """
+        summarizer = self.get()
+        return summarizer.tokenizer if summarizer is not None else None
+
+    def summarize(self, text, max_length, min_length):
+        """
+        Returns the model's summary of text, or None if the model is unavailable or fails.
+        Results are cached per text and length limits.
+        """
+        key = (text, max_length, min_length)
+        if key in self._cache:
+            return self._cache[key]
+        summarizer = self.get()
+        if summarizer is None:
+            return None
+        try:
+            summary = summarizer(
+                text,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                truncation=True,
+            )[0]['summary_text']
+        except Exception as e:
+            print(f"Error during summarization: {e}")
+            return None
+        self._cache[key] = summary
+        return summary
@@ -0,0 +1,145 @@
+"""
+Streaming writer for the *_video_prompts.txt files produced by the Temporal Prompt Engine.
+
+Each accepted prompt set is appended to the prompt file as soon as it is validated and forced to
+disk (flush + fsync), so a crash or cancel keeps everything generated so far. The finished file is
+byte-for-byte what the engine used to write in one go: the prompt sets joined by PROMPT_SEPARATOR,
+with "\n" written as os.linesep the way the old text-mode write did (CRLF on Windows).
+
+Next to the prompt file a small sidecar index (<prompt file>.index.jsonl) records one line per
+prompt set with its byte offset and length, plus a final line once the run completes. Video
+generators can poll the index and start on the first prompts while the rest are still being written.
+"""
+
+import json
+import os
+import threading
+
+PROMPT_SEPARATOR = "\n--------------------\n"
+INDEX_SUFFIX = ".index.jsonl"
+
+
+def _encode(text):
+    # The file is written in binary for exact offsets, so translate newlines as text mode would
+    return text.replace("\n", os.linesep).encode('utf-8')
+
+
+def index_path_for(prompt_path):
+    """
+    Returns the sidecar index path for a prompt file.
+    """
+    return prompt_path + INDEX_SUFFIX
+
+
+class PromptWriter:
+    """
+    Appends prompt sets to a prompt file with a crash-safe sidecar index.
+
+    Args:
+        path (str): The *_video_prompts.txt file to write. An existing file is replaced.
+        separator (str): Text written between prompt sets.
+    """
+
+    def __init__(self, path, separator=PROMPT_SEPARATOR):
+        self.path = path
+        self.index_path = index_path_for(path)
+        self.separator = separator
+        self.count = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'wb')
+        self._index = open(self.index_path, 'w', encoding='utf-8')
+        self._fsync(self._file)
+        self._fsync(self._index)
+
+    @staticmethod
+    def _fsync(f):
+        f.flush()
+        os.fsync(f.fileno())
+
+    def append(self, prompt):
+        """
+        Writes one prompt set and its index entry, and forces both to disk before returning.
+
+        Returns:
+            int: The 1-based number of the prompt set just written.
+        """
+        with self._lock:
+            if self.closed:
+                raise ValueError(f"Prompt writer for '{self.path}' is closed.")
+            if self.count:
+                self._file.write(_encode(self.separator))
+            data = _encode(prompt)
+            offset = self._file.tell()
+            self._file.write(data)
+            self._fsync(self._file)
+            self.count += 1
+            # The index line goes last: a listed prompt is always fully on disk
+            self._index.write(json.dumps({"prompt": self.count, "offset": offset, "length": len(data)}) + "\n")
+            self._fsync(self._index)
+            return self.count
+
+    def close(self, complete=True):
+        """
+        Closes the files. With complete=True a final index line marks the run as finished.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            if complete:
+                self._index.write(json.dumps({"complete": True, "count": self.count}) + "\n")
+                self._fsync(self._index)
+            self._file.close()
+            self._index.close()
+            self.closed = True
+
+    def read_all(self):
+        """
+        Returns the full text of the prompt file written so far.
+        """
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+def read_prompt_index(prompt_path):
+    """
+    Reads the sidecar index of a prompt file.
+
+    Returns:
+        tuple: (entries, complete) where entries is a list of {"prompt", "offset", "length"} dicts
+        and complete tells whether the writing run has finished. A torn last line is ignored.
+    """
+    entries = []
+    complete = False
+    try:
+        with open(index_path_for(prompt_path), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("complete"):
+                    complete = True
+                else:
+                    entries.append(record)
+    except FileNotFoundError:
+        pass
+    return entries, complete
+
+
+def read_indexed_prompts(prompt_path, start=0):
+    """
+    Returns the prompt sets listed in the sidecar index, beginning with entry `start` (0-based), with
+    "\n" line endings as a text-mode read would give. Only prompts whose index line exists are
+    returned, so this is safe while the file is still growing.
+    """
+    entries, _ = read_prompt_index(prompt_path)
+    prompts = []
+    with open(prompt_path, 'rb') as f:
+        for entry in entries[start:]:
+            f.seek(entry["offset"])
+            prompts.append(f.read(entry["length"]).decode('utf-8').replace(os.linesep, "\n"))
+    return prompts
@@ -0,0 +1,240 @@
+"""
+Process-wide settings cache for the Temporal Prompt Engine.
+
+settings.json is parsed once and kept in memory. Callers read and update individual top-level
+keys ("video_options", "audio_options", "huggingface_api_token", ...), so saving one section can
+never drop another. Saves are debounced: a burst of updates results in a single write, done
+atomically through a temporary file and os.replace. Pending saves are flushed at interpreter exit.
+An optional polling watcher reloads the cache when the file is edited outside the application.
+"""
+
+import atexit
+import copy
+import json
+import os
+import threading
+
+DEFAULT_SAVE_DELAY = 0.5  # Seconds to wait for further updates before writing
+DEFAULT_WATCH_INTERVAL = 2.0  # Seconds between checks for external edits
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+class SettingsManager:
+    """
+    In-memory view of one settings file with key-scoped updates and debounced, atomic saves.
+
+    Args:
+        path (str): Path to the settings JSON file.
+        save_delay (float): Debounce window for saves, in seconds (0 writes immediately).
+    """
+
+    def __init__(self, path, save_delay=DEFAULT_SAVE_DELAY):
+        self.path = os.path.abspath(path)
+        self.save_delay = save_delay
+        self.on_save_error = None  # Optional callable(exception) for surfacing failed writes
+        self.load_error = None
+        self._data = {}
+        self._dirty = False
+        self._timer = None
+        self._file_signature = None
+        self._watcher = None
+        self._watcher_stop = threading.Event()
+        self._lock = threading.RLock()
+        self.reload()
+
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def reload(self, keep_on_error=False):
+        """
+        Re-reads the settings file into the cache. A missing file yields empty settings;
+        an unreadable one also yields empty settings and records the error in load_error.
+
+        Args:
+            keep_on_error (bool): Keep the current cache if the file cannot be parsed (e.g. mid-write).
+
+        Returns:
+            bool: True if the cache now reflects the file on disk.
+        """
+        with self._lock:
+            error = None
+            data = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    error = e
+                    data = {}
+                if error is None and not isinstance(data, dict):
+                    error = ValueError(f"{self.path} does not contain a JSON object.")
+                    data = {}
+            if error is not None and keep_on_error:
+                return False
+            self.load_error = error
+            self._data = data
+            self._dirty = False
+            self._file_signature = self._signature()
+            return error is None
+
+    def exists(self):
+        """
+        Returns True if the settings file exists on disk (or is about to be written).
+        """
+        with self._lock:
+            return self._dirty or self._file_signature is not None
+
+    def get(self, key, default=None):
+        """
+        Returns a copy of the value stored under a top-level key.
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            return copy.deepcopy(self._data[key])
+
+    def snapshot(self):
+        """
+        Returns a deep copy of all cached settings.
+        """
+        with self._lock:
+            return copy.deepcopy(self._data)
+
+    def update(self, key, value, save=True):
+        """
+        Replaces the value of one top-level key, leaving all other keys untouched, and schedules a save.
+        """
+        with self._lock:
+            self._data[key] = copy.deepcopy(value)
+            self._dirty = True
+            if save:
+                self._schedule_save()
+
+    def setdefault(self, key, value, save=True):
+        """
+        Stores value under key only if the key is missing. Returns True if the key was added.
+        """
+        with self._lock:
+            if key in self._data:
+                return False
+            self.update(key, value, save=save)
+            return True
+
+    def _schedule_save(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.save_delay <= 0:
+            self._write()
+            return
+        self._timer = threading.Timer(self.save_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """
+        Writes pending changes to disk right away.
+
+        Returns:
+            bool: False if a write was attempted and failed, True otherwise.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            return self._write()
+
+    def _write(self):
+        directory = os.path.dirname(self.path)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            print(f"Failed to write settings to {self.path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            if self.on_save_error:
+                self.on_save_error(e)
+            return False
+        self._dirty = False
+        self._file_signature = self._signature()
+        return True
+
+    def start_watcher(self, interval=DEFAULT_WATCH_INTERVAL, on_change=None):
+        """
+        Starts a daemon thread that reloads the cache when the file changes on disk.
+
+        Args:
+            interval (float): Polling interval in seconds.
+            on_change (callable): Optional callable(settings_snapshot) run on the watcher thread after a reload.
+        """
+        if self._watcher is not None:
+            return
+        self._watcher_stop.clear()
+
+        def watch():
+            while not self._watcher_stop.wait(interval):
+                with self._lock:
+                    signature = self._signature()
+                    if signature == self._file_signature or self._dirty:
+                        # Unchanged, or we have unsaved edits that take precedence
+                        continue
+                    if not self.reload(keep_on_error=True):
+                        # Probably caught the editor mid-write; try again on the next tick
+                        continue
+                    print(f"{self.path} changed on disk, reloaded settings.")
+                    snapshot = copy.deepcopy(self._data)
+                if on_change:
+                    on_change(snapshot)
+
+        self._watcher = threading.Thread(target=watch, name="settings-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        """
+        Stops the file watcher if it is running.
+        """
+        if self._watcher is not None:
+            self._watcher_stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+
+def get_settings_manager(path, save_delay=DEFAULT_SAVE_DELAY):
+    """
+    Returns the process-wide SettingsManager for a settings file, creating it on first use.
+    """
+    key = os.path.abspath(path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = SettingsManager(key, save_delay=save_delay)
+            _managers[key] = manager
+        return manager
+
+
+@atexit.register
+def flush_all_settings():
+    """
+    Writes any debounced saves that are still pending.
+    """
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.flush()
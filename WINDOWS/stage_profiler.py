@@ -0,0 +1,387 @@
+"""
+Per-stage profiling for the Temporal Prompt Engine and the video generator scripts.
+
+Started with --profile, a run records every named stage it passes through (LLM call, parsing,
+tokenization, text encoder, pipeline load, denoise, export, ffmpeg, ...) with cProfile and
+tracemalloc: call counts and wall time, the hottest functions, the Python heap peak and the
+allocation sites that grew the most, plus the CUDA peak when torch is in use. write_report() puts a text summary and one
+.pstats file per stage next to the run's outputs (open them with `python -m pstats` or snakeviz).
+
+Without --profile every stage() is a no-op, so the instrumentation can stay in the code.
+"""
+
+import contextlib
+import cProfile
+import datetime
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+PROFILE_FLAG = "--profile"
+TRACEMALLOC_FRAMES = 10  # Frames kept per allocation traceback
+REPORT_TOP_FUNCTIONS = 20  # Functions listed per stage in the report
+REPORT_TOP_ALLOCATIONS = 10  # Allocation sites listed per stage in the report
+
+# Stage names shared by the engine and the generator scripts
+STAGE_LLM_CALL = "llm_call"
+STAGE_PARSING = "parsing"
+STAGE_TOKENIZATION = "tokenization"
+STAGE_TEXT_ENCODER = "text_encoder"
+STAGE_SUMMARIZATION = "summarization"
+STAGE_PIPELINE_LOAD = "pipeline_load"
+STAGE_DENOISE = "denoise"
+STAGE_EXPORT = "export"
+STAGE_FFMPEG = "ffmpeg"
+STAGE_AUDIO = "audio"
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def consume_profile_flag(argv=None):
+    """
+    Removes --profile from the argument list (sys.argv by default) so later argument handling never
+    sees it.
+
+    Returns:
+        bool: True if the flag was present.
+    """
+    argv = sys.argv if argv is None else argv
+    found = PROFILE_FLAG in argv
+    while PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+    return found
+
+
+def _cuda_peak_bytes():
+    # Only look at torch if the process has already imported it
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+    try:
+        if torch.cuda.is_available():
+            return torch.cuda.max_memory_allocated()
+    except Exception:
+        pass
+    return None
+
+
+def _reset_cuda_peak():
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    try:
+        if torch.cuda.is_available():
+            torch.cuda.reset_peak_memory_stats()
+    except Exception:
+        pass
+
+
+def _format_bytes(size):
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024.0
+
+
+class StageStats:
+    """
+    Everything recorded for one stage name, summed over all of its occurrences.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.max_seconds = 0.0
+        self.heap_peak = 0
+        self.heap_growth = None  # (bytes, top allocation diffs) of the occurrence that grew the heap most
+        self.cuda_peak = None
+        self.profile = None  # pstats.Stats accumulated over all profiled occurrences
+        self.unprofiled_calls = 0  # Occurrences timed while another thread held the profiler
+
+    def add_profile(self, profile):
+        if self.profile is None:
+            self.profile = pstats.Stats(profile)
+        else:
+            self.profile.add(profile)
+
+
+class _Frame:
+    """
+    One active stage on the profiler's stack.
+    """
+
+    __slots__ = ("name", "started", "profile", "snapshot", "heap_start", "heap_peak")
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.profile = None
+        self.snapshot = None
+        self.heap_start = 0
+        self.heap_peak = 0
+
+
+class StageProfiler:
+    """
+    Collects cProfile and tracemalloc data per named stage.
+
+    Stages may nest: function timings go to the innermost stage, while the wall time and heap peak
+    of an outer stage include its inner stages. Re-entering the stage that is already innermost on
+    the same thread (a profiled function calling another one of its stage) records nothing, so the
+    outer occurrence is counted once. cProfile can only trace one thread at a time, so a
+    stage entered on another thread while a stage is open is timed but not profiled.
+
+    Args:
+        enabled (bool): When False, stage() does nothing.
+        label (str): Name used in report file names, e.g. "TemporalCog-5b".
+    """
+
+    def __init__(self, enabled=False, label="run"):
+        self.enabled = enabled
+        self.label = label
+        self.output_directory = None  # Where write_report() goes when no directory is given
+        self.stages = {}
+        self.started_at = datetime.datetime.now()
+        self._stack = []
+        self._owner = None
+        self._lock = threading.RLock()
+        self._local = threading.local()  # Names of the stages open on each thread, innermost last
+        if enabled:
+            self._start_tracing()
+
+    def _start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        _reset_cuda_peak()
+
+    def enable(self, label=None):
+        """
+        Turns profiling on for the rest of the process.
+        """
+        with self._lock:
+            if label:
+                self.label = label
+            if not self.enabled:
+                self.enabled = True
+                self.started_at = datetime.datetime.now()
+                self._start_tracing()
+
+    def reset(self):
+        """
+        Drops everything recorded so far, e.g. after a report has been written for one run.
+        """
+        with self._lock:
+            self.stages = {}
+            self.started_at = datetime.datetime.now()
+            _reset_cuda_peak()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Records the enclosed block as one occurrence of the named stage.
+        """
+        if not self.enabled:
+            yield
+            return
+        open_stages = getattr(self._local, "names", None)
+        if open_stages is None:
+            open_stages = self._local.names = []
+        if open_stages and open_stages[-1] == name:
+            yield
+            return
+
+        open_stages.append(name)
+        try:
+            yield from self._record(name)
+        finally:
+            open_stages.pop()
+
+    def _record(self, name):
+        thread = threading.get_ident()
+        with self._lock:
+            profiled = self._owner in (None, thread)
+            if profiled:
+                frame = self._push(name, thread)
+        if not profiled:
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                with self._lock:
+                    stats = self._stats(name)
+                    elapsed = time.perf_counter() - started
+                    stats.calls += 1
+                    stats.unprofiled_calls += 1
+                    stats.wall_seconds += elapsed
+                    stats.max_seconds = max(stats.max_seconds, elapsed)
+            return
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pop(frame)
+
+    def _push(self, name, thread):
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            parent.profile.disable()
+            parent.heap_peak = max(parent.heap_peak, tracemalloc.get_traced_memory()[1])
+        frame = _Frame(name)
+        frame.snapshot = tracemalloc.take_snapshot()
+        frame.heap_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        frame.profile = cProfile.Profile()
+        self._stack.append(frame)
+        self._owner = thread
+        frame.started = time.perf_counter()
+        frame.profile.enable()
+        return frame
+
+    def _pop(self, frame):
+        frame.profile.disable()
+        elapsed = time.perf_counter() - frame.started
+        current, peak = tracemalloc.get_traced_memory()
+        frame.heap_peak = max(frame.heap_peak, peak)
+        self._stack.pop()
+
+        stats = self._stats(frame.name)
+        stats.calls += 1
+        stats.wall_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.heap_peak = max(stats.heap_peak, frame.heap_peak)
+        growth = current - frame.heap_start
+        if stats.heap_growth is None or growth > stats.heap_growth[0]:
+            diff = tracemalloc.take_snapshot().compare_to(frame.snapshot, "lineno")
+            stats.heap_growth = (growth, diff[:REPORT_TOP_ALLOCATIONS])
+        cuda_peak = _cuda_peak_bytes()
+        if cuda_peak is not None:
+            stats.cuda_peak = max(stats.cuda_peak or 0, cuda_peak)
+        stats.add_profile(frame.profile)
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.heap_peak = max(parent.heap_peak, frame.heap_peak)
+            parent.profile.enable()
+        else:
+            self._owner = None
+
+    def _stats(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        return stats
+
+    def summary(self):
+        """
+        Returns the report text.
+        """
+        with self._lock:
+            stages = sorted(self.stages.values(), key=lambda s: s.wall_seconds, reverse=True)
+            lines = [
+                f"Profile for {self.label}",
+                f"Started: {self.started_at.isoformat(timespec='seconds')}",
+                f"Written: {datetime.datetime.now().isoformat(timespec='seconds')}",
+                "",
+                f"{'stage':<16}{'calls':>7}{'total s':>11}{'mean s':>10}{'max s':>10}{'heap peak':>12}{'cuda peak':>12}",
+            ]
+            for stats in stages:
+                lines.append(
+                    f"{stats.name:<16}{stats.calls:>7}{stats.wall_seconds:>11.3f}"
+                    f"{stats.wall_seconds / stats.calls:>10.3f}{stats.max_seconds:>10.3f}"
+                    f"{_format_bytes(stats.heap_peak):>12}{_format_bytes(stats.cuda_peak):>12}"
+                )
+            if not stages:
+                lines.append("(no stages recorded)")
+
+            for stats in stages:
+                lines += ["", "=" * 80, f"Stage: {stats.name}", "=" * 80]
+                if stats.unprofiled_calls:
+                    lines.append(f"{stats.unprofiled_calls} call(s) ran on another thread and were timed only.")
+                if stats.heap_growth is not None:
+                    growth, diff = stats.heap_growth
+                    lines.append(f"Largest heap growth in one call: {_format_bytes(growth)}. Top allocation sites:")
+                    lines += [f"  {entry}" for entry in diff]
+                if stats.profile is not None:
+                    stream = io.StringIO()
+                    stats.profile.stream = stream
+                    stats.profile.sort_stats("cumulative").print_stats(REPORT_TOP_FUNCTIONS)
+                    lines.append(stream.getvalue().rstrip())
+            return "\n".join(lines) + "\n"
+
+    def write_report(self, directory=None):
+        """
+        Writes profile_<label>_<timestamp>.txt and one .pstats file per stage into directory
+        (default: output_directory, else the current directory).
+
+        Returns:
+            str: Path of the text report, or None when profiling is off.
+        """
+        if not self.enabled:
+            return None
+        directory = directory or self.output_directory or os.getcwd()
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        base = os.path.join(directory, f"profile_{self.label}_{timestamp}")
+        report_path = base + ".txt"
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(self.summary())
+        with self._lock:
+            for stats in self.stages.values():
+                if stats.profile is not None:
+                    stats.profile.dump_stats(f"{base}_{stats.name}.pstats")
+        print(f"Profile report saved to: {report_path}")
+        return report_path
+
+
+def get_profiler():
+    """
+    Returns the process-wide profiler (disabled until enable_profiling() is called).
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = StageProfiler()
+    return _profiler
+
+
+def enable_profiling(label=None):
+    """
+    Turns on the process-wide profiler and returns it.
+    """
+    profiler = get_profiler()
+    profiler.enable(label)
+    return profiler
+
+
+def profile_stage(name):
+    """
+    Returns a context manager recording a block as the named stage of the process-wide profiler.
+    """
+    return get_profiler().stage(name)
+
+
+def profiled(name):
+    """
+    Decorator recording every call of the function as the named stage.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,151 @@
+"""
+Import-time check for the Temporal Prompt Engine GUI.
+
+The engine used to import torch, diffusers, moviepy, scipy and pydub and build the AudioLDM2
+pipeline at module level, so the window took many seconds to appear. Those are now imported where
+they are used. This check imports TemporalPromptEngine in a fresh interpreter (nothing else
+loaded, no window opened) and fails when:
+
+    - any module of HEAVY_MODULES was imported, or
+    - the best import time exceeds the budget: the recorded baseline plus its threshold, or
+      DEFAULT_BUDGET_SECONDS when no baseline has been recorded.
+
+Like parser_benchmarks.py, import times are normalised by the calibration loop of that script, run
+alternately with the imports, so the committed startup_benchmarks_baseline.json works on other
+machines too.
+
+The repository has no test runner: run the check by hand (or from CI) from this directory after
+changing the imports of TemporalPromptEngine.py. It needs the engine's own requirements (python-dotenv,
+Pillow, requests, pyperclip, Tk) but none of the heavy ones. Exit status 1 means it failed. Record a new
+baseline only when the import has knowingly become slower.
+
+    python startup_benchmarks.py            # compare against startup_benchmarks_baseline.json
+    python startup_benchmarks.py --record   # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from parser_benchmarks import calibrate
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASE_DIR, "startup_benchmarks_baseline.json")
+ENGINE_MODULE = "TemporalPromptEngine"
+
+DEFAULT_BUDGET_SECONDS = 2.0  # Import budget without a recorded baseline
+DEFAULT_THRESHOLD = 0.5  # Allowed slowdown over the baseline (0.5 = 50%); imports are I/O bound and noisy
+DEFAULT_REPEAT = 5  # Fresh interpreters per run; the best import time is compared
+HEAVY_MODULES = ("torch", "diffusers", "transformers", "moviepy", "scipy", "pydub")
+
+# Runs in the child interpreter: times the import and lists the heavy modules it pulled in
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+loaded = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy_modules": loaded}}))
+"""
+
+
+def measure_import(module=ENGINE_MODULE):
+    """
+    Imports module in a new interpreter started in this directory.
+
+    Returns:
+        dict: {"seconds", "heavy_modules"}.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    env = dict(os.environ, PREWARM_AUDIO_PIPELINE="false")
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def record_baseline(seconds, calibration, path=BASELINE_FILE, previous=None):
+    """
+    Writes the import time and its normalised score as the new baseline, keeping the threshold of
+    the previous file.
+    """
+    baseline = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "threshold": (previous or {}).get("threshold", DEFAULT_THRESHOLD),
+        "import_seconds": round(seconds, 4),
+        "import_score": round(seconds / calibration, 4),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+        f.write("\n")
+    return baseline
+
+
+def budget_for(baseline, calibration, threshold=None):
+    """
+    Returns the allowed import time in seconds on this machine, whose calibration loop took
+    calibration seconds.
+    """
+    if not baseline:
+        return DEFAULT_BUDGET_SECONDS
+    allowed = threshold if threshold is not None else baseline.get("threshold", DEFAULT_THRESHOLD)
+    return baseline["import_score"] * calibration * (1.0 + allowed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the engine GUI imports quickly and without heavy modules.")
+    parser.add_argument("--record", action="store_true", help="Record the result as the new baseline.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Fresh interpreters to time.")
+    parser.add_argument("--threshold", type=float, help="Override the allowed slowdown, e.g. 0.5 for 50%%.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare against or record.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    # Calibration and imports alternate, so a slow patch on a shared machine slows both
+    runs, calibrations = [], []
+    for _ in range(max(1, args.repeat)):
+        calibrations.append(calibrate(repeat=1))
+        runs.append(measure_import())
+    best = min(run["seconds"] for run in runs)
+    calibration = min(calibrations)
+    heavy = sorted({name for run in runs for name in run["heavy_modules"]})
+    baseline = load_baseline(args.baseline)
+    if args.record:
+        record_baseline(best, calibration, args.baseline, previous=baseline)
+        print(f"Baseline recorded to {args.baseline}")
+    budget = budget_for(load_baseline(args.baseline), calibration, args.threshold)
+    too_slow = best > budget
+
+    if args.json:
+        print(json.dumps({"best_seconds": best, "score": best / calibration, "budget_seconds": budget,
+                          "heavy_modules": heavy, "runs": runs}, indent=4))
+    else:
+        print(f"{ENGINE_MODULE} import: {best * 1000:.0f} ms best of {len(runs)} (budget {budget * 1000:.0f} ms)"
+              f"  {'OVER BUDGET' if too_slow else 'ok'}")
+        print(f"Heavy modules imported: {', '.join(heavy) if heavy else 'none'}")
+
+    if heavy or too_slow:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Per-step denoising telemetry for the CogVideoX generator scripts.
+
+Until now the only timing signal of a sweep was the console output. StepRecorder hooks the
+pipeline's callback_on_step_end and writes one JSON line per denoising step to
+<output dir>/telemetry/<video name>.steps.jsonl: the step's wall time and iterations per second, the
+peak RSS of the process, and allocated and peak CUDA memory when a GPU is in use. A batched call
+writes the same steps to the file of every video in the batch, with its batch_size.
+
+StepTelemetry collects the steps of a whole sweep and write_summary() puts mean and p95 seconds per
+step and the memory peaks for every guidance scale / step count combination into
+telemetry/sweep_summary.json, which is what offload policies and step counts are compared on. The
+first step of a call also covers the pipeline's setup (latent preparation, image encoding), so it is
+reported on its own and left out of the per-step statistics.
+
+A call resumed from a denoising checkpoint numbers its steps from the checkpoint on and appends them
+to the step file of the interrupted call, dropping the steps that file recorded past the checkpoint.
+"""
+
+import datetime
+import json
+import math
+import os
+import sys
+import time
+
+from memory_policy import peak_rss_bytes
+
+TELEMETRY_DIR_NAME = "telemetry"
+STEP_FILE_SUFFIX = ".steps.jsonl"
+SUMMARY_NAME = "sweep_summary.json"
+
+
+def combine_step_callbacks(*callbacks):
+    """
+    Returns one callback_on_step_end that runs every given callback in turn (None entries are
+    skipped), passing each the tensors returned by the one before. Returns None if none is left.
+    """
+    callbacks = [callback for callback in callbacks if callback is not None]
+    if not callbacks:
+        return None
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    def combined(pipe, i, t, callback_kwargs):
+        for callback in callbacks:
+            callback_kwargs = dict(callback_kwargs, **(callback(pipe, i, t, callback_kwargs) or {}))
+        return callback_kwargs
+
+    return combined
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(fraction * len(ordered)))  # Nearest-rank percentile
+    return ordered[rank - 1]
+
+
+def _device_memory():
+    torch = sys.modules.get("torch")
+    if torch is None or not torch.cuda.is_available():
+        return None, None
+    torch.cuda.synchronize()  # Kernels run asynchronously; without this the step time would stop too early
+    return torch.cuda.memory_allocated(), torch.cuda.max_memory_allocated()
+
+
+class StepRecorder:
+    """
+    Records the denoising steps of one pipeline call. Call start() right before the call, pass
+    on_step_end as its callback_on_step_end and close() once the call is over.
+
+    Args:
+        telemetry (StepTelemetry): Collects the steps for the sweep summary.
+        paths (list): The step files to write, one per video of the call.
+        labels (dict): Written into every step record, e.g. guidance_scale and num_inference_steps.
+        start_step (int): Steps already done before the call, when it resumes from a checkpoint.
+    """
+
+    def __init__(self, telemetry, paths, labels, start_step=0):
+        self.telemetry = telemetry
+        self.paths = list(paths)
+        self.labels = labels
+        self.start_step = start_step
+        self.steps = []
+        self._files = []
+        self._started = None
+        self._last = None
+
+    def start(self):
+        os.makedirs(self.telemetry.directory, exist_ok=True)
+        if self.start_step:
+            for path in self.paths:
+                self._truncate_after(path, self.start_step)
+        mode = "a" if self.start_step else "w"
+        self._files = [open(path, mode, encoding="utf-8") for path in self.paths]
+        self._started = self._last = time.perf_counter()
+
+    @staticmethod
+    def _truncate_after(path, step):
+        """
+        Drops the records past step from an interrupted call's step file; they are recorded again.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        kept = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # A line torn by the crash
+            if record.get("step", 0) <= step:
+                kept.append(json.dumps(record) + "\n")
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(kept)
+
+    def on_step_end(self, pipe, i, t, callback_kwargs):
+        """
+        callback_on_step_end hook: writes one record per step.
+        """
+        device_allocated, device_peak = _device_memory()
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        record = {
+            **self.labels,
+            "step": self.start_step + i + 1,
+            "timestep": int(t),
+            "seconds": round(seconds, 6),
+            "it_per_s": round(1.0 / seconds, 4) if seconds > 0 else None,
+            "elapsed": round(now - self._started, 6),
+            "rss_peak_bytes": peak_rss_bytes(),
+            "device_allocated_bytes": device_allocated,
+            "device_peak_bytes": device_peak,
+        }
+        self.steps.append(record)
+        line = json.dumps(record) + "\n"
+        for f in self._files:
+            f.write(line)
+        return callback_kwargs
+
+    def close(self):
+        """
+        Closes the step files and hands the recorded steps to the sweep summary.
+        """
+        for f in self._files:
+            f.close()
+        self._files = []
+        if self.steps:
+            self.telemetry.add(self.labels, self.steps)
+
+
+class StepTelemetry:
+    """
+    Step telemetry of one output directory.
+
+    Args:
+        directory (str): The output directory; files go to its `name` subdirectory.
+        labels: Written into every record and the summary, e.g. the memory policy in use.
+    """
+
+    def __init__(self, directory, name=TELEMETRY_DIR_NAME, **labels):
+        self.directory = os.path.join(directory or ".", name)
+        self.labels = labels
+        self._groups = {}
+
+    def step_path(self, output_path):
+        """
+        Returns the step file of a video.
+        """
+        base = os.path.splitext(os.path.basename(output_path))[0]
+        return os.path.join(self.directory, base + STEP_FILE_SUFFIX)
+
+    def recorder(self, output_paths, guidance_scale, num_inference_steps, start_step=0):
+        """
+        Returns a StepRecorder for one pipeline call producing the videos at output_paths. Pass the
+        checkpoint session's start_step when the call resumes an interrupted one.
+        """
+        labels = dict(self.labels, guidance_scale=guidance_scale, num_inference_steps=num_inference_steps,
+                      batch_size=len(output_paths))
+        return StepRecorder(self, [self.step_path(path) for path in output_paths], labels, start_step)
+
+    def add(self, labels, steps):
+        group = self._groups.setdefault((labels["guidance_scale"], labels["num_inference_steps"]), [])
+        group.append((labels["batch_size"], steps))
+
+    def summary(self):
+        """
+        Returns one dict per guidance scale / step count combination with the number of calls and
+        videos, first-step time, mean and p95 seconds per step and the memory peaks.
+        """
+        rows = []
+        for (guidance_scale, num_inference_steps), calls in sorted(self._groups.items()):
+            seconds = [step["seconds"] for _, steps in calls for step in steps[1:]]
+            first = [steps[0]["seconds"] for _, steps in calls]
+            all_steps = [step for _, steps in calls for step in steps]
+            rss = [step["rss_peak_bytes"] for step in all_steps if step["rss_peak_bytes"] is not None]
+            device = [step["device_peak_bytes"] for step in all_steps if step["device_peak_bytes"] is not None]
+            mean = sum(seconds) / len(seconds) if seconds else None
+            rows.append({
+                **self.labels,
+                "guidance_scale": guidance_scale,
+                "num_inference_steps": num_inference_steps,
+                "calls": len(calls),
+                "videos": sum(batch_size for batch_size, _ in calls),
+                "steps": len(all_steps),
+                "first_step_seconds": round(sum(first) / len(first), 6),
+                "mean_seconds_per_step": round(mean, 6) if mean is not None else None,
+                "p95_seconds_per_step": _percentile(seconds, 0.95),
+                "it_per_s": round(1.0 / mean, 4) if mean else None,
+                "peak_rss_bytes": max(rss) if rss else None,
+                "peak_device_bytes": max(device) if device else None,
+            })
+        return rows
+
+    def write_summary(self):
+        """
+        Writes the sweep summary to telemetry/sweep_summary.json and returns its path, or None if no
+        steps were recorded.
+        """
+        rows = self.summary()
+        if not rows:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, SUMMARY_NAME)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"written_at": datetime.datetime.now().isoformat(timespec="seconds"), "sweep": rows}, f, indent=2)
+        return path
+
+    def format_summary(self):
+        """
+        Returns the sweep summary as a short text table for the console.
+        """
+        lines = ["Denoising steps (first step excluded from s/step):"]
+        for row in self.summary():
+            mean = row["mean_seconds_per_step"]
+            p95 = row["p95_seconds_per_step"]
+            peak = row["peak_device_bytes"] or row["peak_rss_bytes"]
+            lines.append(
+                f"  gs={row['guidance_scale']} steps={row['num_inference_steps']}: {row['videos']} video(s), "
+                f"{'n/a' if mean is None else f'{mean:.3f}'} s/step mean, {'n/a' if p95 is None else f'{p95:.3f}'} p95, "
+                f"peak {'n/a' if peak is None else f'{peak / 1024 ** 3:.2f} GB'}"
+                f" ({'device' if row['peak_device_bytes'] else 'RSS'})"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,240 @@
+"""
+Streaming video encoder for the generator scripts.
+
+diffusers' export_to_video converts every frame to a PIL image (or a second uint8 copy of the whole
+clip) and hands the list to imageio. write_video instead starts one ffmpeg process and streams the
+frames into its stdin as raw RGB24, one uint8 frame at a time, so a clip is never held twice in
+memory and no PIL conversion takes place. Request frames with output_type="np" from the pipeline
+and pass them through clip_to_uint8() right away: the pipeline returns float32, four times the size
+of the uint8 frames ffmpeg is fed, and a clip waiting on the export queue should not hold that.
+
+Codec, CRF, preset and pixel format are set with EncoderSettings. When ffmpeg is not on the PATH,
+write_video falls back to the export function the caller passes in.
+"""
+
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+
+from stage_profiler import STAGE_FFMPEG, profile_stage
+
+FFMPEG_BINARY = "ffmpeg"
+DEFAULT_CODEC = "libx264"
+DEFAULT_CRF = 18  # Visually lossless for x264/x265; lower is better quality and larger files
+DEFAULT_PRESET = "medium"
+DEFAULT_PIX_FMT = "yuv420p"  # Plays everywhere; needs even frame dimensions
+STDERR_TAIL_CHARS = 2000  # ffmpeg output quoted in VideoEncoderError
+
+
+class VideoEncoderError(RuntimeError):
+    """
+    Raised when ffmpeg exits with an error or stops accepting frames.
+    """
+
+
+class EncoderSettings:
+    """
+    Output options for ffmpeg.
+
+    Args:
+        codec (str): Video codec, e.g. "libx264", "libx265", "libvpx-vp9".
+        crf (int): Constant rate factor, or None to leave the codec's default.
+        preset (str): Encoder speed preset, or None for codecs without presets.
+        pix_fmt (str): Output pixel format.
+        extra_args (list): Further ffmpeg output arguments, e.g. ["-tune", "film"].
+    """
+
+    def __init__(self, codec=DEFAULT_CODEC, crf=DEFAULT_CRF, preset=DEFAULT_PRESET, pix_fmt=DEFAULT_PIX_FMT,
+                 extra_args=None):
+        self.codec = codec
+        self.crf = crf
+        self.preset = preset
+        self.pix_fmt = pix_fmt
+        self.extra_args = list(extra_args or [])
+
+    def output_args(self):
+        """
+        Returns the ffmpeg arguments that go between the input and the output path.
+        """
+        args = ["-an", "-c:v", self.codec]
+        if self.crf is not None:
+            args += ["-crf", str(self.crf)]
+        if self.preset:
+            args += ["-preset", self.preset]
+        args += ["-pix_fmt", self.pix_fmt, "-movflags", "+faststart"]
+        return args + self.extra_args
+
+
+def ffmpeg_available(binary=FFMPEG_BINARY):
+    """
+    Returns True if the ffmpeg binary is on the PATH.
+    """
+    return shutil.which(binary) is not None
+
+
+def frame_to_uint8(frame):
+    """
+    Returns an (H, W, 3) uint8 RGB array for a frame given as a NumPy array (uint8, or float in
+    [0, 1] as pipelines return with output_type="np") or a PIL image.
+    """
+    frame = np.asarray(frame)
+    if frame.dtype != np.uint8:
+        frame = np.clip(np.rint(frame * 255.0), 0, 255).astype(np.uint8)
+    if frame.ndim == 2:
+        frame = np.stack([frame] * 3, axis=-1)
+    elif frame.shape[-1] == 4:
+        frame = frame[..., :3]
+    return np.ascontiguousarray(frame)
+
+
+def clip_to_uint8(frames):
+    """
+    Converts a clip (or a batch of clips) of float frames in [0, 1], as pipelines return with
+    output_type="np", to uint8 in one pass. A float array is scaled in place, so only the uint8
+    result is allocated next to it. uint8 input is returned unchanged.
+
+    Args:
+        frames: An (..., H, W, C) NumPy array or a sequence of such frames.
+
+    Returns:
+        numpy.ndarray: The uint8 frames, same shape.
+    """
+    frames = np.asarray(frames)
+    if frames.dtype == np.uint8:
+        return frames
+    if not np.issubdtype(frames.dtype, np.floating) or not frames.flags.writeable:
+        frames = frames.astype(np.float32)
+    frames *= 255.0
+    np.rint(frames, out=frames)
+    np.clip(frames, 0, 255, out=frames)
+    return frames.astype(np.uint8)
+
+
+def _fallback_frames(frames):
+    """
+    Returns uint8 frames as PIL images for the fallback exporter: diffusers' export_to_video scales
+    NumPy frames by 255 unconditionally, which only suits float frames.
+    """
+    if isinstance(frames, np.ndarray) and frames.dtype == np.uint8:
+        from PIL import Image
+        return [Image.fromarray(frame) for frame in frames]
+    return frames
+
+
+class StreamingEncoder:
+    """
+    One ffmpeg process encoding frames written to it one at a time.
+
+    Args:
+        output_path (str): The video file to write; ffmpeg picks the container from its extension.
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        fps (int): Frame rate.
+        settings (EncoderSettings): Output options (defaults to EncoderSettings()).
+    """
+
+    def __init__(self, output_path, width, height, fps=8, settings=None, binary=FFMPEG_BINARY):
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.frames_written = 0
+        settings = settings or EncoderSettings()
+        cmd = [
+            binary, "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+        ] + settings.output_args() + [output_path]
+        # stderr goes to a file rather than a pipe, so a chatty ffmpeg can never block on it
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderr)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _error_output(self):
+        self._stderr.seek(0)
+        return self._stderr.read().decode("utf-8", "replace")[-STDERR_TAIL_CHARS:].strip()
+
+    def write(self, frame):
+        """
+        Sends one frame to ffmpeg.
+        """
+        frame = frame_to_uint8(frame)
+        if frame.shape[:2] != (self.height, self.width):
+            raise ValueError(f"Frame is {frame.shape[1]}x{frame.shape[0]}, encoder expects {self.width}x{self.height}.")
+        try:
+            self._process.stdin.write(memoryview(frame).cast("B"))
+        except (BrokenPipeError, OSError) as e:
+            self._process.wait()
+            raise VideoEncoderError(f"ffmpeg stopped accepting frames: {self._error_output() or e}") from e
+        self.frames_written += 1
+
+    def close(self):
+        """
+        Finishes the file and waits for ffmpeg.
+
+        Raises:
+            VideoEncoderError: If ffmpeg exits with an error.
+        """
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        returncode = self._process.wait()
+        message = self._error_output()
+        self._stderr.close()
+        if returncode != 0:
+            raise VideoEncoderError(f"ffmpeg exited with code {returncode}: {message}")
+
+    def abort(self):
+        """
+        Stops ffmpeg without finishing the file.
+        """
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        self._process.kill()
+        self._process.wait()
+        self._stderr.close()
+
+
+def write_video(frames, output_path, fps=8, settings=None, fallback=None):
+    """
+    Encodes frames to output_path by streaming them into ffmpeg.
+
+    Args:
+        frames: A sequence of frames (NumPy arrays or PIL images) or an (F, H, W, 3) array.
+        output_path (str): The video file to write.
+        fps (int): Frame rate.
+        settings (EncoderSettings): Output options (defaults to EncoderSettings()).
+        fallback (callable): Called as fallback(frames, output_path, fps=fps) when ffmpeg is not
+            installed, e.g. diffusers.utils.export_to_video. Without it a missing ffmpeg is an error.
+
+    Returns:
+        str: output_path.
+
+    Raises:
+        VideoEncoderError: If ffmpeg is missing (and there is no fallback) or fails.
+    """
+    if not ffmpeg_available():
+        if fallback is None:
+            raise VideoEncoderError(f"'{FFMPEG_BINARY}' was not found on the PATH.")
+        fallback(_fallback_frames(frames), output_path, fps=fps)
+        return output_path
+    if len(frames) == 0:
+        raise ValueError("No frames to encode.")
+
+    with profile_stage(STAGE_FFMPEG):
+        height, width = np.asarray(frames[0]).shape[:2]
+        with StreamingEncoder(output_path, width, height, fps=fps, settings=settings) as encoder:
+            for frame in frames:
+                encoder.write(frame)
+    return output_path